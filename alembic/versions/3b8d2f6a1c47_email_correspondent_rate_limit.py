@@ -0,0 +1,29 @@
+"""email_correspondent: rate limit columns
+
+Revision ID: 3b8d2f6a1c47
+Revises: ce95669f8720
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d2f6a1c47'
+down_revision: Union[str, Sequence[str], None] = 'ce95669f8720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('email_correspondent', sa.Column('email_rate_limit', sa.Float(), nullable=True))
+    op.add_column('email_correspondent', sa.Column('email_rate_burst', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('email_correspondent', 'email_rate_burst')
+    op.drop_column('email_correspondent', 'email_rate_limit')
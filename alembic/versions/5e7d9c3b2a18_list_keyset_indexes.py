@@ -0,0 +1,53 @@
+"""list keyset indexes: templates and correspondents by create time and id
+
+Revision ID: 5e7d9c3b2a18
+Revises: a1c4ab142953
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e7d9c3b2a18'
+down_revision: Union[str, Sequence[str], None] = 'a1c4ab142953'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes are created concurrently, so writes to the tables are not blocked.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_text_template_create_at_id',
+            'text_template',
+            ['text_template_create_at', 'text_template_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_email_correspondent_create_at_id',
+            'email_correspondent',
+            ['email_correspondent_create_at', 'email_correspondent_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_telegram_correspondent_create_at_id',
+            'telegram_correspondent',
+            ['telegram_correspondent_create_at', 'telegram_correspondent_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_telegram_correspondent_create_at_id', table_name='telegram_correspondent', postgresql_concurrently=True)
+        op.drop_index('ix_email_correspondent_create_at_id', table_name='email_correspondent', postgresql_concurrently=True)
+        op.drop_index('ix_text_template_create_at_id', table_name='text_template', postgresql_concurrently=True)
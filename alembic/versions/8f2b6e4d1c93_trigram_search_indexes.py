@@ -0,0 +1,63 @@
+"""trigram search indexes: template codes and correspondent names
+
+Revision ID: 8f2b6e4d1c93
+Revises: 5e7d9c3b2a18
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2b6e4d1c93'
+down_revision: Union[str, Sequence[str], None] = '5e7d9c3b2a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes are created concurrently, so writes to the tables are not blocked.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_text_template_code_trgm',
+            'text_template',
+            ['text_template_code'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'text_template_code': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_email_correspondent_name_trgm',
+            'email_correspondent',
+            ['email_correspondent_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'email_correspondent_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_telegram_correspondent_name_trgm',
+            'telegram_correspondent',
+            ['telegram_correspondent_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'telegram_correspondent_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    The extension is kept, it may be used outside of the service.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_telegram_correspondent_name_trgm', table_name='telegram_correspondent', postgresql_concurrently=True)
+        op.drop_index('ix_email_correspondent_name_trgm', table_name='email_correspondent', postgresql_concurrently=True)
+        op.drop_index('ix_text_template_code_trgm', table_name='text_template', postgresql_concurrently=True)
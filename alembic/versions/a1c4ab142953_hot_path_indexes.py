@@ -0,0 +1,74 @@
+"""hot path indexes: send-path lookups, message status scans, provider events
+
+Revision ID: a1c4ab142953
+Revises: 3b8d2f6a1c47
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4ab142953'
+down_revision: Union[str, Sequence[str], None] = '3b8d2f6a1c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes are created concurrently, so writes to the tables are not blocked.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_correspondent_name_active',
+            'email_correspondent',
+            ['email_correspondent_name'],
+            unique=False,
+            postgresql_where=sa.text('email_correspondent_is_active IS true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_telegram_correspondent_name_active',
+            'telegram_correspondent',
+            ['telegram_correspondent_name'],
+            unique=False,
+            postgresql_where=sa.text('telegram_correspondent_is_active IS true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_text_template_code_channel_active',
+            'text_template',
+            ['text_template_code', 'text_template_channel'],
+            unique=False,
+            postgresql_where=sa.text('text_template_is_active IS true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_message_status_created_at',
+            'message',
+            ['message_status', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_delivery_provider_message_id',
+            'delivery',
+            ['delivery_provider_message_id'],
+            unique=False,
+            postgresql_where=sa.text('delivery_provider_message_id IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_delivery_provider_message_id', table_name='delivery', postgresql_concurrently=True)
+        op.drop_index('ix_message_status_created_at', table_name='message', postgresql_concurrently=True)
+        op.drop_index('ix_text_template_code_channel_active', table_name='text_template', postgresql_concurrently=True)
+        op.drop_index('ix_telegram_correspondent_name_active', table_name='telegram_correspondent', postgresql_concurrently=True)
+        op.drop_index('ix_email_correspondent_name_active', table_name='email_correspondent', postgresql_concurrently=True)
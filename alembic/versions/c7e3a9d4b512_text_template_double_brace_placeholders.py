@@ -0,0 +1,126 @@
+"""text_template: rewrite {name} placeholders to {{name}}
+
+Revision ID: c7e3a9d4b512
+Revises: 8f2b6e4d1c93
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+import re
+from typing import Callable, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a9d4b512'
+down_revision: Union[str, Sequence[str], None] = '8f2b6e4d1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#: re.Pattern: Tokens of ``str.format`` content: ``{{name}}`` placeholder of
+#  the new syntax, ``{{`` / ``}}`` escape of a brace or ``{name}`` placeholder.
+_LEGACY_TOKEN = re.compile(
+    r'\{\{\s*(?P<double>[A-Za-z_][A-Za-z0-9_]*)\s*\}\}'
+    r'|\{\{|\}\}'
+    r'|\{\s*(?P<single>[A-Za-z_][A-Za-z0-9_]*)\s*\}'
+)
+#: re.Pattern: Tokens of the new syntax: ``{{name}}`` placeholder or a brace.
+_TOKEN = re.compile(r'\{\{\s*(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*\}\}|[{}]')
+
+text_template = sa.table(
+    'text_template',
+    sa.column('text_template_id', UUID(as_uuid=True)),
+    sa.column('text_template_content', sa.String()),
+    sa.column('text_template_variables', JSONB()),
+    sa.column('text_template_update_at', sa.DateTime()),
+)
+
+
+def _rewrite(content: str, variables: dict | None) -> str:
+    """Rewrite content of ``str.format`` syntax to ``{{name}}`` placeholders.
+
+    * ``{name}`` of a declared variable is rewritten to ``{{name}}``.
+      Templates without declared variables were rendered by ``str.format`` as
+      well, so every ``{name}`` of them is a placeholder.
+    * ``{{`` / ``}}`` escapes, e.g. of CSS and JSON, are rewritten to single
+      braces, which are literal text of the new syntax.
+    * ``{{name}}`` of the documented syntax is kept, unless the template
+      declares variables without ``name``: then it is the literal ``{name}``.
+
+    The new syntax has no escape of ``{{`` itself, so content with literal
+    ``{{`` / ``}}``, written as ``{{{{`` / ``}}}}``, is still rejected by the
+    compiler and has to be fixed by hand.
+    """
+
+    def replace(match: re.Match) -> str:
+        name = match.group('double')
+        if name is not None:
+            if variables and name not in variables:
+                return match.group(0)[1:-1]
+            return match.group(0)
+
+        name = match.group('single')
+        if name is None:
+            return match.group(0)[0]
+        if variables and name not in variables:
+            return match.group(0)
+        return '{{' + name + '}}'
+
+    return _LEGACY_TOKEN.sub(replace, content)
+
+
+def _restore(content: str) -> str:
+    """Rewrite content of ``{{name}}`` placeholders back to ``str.format`` syntax."""
+
+    def replace(match: re.Match) -> str:
+        name = match.group('name')
+        if name is None:
+            return match.group(0) * 2
+        return '{' + name + '}'
+
+    return _TOKEN.sub(replace, content)
+
+
+def _update_contents(rewrite: Callable[[str, dict | None], str]) -> None:
+    """Rewrite content of every template, bumping update time of changed rows.
+
+    Update time is bumped, so cached render plans of the old content are not
+    used.
+    """
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            text_template.c.text_template_id,
+            text_template.c.text_template_content,
+            text_template.c.text_template_variables,
+        ),
+    ).all()
+    for template_id, content, variables in rows:
+        rewritten = rewrite(content, variables)
+        if rewritten != content:
+            connection.execute(
+                text_template.update()
+                .where(text_template.c.text_template_id == template_id)
+                .values(
+                    text_template_content=rewritten,
+                    text_template_update_at=sa.func.now(),
+                ),
+            )
+
+
+def upgrade() -> None:
+    """Upgrade data.
+
+    Content of templates used the ``str.format`` syntax before render plans,
+    where single braces are placeholders and doubled braces are literal text.
+    """
+    _update_contents(_rewrite)
+
+
+def downgrade() -> None:
+    """Downgrade data.
+
+    Content is rewritten back to the ``str.format`` syntax.
+    """
+    _update_contents(lambda content, variables: _restore(content))
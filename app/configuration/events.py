@@ -1,36 +1,81 @@
 """Lifespan function."""
 
 import asyncio
+import inspect
 from contextlib import asynccontextmanager
 
+from dependency_injector import providers
 from dependency_injector.wiring import inject, Provide
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.internal.pkg.cache import LookupCache
+from app.internal.repository.v1.rabbitmq.connection import close_channel_pools
+from app.internal.services import Services
+from app.internal.services.v1 import DeliveryEventBuffer
 from app.internal.workers import Workers
-from app.internal.workers.email_sender import EmailSenderWorker
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.pkg.connectors import Connectors
+from app.pkg.settings import settings
 
 
 @inject
 @asynccontextmanager
 async def lifespan(
     app: FastAPI,  # pylint: disable=unused-argument
-    mail_sender_worker: EmailSenderWorker = Provide[Workers.mail_sender_worker],
+    dispatcher_worker: ChannelDispatcherWorker = Provide[Workers.dispatcher_worker],
+    delivery_event_buffer: DeliveryEventBuffer = Provide[Services.v1.delivery_event_buffer],
 ):
     app.state.shutting_down = False
-    mail_sender_worker_task = asyncio.create_task(mail_sender_worker.listen_sending_message())
+    cache_invalidation_task = asyncio.create_task(LookupCache.listen_invalidations())
+    consumer = None
+    if settings.WORKER.EMBEDDED:
+        consumer = asyncio.create_task(dispatcher_worker.listen_sending_message())
 
     yield
     app.state.shutting_down = True
-    mail_sender_worker_task.cancel()
+    if consumer is not None:
+        await dispatcher_worker.drain(
+            consumer=consumer,
+            timeout=settings.WORKER.DRAIN_TIMEOUT,
+        )
+    await delivery_event_buffer.close()
 
-    try:
-        await mail_sender_worker_task
-    except asyncio.CancelledError:
-        pass
+    cache_invalidation_task.cancel()
+    await asyncio.gather(cache_invalidation_task, return_exceptions=True)
 
+    await close_pools()
     await shutdown_event()
 
 
+@inject
+async def close_pools(
+    rabbitmq_connector: providers.Resource = Provide[
+        Connectors.rabbitmq.connector.provider
+    ],
+    redis_connector: providers.Resource = Provide[
+        Connectors.redis.connector.provider
+    ],
+    postgresql_engine: AsyncEngine = Provide[Connectors.postgresql.engine],
+) -> None:
+    """Close connection pools.
+
+    Order follows the send path: RabbitMQ, whose channels carry the last acks,
+    then Redis with idempotency marks, then PostgreSQL with delivery records.
+    Pooled RabbitMQ channels are closed before their connections. Resources
+    that were never initialized are skipped.
+    """
+
+    await close_channel_pools()
+    for connector in (rabbitmq_connector, redis_connector):
+        if connector.initialized:
+            result = connector.shutdown()
+            if inspect.isawaitable(result):
+                await result
+
+    await postgresql_engine.dispose()
+
+
 async def shutdown_event() -> None:
     pending = [
         task for task in asyncio.all_tasks() if task is not asyncio.current_task()
@@ -0,0 +1,5 @@
+"""Caches of business lookups."""
+
+# ruff: noqa
+
+from app.internal.pkg.cache.lookup_cache import LookupCache
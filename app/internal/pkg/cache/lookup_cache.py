@@ -0,0 +1,316 @@
+"""Two-level cache of lookups shared by API and worker replicas."""
+
+import asyncio
+import json
+from logging import Logger
+from typing import Any, Awaitable, Callable, ClassVar, Generic, Hashable, TypeVar
+from uuid import UUID
+
+from redis import RedisError
+
+from app.internal.repository.v1.redis import BaseRedisRepository
+from app.pkg.cache import CacheStats, TTLCache
+from app.pkg.logger import get_logger
+from app.pkg.models.base import BaseModel
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+__all__ = ["LookupCache"]
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V", bound=BaseModel)
+
+#: int: Version of the cached payload. Bump it when a cached model changes its
+#  shape, so replicas of the new release never read entries of the old one.
+_SCHEMA_VERSION = 3
+
+
+class LookupCache(Generic[_K, _V]):
+    """Two-level read-through cache.
+
+    * L1 - in-process :class:`.TTLCache`.
+    * L2 - Redis, shared by all API and worker replicas.
+
+    Redis keys are versioned: ``{prefix}:{namespace}:s{schema}:v{version}:{key}``.
+    Any change of a row increments ``version`` of the namespace and publishes
+    an invalidation message to ``settings.CACHE.INVALIDATION_CHANNEL``. Entries
+    of the old version are never read again and expire by TTL, while every
+    replica drops its L1 entries of the changed row.
+
+    Redis is a best-effort tier: its errors are logged and the lookup falls back
+    to the loader.
+
+    Secret fields of the value, e.g. SMTP passwords and bot tokens, are never
+    written to Redis, which is shared by all replicas and readable by anyone
+    with access to it. They are kept in-process by the Redis payload, which
+    holds identifier and update time of the row, for
+    ``settings.CACHE.SECRETS_TTL``. On a Redis hit of a payload not seen by the
+    process they are read by ``secrets_loader`` of :meth:`.get_or_load`. The
+    in-process L1 keeps whole values.
+    """
+
+    #: dict[str, LookupCache]: All caches of the process by namespace.
+    _registry: ClassVar[dict[str, "LookupCache"]] = {}
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        namespace: str,
+        model: type[_V],
+        identity: Callable[[_V], UUID],
+        secret_fields: tuple[str, ...] = (),
+    ):
+        """Initialize cache.
+
+        Args:
+            namespace: Unique name of the cache.
+            model: Model of the cached value.
+            identity: Function returning identifier of the row by cached value.
+            secret_fields: Fields of the value excluded from Redis.
+        """
+
+        self.namespace = namespace
+        self._model = model
+        self._identity = identity
+        self._secret_fields = frozenset(secret_fields)
+        self._local: TTLCache[_K, _V] = TTLCache(
+            name=namespace,
+            max_size=settings.CACHE.MAX_SIZE,
+            ttl=settings.CACHE.TTL,
+        )
+        #: TTLCache: Secret fields of values by their Redis payload, with
+        #  identifier of the row to drop them on invalidation.
+        self._secrets: TTLCache[str, tuple[str, dict[str, Any]]] = TTLCache(
+            name=f"{namespace}:secrets",
+            max_size=settings.CACHE.MAX_SIZE,
+            ttl=settings.CACHE.SECRETS_TTL,
+        )
+        self._redis = BaseRedisRepository()
+        self._version: int | None = None
+        #: int: Count of applied invalidations, see :meth:`.get_or_load`.
+        self._generation = 0
+        self._redis_hits = 0
+        self._redis_misses = 0
+        self._registry[namespace] = self
+
+    async def get_or_load(
+        self,
+        key: _K,
+        loader: Callable[[], Awaitable[_V]],
+        secrets_loader: Callable[[dict[str, Any]], Awaitable[BaseModel]] | None = None,
+    ) -> _V:
+        """Get value from L1, then from L2, then load it and fill both levels.
+
+        Args:
+            key: Key of the entry.
+            loader: Coroutine function loading value on cache miss.
+            secrets_loader: Coroutine function loading secret fields of the
+                value by its payload read from L2. Required when the cache has
+                ``secret_fields``, otherwise L2 is not read.
+
+        Value is not cached if an invalidation is applied while it is read or
+        loaded: it could be read before the change was committed, and would be
+        served until its TTL.
+
+        Returns:
+            Cached or loaded value.
+        """
+
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        redis_key = await self.__redis_key(key)
+        value = await self.__read_shared(redis_key, secrets_loader)
+        if value is None:
+            value = await loader()
+            if generation != self._generation:
+                return value
+            await self.__write_shared(redis_key, value)
+
+        if generation == self._generation:
+            self._local.set(key, value)
+            self.__keep_secrets(value)
+        return value
+
+    async def invalidate(self, identifier: UUID | None = None) -> None:
+        """Invalidate entries of the row on every replica.
+
+        Args:
+            identifier: Identifier of the changed row. If None, all entries of the
+                namespace are invalidated.
+        """
+
+        self.apply_invalidation(identifier=identifier)
+        try:
+            self._version = await self._redis.increment(self.__version_key())
+            await self._redis.publish(
+                settings.CACHE.INVALIDATION_CHANNEL,
+                json.dumps(
+                    {
+                        "namespace": self.namespace,
+                        "version": self._version,
+                        "id": str(identifier) if identifier else None,
+                    },
+                ),
+            )
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to publish invalidation of %s.", self.namespace)
+
+    def apply_invalidation(
+        self,
+        identifier: UUID | str | None = None,
+        version: int | None = None,
+    ) -> None:
+        """Drop L1 entries of the row and move to the new version.
+
+        Args:
+            identifier: Identifier of the changed row. If None, L1 is cleared.
+            version: New version of the namespace, if known.
+        """
+
+        self._generation += 1
+        if version is not None:
+            self._version = max(self._version or 0, version)
+
+        if identifier is None:
+            self._local.clear()
+            self._secrets.clear()
+            return
+
+        identifier = str(identifier)
+        self._local.invalidate_where(lambda value: str(self._identity(value)) == identifier)
+        self._secrets.invalidate_where(lambda entry: entry[0] == identifier)
+
+    def stats(self) -> list[CacheStats]:
+        """Get hit/miss counters of both levels."""
+
+        local = self._local.stats()
+        return [
+            local,
+            self._secrets.stats(),
+            CacheStats(
+                name=f"{self.namespace}:redis",
+                hits=self._redis_hits,
+                misses=self._redis_misses,
+                evictions=0,
+                size=0,
+            ),
+        ]
+
+    @classmethod
+    async def listen_invalidations(cls) -> None:
+        """Apply invalidation messages published by other replicas.
+
+        Runs forever. After a lost subscription all L1 entries are dropped, as
+        messages could have been missed meanwhile.
+        """
+
+        redis = BaseRedisRepository()
+        while True:
+            try:
+                async for raw in redis.subscribe(settings.CACHE.INVALIDATION_CHANNEL):
+                    message = json.loads(raw)
+                    cache = cls._registry.get(message.get("namespace"))
+                    if cache is not None:
+                        cache.apply_invalidation(
+                            identifier=message.get("id"),
+                            version=message.get("version"),
+                        )
+            except (RedisError, DriverError, OSError):
+                cls.__logger.exception("Cache invalidation subscription is lost.")
+
+            for cache in cls._registry.values():
+                cache.apply_invalidation()
+                cache._version = None  # pylint: disable=protected-access
+            await asyncio.sleep(1)
+
+    def __version_key(self) -> str:
+        """Key of the namespace version counter."""
+
+        return f"{settings.CACHE.REDIS_PREFIX}:{self.namespace}:version"
+
+    async def __redis_key(self, key: _K) -> str:
+        """Build versioned Redis key of the entry."""
+
+        if self._version is None:
+            try:
+                self._version = await self._redis.increment(self.__version_key(), 0)
+            except (RedisError, DriverError):
+                self.__logger.exception("Failed to read version of %s.", self.namespace)
+                return ""
+
+        parts = key if isinstance(key, tuple) else (key,)
+        return ":".join(
+            (
+                settings.CACHE.REDIS_PREFIX,
+                self.namespace,
+                f"s{_SCHEMA_VERSION}",
+                f"v{self._version}",
+                *(str(part) for part in parts),
+            ),
+        )
+
+    async def __read_shared(
+        self,
+        redis_key: str,
+        secrets_loader: Callable[[dict[str, Any]], Awaitable[BaseModel]] | None,
+    ) -> _V | None:
+        """Read value from L2, complete it with secrets of ``secrets_loader``."""
+
+        if not redis_key or (self._secret_fields and secrets_loader is None):
+            return None
+
+        try:
+            raw = await self._redis.read_value(redis_key)
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to read %s from redis.", redis_key)
+            return None
+
+        if raw is None:
+            self._redis_misses += 1
+            return None
+
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            self.__logger.exception("Failed to decode %s from redis.", redis_key)
+            return None
+
+        self._redis_hits += 1
+        if self._secret_fields:
+            kept = self._secrets.get(raw)
+            if kept is not None:
+                payload.update(kept[1])
+            else:
+                secrets = await secrets_loader(payload)
+                payload.update(secrets.model_dump(include=self._secret_fields))
+        return self._model.model_validate(payload)
+
+    def __keep_secrets(self, value: _V) -> None:
+        """Keep secret fields of the value by its Redis payload."""
+
+        if not self._secret_fields:
+            return
+
+        self._secrets.set(
+            value.model_dump_json(exclude=self._secret_fields),
+            (str(self._identity(value)), value.model_dump(include=self._secret_fields)),
+        )
+
+    async def __write_shared(self, redis_key: str, value: _V) -> None:
+        """Write value to L2."""
+
+        if not redis_key:
+            return
+
+        try:
+            await self._redis.create(
+                redis_key=redis_key,
+                redis_value=value.model_dump_json(exclude=self._secret_fields),
+                expire_time=settings.CACHE.REDIS_TTL,
+            )
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to write %s to redis.", redis_key)
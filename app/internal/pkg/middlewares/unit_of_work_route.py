@@ -0,0 +1,35 @@
+"""Route class running each request in a unit of work."""
+
+from typing import Callable
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.internal.repository.v1.postgresql.connection import unit_of_work
+from app.pkg.models.base.request_id_route import RequestIDRoute
+
+__all__ = ["UnitOfWorkRoute"]
+
+
+class UnitOfWorkRoute(RequestIDRoute):
+    """Run each request in one PostgreSQL unit of work.
+
+    Repository calls of the request share one session and connection. The
+    transaction is committed before the response is returned, so a failed
+    commit is reported to the client, and rolled back when the endpoint
+    raises.
+    """
+
+    def get_route_handler(self) -> Callable:
+        """Override the route handler to wrap it in a unit of work.
+
+        Returns:
+            Callable: The route handler running in a unit of work.
+        """
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            async with unit_of_work():
+                return await original_route_handler(request)
+
+        return custom_route_handler
@@ -1,14 +1,206 @@
 """Create connection to postgresql."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Union
+from contextvars import ContextVar
+from logging import Logger
+from typing import AsyncGenerator, Awaitable, Callable, Union
 
 from dependency_injector.wiring import Provide, inject
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    AsyncTransaction,
+    async_sessionmaker,
+)
 
 from app.pkg.connectors import Connectors
+from app.pkg.logger import get_logger
 
-__all__ = ["get_connection"]
+__all__ = ["after_commit", "get_connection", "unit_of_work", "UnitOfWork"]
+
+
+class UnitOfWork:
+    """Session shared by repository calls of one message or HTTP request.
+
+    Connection is checked out of the pool by the first repository call, so a
+    unit served from caches never touches the pool. All calls of the unit run
+    in one transaction. ``session.commit()`` of a repository only flushes,
+    the transaction is committed or rolled back by :func:`unit_of_work`.
+
+    The unit belongs to the task that opened it. Tasks started inside the
+    unit, e.g. background flushes of write-behind buffers, inherit the
+    context, but use their own sessions.
+
+    Callbacks registered with :meth:`after_commit` run once the transaction
+    is committed, e.g. invalidation of caches shared by replicas, which must
+    not be seen before the changed rows.
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        self.__engine = engine
+        self.__session_factory = session_factory
+        self.__task = asyncio.current_task()
+        self.__connection: AsyncConnection | None = None
+        self.__transaction: AsyncTransaction | None = None
+        self.__session: AsyncSession | None = None
+        self.__after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def owned(self) -> bool:
+        """Unit belongs to the current task."""
+
+        return self.__task is asyncio.current_task()
+
+    async def session(self) -> AsyncSession:
+        """Get session of the unit, begin the transaction on the first call."""
+
+        if self.__session is None:
+            self.__connection = await self.__engine.connect()
+            self.__transaction = await self.__connection.begin()
+            # Commit of the session does not commit the transaction of the
+            # connection, rollback of the session rolls it back.
+            self.__session = self.__session_factory(
+                bind=self.__connection,
+                join_transaction_mode="rollback_only",
+            )
+        return self.__session
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run the callback after the transaction is committed.
+
+        Callbacks are dropped when the transaction is rolled back.
+
+        Args:
+            callback: Coroutine function without arguments.
+        """
+
+        self.__after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Flush the session, commit the transaction and run callbacks."""
+
+        if self.__session is not None:
+            await self.__session.commit()
+            if self.__transaction.is_active:
+                await self.__transaction.commit()
+
+        callbacks, self.__after_commit = self.__after_commit, []
+        for callback in callbacks:
+            # Changes are committed, a failed callback must not fail the unit.
+            try:
+                await callback()
+            except Exception:
+                self.__logger.exception("Error run callback %r after commit.", callback)
+
+    async def rollback(self) -> None:
+        """Roll back the transaction and drop callbacks."""
+
+        self.__after_commit.clear()
+        if self.__transaction is not None and self.__transaction.is_active:
+            await self.__transaction.rollback()
+
+    async def close(self) -> None:
+        """Close the session and return the connection to the pool."""
+
+        if self.__session is not None:
+            await self.__session.close()
+        if self.__connection is not None:
+            await self.__connection.close()
+
+
+#: ContextVar[UnitOfWork | None]: Unit of work of the current message or
+#  request, see :func:`unit_of_work`.
+_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "postgresql_unit_of_work",
+    default=None,
+)
+
+
+def _current_unit() -> UnitOfWork | None:
+    """Get unit of work of the current task."""
+
+    unit = _unit_of_work.get()
+    return unit if unit is not None and unit.owned else None
+
+
+@inject
+def _new_unit(
+    session_factory: async_sessionmaker[AsyncSession] = Provide[
+        Connectors.postgresql.session_factory
+    ],
+    engine: AsyncEngine = Provide[Connectors.postgresql.engine],
+) -> UnitOfWork:
+    """Create unit of work bound to the current task.
+
+    Providers are injected here, not into :func:`unit_of_work`: injected
+    generator does not receive exceptions of the block.
+    """
+
+    return UnitOfWork(engine=engine, session_factory=session_factory)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """Share one session between repository calls inside the block.
+
+    The transaction is committed when the block exits and rolled back when it
+    raises. Nested block joins the unit of the outer one.
+
+    Examples:
+        >>> async def handle_request():
+        ...     async with unit_of_work():
+        ...         template = await text_template_repository.read_by_code(query)
+        ...         await message_repository.message_update_status(cmd)
+
+    Yields:
+        UnitOfWork
+    """
+
+    unit = _current_unit()
+    if unit is not None:
+        yield unit
+        return
+
+    unit = _new_unit()
+    token = _unit_of_work.set(unit)
+    try:
+        yield unit
+    except BaseException:
+        await unit.rollback()
+        raise
+    else:
+        await unit.commit()
+    finally:
+        _unit_of_work.reset(token)
+        await unit.close()
+
+
+async def after_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    """Run the callback after the unit of work of the current task is
+    committed, or at once outside a unit.
+
+    Examples:
+        >>> async def update_template(cmd):
+        ...     await text_template_repository.update(cmd)
+        ...     await after_commit(partial(cache.invalidate, cmd.text_template_id))
+
+    Args:
+        callback: Coroutine function without arguments.
+    """
+
+    unit = _current_unit()
+    if unit is None:
+        await callback()
+        return
+    unit.after_commit(callback)
 
 
 @asynccontextmanager
@@ -22,6 +214,8 @@ async def get_connection(
 ) -> AsyncGenerator[Union[AsyncSession, AsyncEngine], None]:
     """Get async SQLAlchemy session or engine.
 
+    Inside :func:`unit_of_work` the session of the unit is returned.
+
     Args:
         session_factory:
             async SQLAlchemy session factory.
@@ -44,5 +238,10 @@ async def get_connection(
         yield engine
         return
 
+    unit = _current_unit()
+    if unit is not None:
+        yield await unit.session()
+        return
+
     async with session_factory() as session:
         yield session
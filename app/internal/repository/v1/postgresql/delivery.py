@@ -1,16 +1,133 @@
 """Delivery repository implementation."""
 
-from sqlalchemy import select, update, func
+from uuid import uuid4
+
+from sqlalchemy import String, bindparam, case, column, func, type_coerce, update
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.copy_records import copy_records
 from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import Delivery
 
 __all__ = ["DeliveryRepository"]
 
+#: dict[str, int]: Order of delivery statuses by names of the enum, which are
+#  stored by the column. Status is never moved back, e.g. late ``delivered``
+#  event does not override ``opened``.
+_STATUS_RANK = {
+    models.DeliveryStatusEnum.QUEUED.name: 0,
+    models.DeliveryStatusEnum.SENT.name: 1,
+    models.DeliveryStatusEnum.FAILED.name: 2,
+    models.DeliveryStatusEnum.BOUNCED.name: 2,
+    models.DeliveryStatusEnum.DELIVERED.name: 2,
+    models.DeliveryStatusEnum.OPENED.name: 3,
+    models.DeliveryStatusEnum.CLICKED.name: 4,
+}
+
 
 class DeliveryRepository(Repository):
-    """Delivery repository implementation."""
\ No newline at end of file
+    """Delivery repository implementation."""
+
+    @collect_response
+    async def create(
+        self,
+        cmd: models.DeliveryCreateCommand
+    ) -> models.Delivery:
+        """Creates a record of the delivery attempt.
+
+        Args:
+            cmd (models.DeliveryCreateCommand): Command containing data of the attempt.
+
+        Returns:
+            models.Delivery: The created delivery attempt.
+        """
+
+        async with get_connection() as session:
+            delivery = Delivery(
+                **cmd.model_dump(exclude={"delivery_status"}),
+                # Column stores names of the enum, while the model holds values.
+                delivery_status=models.DeliveryStatusEnum(cmd.delivery_status),
+            )
+            session.add(delivery)
+            await session.commit()
+            await session.refresh(delivery)
+
+            return delivery
+
+    @collect_response
+    async def create_many(
+        self,
+        cmds: list[models.DeliveryCreateCommand]
+    ) -> None:
+        """Creates records of many delivery attempts with COPY.
+
+        Args:
+            cmds (list[models.DeliveryCreateCommand]): Commands containing data
+                of the attempts. Recipients of the attempts must exist.
+        """
+
+        await copy_records(
+            Delivery.__table__,
+            rows=[
+                {
+                    "delivery_id": uuid4(),
+                    **cmd.model_dump(exclude={"delivery_status"}),
+                    "delivery_status": models.DeliveryStatusEnum(cmd.delivery_status),
+                }
+                for cmd in cmds
+            ],
+        )
+
+    @collect_response
+    async def update_statuses_by_provider_message_id(
+        self,
+        cmds: list[models.DeliveryEvent]
+    ) -> None:
+        """Updates statuses of deliveries by provider message IDs with one statement.
+
+        Events are passed as two arrays and joined with ``unnest``. Status of
+        the delivery is changed only if the new status is further than the
+        current one, see :data:`_STATUS_RANK`. Statuses are passed and
+        compared as names of the enum, as they are stored by the column.
+
+        Args:
+            cmds (list[models.DeliveryEvent]): Events reported by the provider.
+                Provider message IDs must be unique.
+        """
+
+        if not cmds:
+            return None
+
+        rows = func.unnest(
+            bindparam("provider_message_ids", type_=ARRAY(String)),
+            bindparam("statuses", type_=ARRAY(String)),
+        ).table_valued(
+            column("delivery_provider_message_id", String),
+            column("delivery_status", String),
+        ).render_derived(name="s")
+
+        async with get_connection() as session:
+            await session.execute(
+                update(Delivery)
+                .where(
+                    Delivery.delivery_provider_message_id == rows.c.delivery_provider_message_id,
+                    # Predicate of ix_delivery_provider_message_id, so the
+                    # partial index is usable by any join of the plan.
+                    Delivery.delivery_provider_message_id.isnot(None),
+                    case(_STATUS_RANK, value=type_coerce(Delivery.delivery_status, String), else_=0)
+                    < case(_STATUS_RANK, value=rows.c.delivery_status, else_=0),
+                )
+                .values(delivery_status=rows.c.delivery_status)
+                .execution_options(synchronize_session=False),
+                {
+                    "provider_message_ids": [cmd.delivery_provider_message_id for cmd in cmds],
+                    # Column stores names of the enum, while the model holds values.
+                    "statuses": [models.DeliveryStatusEnum(cmd.delivery_status).name for cmd in cmds],
+                },
+            )
+            await session.commit()
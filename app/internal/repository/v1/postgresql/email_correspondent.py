@@ -1,12 +1,15 @@
 """EmailCorrespondent repository implementation."""
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, tuple_
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.substring_search import (
+    substring_search,
+)
 from app.pkg.models import v1 as models
 from app.pkg.models.sqlalchemy_models import EmailCorrespondent
 
@@ -45,6 +48,13 @@ class EmailCorrespondentRepository(Repository):
     ) -> list[models.EmailCorrespondentResponse]:
         """Retrieves email correspondents matching the given filters.
 
+        Rows are read by keyset: newest first, ordered by creation time and ID,
+        strictly after ``query.cursor``. One row more than ``query.limit`` is
+        read, it only tells that the next page exists.
+
+        Substring search by ``query.email_correspondent_name`` is served by the trigram
+        index of the column, matches are ordered by similarity first.
+
         Args:
             query (models.EmailCorrespondentReadQuery): Query containing filters for retrieving correspondents.
 
@@ -54,25 +64,31 @@ class EmailCorrespondentRepository(Repository):
 
         async with get_connection() as session:
             stmt = (
-                select(EmailCorrespondent)
+                select(EmailCorrespondent.__table__)
                 .where(
                     *(
                         [EmailCorrespondent.email_correspondent_id == query.email_correspondent_id]
                         if query.email_correspondent_id else []
                     ),
-                    *(
-                        [EmailCorrespondent.email_correspondent_name.ilike(
-                            f"%{query.email_correspondent_name.strip()}%")]
-                        if query.email_correspondent_name else []
-                    ),
                     *(
                         [EmailCorrespondent.email_correspondent_is_active == query.email_correspondent_is_active]
                         if query.email_correspondent_is_active is not None else []
                     ),
                 )
-                .order_by(EmailCorrespondent.email_correspondent_create_at.desc())
             )
-            rows = (await session.execute(stmt)).scalars().all()
+            keyset = [EmailCorrespondent.email_correspondent_create_at, EmailCorrespondent.email_correspondent_id]
+            after = [query.cursor.create_at, query.cursor.id] if query.cursor else None
+            if query.email_correspondent_name:
+                match, rank = substring_search(EmailCorrespondent.email_correspondent_name, query.email_correspondent_name)
+                stmt = stmt.where(match).add_columns(rank.label("email_correspondent_search_rank"))
+                keyset.insert(0, rank)
+                if after is not None:
+                    after.insert(0, query.cursor.rank)
+
+            stmt = stmt.order_by(*(column.desc() for column in keyset)).limit(query.limit + 1)
+            if after is not None:
+                stmt = stmt.where(tuple_(*keyset) < tuple_(*after))
+            rows = (await session.execute(stmt)).all()
             return rows
 
     @collect_response
@@ -84,16 +100,43 @@ class EmailCorrespondentRepository(Repository):
 
         async with get_connection() as session:
             stmt = (
-                select(EmailCorrespondent)
+                select(EmailCorrespondent.__table__)
                 .where(
-                    EmailCorrespondent.email_correspondent_name == query.email_correspondent_name
+                    EmailCorrespondent.email_correspondent_name == query.email_correspondent_name,
+                    EmailCorrespondent.email_correspondent_is_active.is_(True),
                 )
             )
             res = await session.execute(stmt)
-            row = res.scalar_one()
+            row = res.one()
             return row
 
+    @collect_response
+    async def read_secrets(
+        self,
+        query: models.EmailCorrespondentReadSecretsQuery,
+    ) -> models.EmailCorrespondentSecrets:
+        """Retrieves secrets of an active email correspondent by id.
 
+        Args:
+            query (models.EmailCorrespondentReadSecretsQuery): Identifier of the correspondent.
+
+        Returns:
+            models.EmailCorrespondentSecrets: Secrets of the correspondent.
+        """
+
+        async with get_connection() as session:
+            stmt = (
+                select(
+                    EmailCorrespondent.email_correspondent_id,
+                    EmailCorrespondent.email_password,
+                )
+                .where(
+                    EmailCorrespondent.email_correspondent_id == query.email_correspondent_id,
+                    EmailCorrespondent.email_correspondent_is_active.is_(True),
+                )
+            )
+            res = await session.execute(stmt)
+            return res.one()
 
     @collect_response
     async def update(
@@ -1,6 +1,7 @@
 """Collect response module."""
 
 from functools import wraps
+from types import UnionType
 from typing import (
     Any,
     Callable,
@@ -13,6 +14,7 @@ from typing import (
 )
 
 from pydantic import TypeAdapter
+from sqlalchemy import Row
 
 from app.internal.repository.v1.postgresql.handlers.handle_exception import (
     handle_exception,
@@ -20,8 +22,33 @@ from app.internal.repository.v1.postgresql.handlers.handle_exception import (
 from app.pkg.models.base import Model
 from app.pkg.models.v1.exceptions.repository import EmptyResult
 
+__all__ = ["collect_response"]
+
 
 def collect_response(fn) -> Callable:
+    """Convert response of ``fn`` to the model of its return annotation.
+
+    The annotation is resolved and its :class:`pydantic.TypeAdapter` is built
+    once, when ``fn`` is decorated, not on every call.
+
+    ``fn`` may return ORM instances, which are validated from their
+    attributes, or rows of a Core select, e.g. ``select(Model.__table__)``.
+    Rows are validated from their mapping, without ORM identity map and
+    attribute instrumentation, which makes reads of many rows cheaper.
+
+    Args:
+        fn: Target function that contains a query in postgresql.
+
+    Raises:
+        EmptyResult: when a query of `fn` returns nothing and the annotation
+            is neither optional nor a list.
+
+    Returns:
+        The model that is specified in type hints of `fn`.
+    """
+
+    process_response = __compile_response(fn)
+
     @wraps(fn)
     @handle_exception
     async def inner(
@@ -29,30 +56,45 @@ def collect_response(fn) -> Callable:
         **kwargs: Any,
     ) -> Union[List[Type[Model]], Type[Model], None]:
         response = await fn(*args, **kwargs)
-        return await process_response(fn, response)
+        return process_response(response)
 
     return inner
 
 
-async def process_response(fn: Callable, response: Any):
+def __compile_response(fn: Callable) -> Callable[[Any], Any]:
+    """Build converter of the response of ``fn`` from its return annotation."""
+
     return_annotation = get_type_hints(fn).get("return")
     if return_annotation is None or return_annotation is type(None):
-        return None
+        return lambda response: None
 
     origin = get_origin(return_annotation)
-    is_optional = origin is Union and type(None) in get_args(return_annotation)
-
-    if is_optional and not response:
-        return None
-    if origin is list and not response:
-        return []
-    if not response:
-        raise EmptyResult
-
+    # ``Optional[Model]`` and ``Model | None`` have different origins.
+    is_optional = origin in (Union, UnionType) and type(None) in get_args(return_annotation)
     base_type = get_args(return_annotation)[0] if is_optional else return_annotation
     adapter = TypeAdapter(base_type)
 
-    if (origin is list) or (is_optional and get_origin(base_type) is list):
-        return adapter.validate_python(response)
+    def process_response(response: Any) -> Any:
+        if is_optional and not response:
+            return None
+        if origin is list and not response:
+            return []
+        if not response:
+            raise EmptyResult
+
+        return adapter.validate_python(__from_rows(response))
+
+    return process_response
+
+
+def __from_rows(response: Any) -> Any:
+    """Replace rows of a Core select with dicts, other values are kept."""
 
-    return adapter.validate_python(response)
+    if isinstance(response, Row):
+        return dict(zip(response._fields, response))
+    if isinstance(response, list) and isinstance(response[0], Row):
+        # Keys are the same for all rows of a result, ``Row._fields`` is not
+        # cached by the row.
+        keys = response[0]._fields
+        return [dict(zip(keys, row)) for row in response]
+    return response
@@ -0,0 +1,99 @@
+"""Bulk insert of rows with PostgreSQL COPY."""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Mapping, Sequence
+
+from asyncpg import PostgresError, UniqueViolationError
+from sqlalchemy import Table
+
+from app.internal.repository.v1.postgresql.connection import get_connection
+from app.pkg.logger import get_logger
+from app.pkg.models.v1.exceptions.repository import DriverError, UniqueViolation
+
+__all__ = ["copy_records"]
+
+logger = get_logger(__name__)
+
+
+def __to_column(value: Any) -> Any:
+    """Convert value of the model to the value stored in the column.
+
+    Enum columns store names of the enum, ``timestamp`` columns store naive
+    UTC time.
+    """
+
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def copy_records(
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+    skip_conflicts: bool = False,
+) -> None:
+    """Insert rows into ``table`` with binary COPY of asyncpg driver.
+
+    COPY sends all rows in one stream, without a statement per row and without
+    parameter limit of ``INSERT ... VALUES``. All rows must have the same keys,
+    missing columns get their defaults.
+
+    COPY can not skip conflicting rows. With ``skip_conflicts`` rows are copied
+    into a temporary table first and moved with
+    ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``, in one transaction.
+
+    Args:
+        table: Table to insert into.
+        rows: Rows to insert. Values are converted to the values of columns,
+            see :func:`__to_column`.
+        skip_conflicts: Skip rows conflicting with existing ones.
+
+    Raises:
+        UniqueViolation: Row conflicts with existing one.
+        DriverError: Any other error of the driver.
+    """
+
+    if not rows:
+        return
+
+    columns = list(rows[0])
+    records = [tuple(__to_column(row[column]) for column in columns) for row in rows]
+
+    async with get_connection(return_engine=True) as engine:
+        async with engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+            try:
+                async with driver.transaction():
+                    if not skip_conflicts:
+                        await driver.copy_records_to_table(
+                            table.name,
+                            records=records,
+                            columns=columns,
+                        )
+                        return
+
+                    staging = f"{table.name}_copy"
+                    await driver.execute(
+                        f"CREATE TEMPORARY TABLE {staging} "
+                        f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP",
+                    )
+                    await driver.copy_records_to_table(
+                        staging,
+                        records=records,
+                        columns=columns,
+                    )
+                    names = ", ".join(columns)
+                    await driver.execute(
+                        f"INSERT INTO {table.name} ({names}) "
+                        f"SELECT {names} FROM {staging} ON CONFLICT DO NOTHING",
+                    )
+            except UniqueViolationError as error:
+                logger.exception(f"Unique constraint violation: {error}")
+                raise UniqueViolation from error
+            except PostgresError as error:
+                logger.exception(f"Copy into {table.name} failed: {error}")
+                raise DriverError(error_details=str(error)) from error
@@ -0,0 +1,37 @@
+"""Substring search backed by pg_trgm indexes."""
+
+from sqlalchemy import ColumnElement, Float, func
+
+__all__ = ["substring_search"]
+
+
+def __escape_like(value: str) -> str:
+    """Escape wildcards of LIKE pattern, so ``value`` is matched literally."""
+
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def substring_search(
+    column: ColumnElement[str],
+    value: str,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Build filter and rank of case-insensitive substring search.
+
+    ``ILIKE '%value%'`` is served by GIN index with ``gin_trgm_ops`` of the
+    column, when ``value`` has at least 3 characters. Shorter values have no
+    trigrams and scan the whole index, see ``settings.SEARCH.MIN_LENGTH``.
+
+    Args:
+        column: Searched column, must have trigram index.
+        value: Searched substring.
+
+    Returns:
+        Filter of rows containing ``value`` and rank of the row, ``similarity``
+        of the column and ``value`` from 0 to 1.
+    """
+
+    value = value.strip()
+    return (
+        column.ilike(f"%{__escape_like(value)}%", escape="\\"),
+        func.similarity(column, value, type_=Float),
+    )
@@ -1,6 +1,7 @@
 """Message repository implementation."""
 
-from sqlalchemy import select, update, func
+from sqlalchemy import bindparam, select, update, func
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
@@ -8,6 +9,7 @@ from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
 from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import Message
 
 __all__ = ["MessageRepository"]
 
@@ -19,4 +21,62 @@ class MessageRepository(Repository):
     async def message_update_status(
         self,
         cmd: models.MessageUpdateStatusCommand
-    ):
+    ) -> None:
+        """Updates status of the message.
+
+        Args:
+            cmd (models.MessageUpdateStatusCommand): Command with the message ID and
+                new status.
+        """
+
+        async with get_connection() as session:
+            await session.execute(
+                update(Message)
+                .where(Message.message_id == cmd.message_id)
+                .values(message_status=models.MessageStatusEnum(cmd.message_status)),
+            )
+            await session.commit()
+
+    @collect_response
+    async def message_update_statuses(
+        self,
+        cmds: list[models.MessageUpdateStatusCommand]
+    ) -> None:
+        """Updates statuses of many messages with one statement.
+
+        Rows are passed as two arrays and joined with ``unnest``, so the
+        statement and its prepared plan are the same for any count of rows::
+
+            UPDATE message SET message_status = s.message_status
+            FROM unnest($1::UUID[], $2::messagestatusenum[]) AS s(message_id, message_status)
+            WHERE message.message_id = s.message_id
+
+        Args:
+            cmds (list[models.MessageUpdateStatusCommand]): Commands with the
+                message IDs and new statuses. Message IDs must be unique.
+        """
+
+        if not cmds:
+            return None
+
+        table = Message.__table__
+        rows = func.unnest(
+            bindparam("message_ids", type_=ARRAY(table.c.message_id.type)),
+            bindparam("message_statuses", type_=ARRAY(table.c.message_status.type)),
+        ).table_valued("message_id", "message_status").render_derived(name="s")
+
+        async with get_connection() as session:
+            await session.execute(
+                update(Message)
+                .where(Message.message_id == rows.c.message_id)
+                .values(message_status=rows.c.message_status)
+                .execution_options(synchronize_session=False),
+                {
+                    "message_ids": [cmd.message_id for cmd in cmds],
+                    # Column stores names of the enum, while the model holds values.
+                    "message_statuses": [
+                        models.MessageStatusEnum(cmd.message_status) for cmd in cmds
+                    ],
+                },
+            )
+            await session.commit()
@@ -1,16 +1,62 @@
 """Recipient repository implementation."""
 
 from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.copy_records import copy_records
 from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import Recipient
 
 __all__ = ["RecipientRepository"]
 
 
 class RecipientRepository(Repository):
-    """Recipient repository implementation."""
\ No newline at end of file
+    """Recipient repository implementation."""
+
+    @collect_response
+    async def create(
+        self,
+        cmd: models.RecipientCreateCommand
+    ) -> models.Recipient:
+        """Creates a recipient unless a recipient with the same ID exists.
+
+        Args:
+            cmd (models.RecipientCreateCommand): Command containing data for recipient creation.
+
+        Returns:
+            models.Recipient: The created or already existing recipient.
+        """
+
+        async with get_connection() as session:
+            await session.execute(
+                insert(Recipient)
+                .values(**cmd.model_dump())
+                .on_conflict_do_nothing(index_elements=[Recipient.recipient_id]),
+            )
+            await session.commit()
+
+            stmt = select(Recipient).where(Recipient.recipient_id == cmd.recipient_id)
+            return (await session.execute(stmt)).scalar_one()
+
+    @collect_response
+    async def create_many(
+        self,
+        cmds: list[models.RecipientCreateCommand]
+    ) -> None:
+        """Creates recipients with COPY, skipping recipients that exist.
+
+        Args:
+            cmds (list[models.RecipientCreateCommand]): Commands containing data
+                for recipients creation.
+        """
+
+        await copy_records(
+            Recipient.__table__,
+            rows=[cmd.model_dump() for cmd in cmds],
+            skip_conflicts=True,
+        )
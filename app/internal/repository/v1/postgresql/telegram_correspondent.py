@@ -1,12 +1,15 @@
 """TelegramCorrespondentRepository repository implementation."""
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, tuple_
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.substring_search import (
+    substring_search,
+)
 from app.pkg.models import v1 as models
 from app.pkg.models.sqlalchemy_models.v1.telegram_correspondent import TelegramCorrespondent
 
@@ -45,6 +48,13 @@ class TelegramCorrespondentRepository(Repository):
     ) -> list[models.TelegramCorrespondentResponse]:
         """Retrieves telegram correspondents matching the given filters.
 
+        Rows are read by keyset: newest first, ordered by creation time and ID,
+        strictly after ``query.cursor``. One row more than ``query.limit`` is
+        read, it only tells that the next page exists.
+
+        Substring search by ``query.telegram_correspondent_name`` is served by the trigram
+        index of the column, matches are ordered by similarity first.
+
         Args:
             query (models.TelegramCorrespondentReadQuery): Query containing filters for retrieving correspondents.
 
@@ -54,27 +64,87 @@ class TelegramCorrespondentRepository(Repository):
 
         async with get_connection() as session:
             stmt = (
-                select(TelegramCorrespondent)
+                select(TelegramCorrespondent.__table__)
                 .where(
                     *(
                         [TelegramCorrespondent.telegram_correspondent_id == query.telegram_correspondent_id]
                         if query.telegram_correspondent_id else []
                     ),
-                    *(
-                        [TelegramCorrespondent.telegram_correspondent_name.ilike(
-                            f"%{query.telegram_correspondent_name.strip()}%")]
-                        if query.telegram_correspondent_name else []
-                    ),
                     *(
                         [TelegramCorrespondent.telegram_correspondent_is_active == query.telegram_correspondent_is_active]
                         if query.telegram_correspondent_is_active is not None else []
                     ),
                 )
-                .order_by(TelegramCorrespondent.telegram_correspondent_create_at.desc())
             )
-            rows = (await session.execute(stmt)).scalars().all()
+            keyset = [TelegramCorrespondent.telegram_correspondent_create_at, TelegramCorrespondent.telegram_correspondent_id]
+            after = [query.cursor.create_at, query.cursor.id] if query.cursor else None
+            if query.telegram_correspondent_name:
+                match, rank = substring_search(TelegramCorrespondent.telegram_correspondent_name, query.telegram_correspondent_name)
+                stmt = stmt.where(match).add_columns(rank.label("telegram_correspondent_search_rank"))
+                keyset.insert(0, rank)
+                if after is not None:
+                    after.insert(0, query.cursor.rank)
+
+            stmt = stmt.order_by(*(column.desc() for column in keyset)).limit(query.limit + 1)
+            if after is not None:
+                stmt = stmt.where(tuple_(*keyset) < tuple_(*after))
+            rows = (await session.execute(stmt)).all()
             return rows
 
+    @collect_response
+    async def read_by_name(
+        self,
+        query: models.TelegramCorrespondentReadByNameQuery
+    ) -> models.TelegramCorrespondentResponse:
+        """Retrieves active telegram correspondent by name.
+
+        Args:
+            query (models.TelegramCorrespondentReadByNameQuery): Name of the correspondent.
+
+        Returns:
+            models.TelegramCorrespondentResponse: Found correspondent.
+        """
+
+        async with get_connection() as session:
+            stmt = (
+                select(TelegramCorrespondent.__table__)
+                .where(
+                    TelegramCorrespondent.telegram_correspondent_name == query.telegram_correspondent_name,
+                    TelegramCorrespondent.telegram_correspondent_is_active.is_(True),
+                )
+            )
+            res = await session.execute(stmt)
+            row = res.one()
+            return row
+
+    @collect_response
+    async def read_secrets(
+        self,
+        query: models.TelegramCorrespondentReadSecretsQuery,
+    ) -> models.TelegramCorrespondentSecrets:
+        """Retrieves secrets of an active telegram correspondent by id.
+
+        Args:
+            query (models.TelegramCorrespondentReadSecretsQuery): Identifier of the correspondent.
+
+        Returns:
+            models.TelegramCorrespondentSecrets: Secrets of the correspondent.
+        """
+
+        async with get_connection() as session:
+            stmt = (
+                select(
+                    TelegramCorrespondent.telegram_correspondent_id,
+                    TelegramCorrespondent.telegram_bot_token,
+                )
+                .where(
+                    TelegramCorrespondent.telegram_correspondent_id == query.telegram_correspondent_id,
+                    TelegramCorrespondent.telegram_correspondent_is_active.is_(True),
+                )
+            )
+            res = await session.execute(stmt)
+            return res.one()
+
     @collect_response
     async def update(
         self,
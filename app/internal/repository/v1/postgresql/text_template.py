@@ -1,12 +1,15 @@
 """Text template repository implementation."""
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, tuple_
 
 from app.internal.repository.repository import Repository
 from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.substring_search import (
+    substring_search,
+)
 from app.pkg.models.sqlalchemy_models import TextTemplate
 from app.pkg.models import v1 as models
 
@@ -44,6 +47,13 @@ class TextTemplateRepository(Repository):
     ) -> list[models.TextTemplate]:
         """Reads text templates from the database based on query filters.
 
+        Rows are read by keyset: newest first, ordered by creation time and ID,
+        strictly after ``query.cursor``. One row more than ``query.limit`` is
+        read, it only tells that the next page exists.
+
+        Substring search by ``query.text_template_code`` is served by the trigram
+        index of the column, matches are ordered by similarity first.
+
         Args:
             query (models.TextTemplateReadQuery): Query with optional filters
                 (id, code, subject, is_active, channel).
@@ -53,17 +63,12 @@ class TextTemplateRepository(Repository):
         """
         async with get_connection() as session:
             stmt = (
-                select(TextTemplate)
+                select(TextTemplate.__table__)
                 .where(
                     *(
                         [TextTemplate.text_template_id == query.text_template_id]
                         if query.text_template_id else []
                     ),
-                    *(
-                        [TextTemplate.text_template_code.ilike(
-                            f"%{query.text_template_code.strip()}%")]
-                        if query.text_template_code else []
-                    ),
                     *(
                         [TextTemplate.text_template_subject == query.text_template_subject]
                         if query.text_template_subject else []
@@ -77,9 +82,20 @@ class TextTemplateRepository(Repository):
                         if query.text_template_channel is not None else []
                     ),
                 )
-                .order_by(TextTemplate.text_template_create_at.desc())
             )
-            rows = (await session.execute(stmt)).scalars().all()
+            keyset = [TextTemplate.text_template_create_at, TextTemplate.text_template_id]
+            after = [query.cursor.create_at, query.cursor.id] if query.cursor else None
+            if query.text_template_code:
+                match, rank = substring_search(TextTemplate.text_template_code, query.text_template_code)
+                stmt = stmt.where(match).add_columns(rank.label("text_template_search_rank"))
+                keyset.insert(0, rank)
+                if after is not None:
+                    after.insert(0, query.cursor.rank)
+
+            stmt = stmt.order_by(*(column.desc() for column in keyset)).limit(query.limit + 1)
+            if after is not None:
+                stmt = stmt.where(tuple_(*keyset) < tuple_(*after))
+            rows = (await session.execute(stmt)).all()
             return rows
 
     @collect_response
@@ -91,11 +107,15 @@ class TextTemplateRepository(Repository):
 
         async with get_connection() as session:
             stmt = (
-                select(TextTemplate)
-                .where(TextTemplate.text_template_code == query.text_template_code)
+                select(TextTemplate.__table__)
+                .where(
+                    TextTemplate.text_template_code == query.text_template_code,
+                    TextTemplate.text_template_channel == query.text_template_channel,
+                    TextTemplate.text_template_is_active.is_(True),
+                )
             )
             res = await session.execute(stmt)
-            row = res.scalar_one()
+            row = res.one()
             return row
 
     @collect_response
@@ -1,7 +1,7 @@
 """RabbitMQ repository container module."""
 
 from dependency_injector import containers, providers
-from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository, PublishResult
 
 
 class Repositories(containers.DeclarativeContainer):
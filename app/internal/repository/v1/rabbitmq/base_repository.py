@@ -1,12 +1,38 @@
 """Create base rabbitmq repository."""
 
+import asyncio
 import json
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Sequence
+
 import aio_pika
+from aio_pika.abc import AbstractIncomingMessage
+from pamqp.commands import Basic
 
 from app.internal.repository.v1.rabbitmq.connection import get_connection
+from app.pkg.settings import settings
+
+__all__ = ["BaseRepository", "PublishResult"]
+
+#: str: Header with the number of the send attempt of the delivery.
+ATTEMPT_HEADER = "x-attempt"
+#: str: Header with the reason of moving the delivery to the dead-letter queue.
+DEAD_REASON_HEADER = "x-dead-reason"
+
 
-__all__ = ["BaseRepository"]
+@dataclass(frozen=True)
+class PublishResult:
+    """Outcome of a single publish of :meth:`.BaseRepository.publish_many`.
+
+    Attributes:
+        message: The published message.
+        confirmed: True if broker acked the message.
+        error: Reason of failure, if any.
+    """
+
+    message: Any
+    confirmed: bool
+    error: str | None = None
 
 
 class BaseRepository:
@@ -16,12 +42,17 @@ class BaseRepository:
     async def create(
         message: Any,
         routing_key: str,
+        priority: int | None = None,
     ):
         """Publishes a message to RabbitMQ.
 
         Args:
             message (Any): The message to publish.
             routing_key (str): The routing key for the RabbitMQ queue.
+            priority (int | None): Priority of the message. Messages with
+                priority not lower than ``settings.RABBITMQ.HIGH_PRIORITY``
+                are routed to the high-priority lane of ``routing_key``, see
+                :meth:`.lane_routing_key`.
 
         Returns:
             Any: The message that was sent.
@@ -31,11 +62,78 @@ class BaseRepository:
             await channel.default_exchange.publish(
                 aio_pika.Message(
                     body=json.dumps(message.to_dict()).encode("utf-8"),
+                    priority=priority,
                 ),
-                routing_key=routing_key,
+                routing_key=BaseRepository.lane_routing_key(routing_key, priority),
             )
             return message
 
+    @staticmethod
+    async def publish_many(
+        messages: Sequence[Any],
+        routing_key: str,
+        batch_size: int | None = None,
+        priority: int | None = None,
+    ) -> list[PublishResult]:
+        """Publishes many messages to RabbitMQ with publisher confirms.
+
+        Messages are published over one pooled channel with publisher
+        confirms. Each batch is written without waiting, then confirms of
+        the whole batch are awaited together.
+
+        Args:
+            messages (Sequence[Any]): The messages to publish.
+            routing_key (str): The routing key for the RabbitMQ queue.
+            batch_size (int | None): Count of messages awaited together.
+                Defaults to ``settings.RABBITMQ.PUBLISH_BATCH_SIZE``.
+            priority (int | None): Priority of the messages, see :meth:`.create`.
+
+        Returns:
+            list[PublishResult]: Results in the order of ``messages``.
+        """
+
+        batch_size = batch_size or settings.RABBITMQ.PUBLISH_BATCH_SIZE
+        results: list[PublishResult] = []
+        routing_key = BaseRepository.lane_routing_key(routing_key, priority)
+
+        async with get_connection() as channel:
+            exchange = channel.default_exchange
+            for start in range(0, len(messages), batch_size):
+                batch = messages[start:start + batch_size]
+                confirms = await asyncio.gather(
+                    *(
+                        exchange.publish(
+                            aio_pika.Message(
+                                body=json.dumps(message.to_dict()).encode("utf-8"),
+                                priority=priority,
+                            ),
+                            routing_key=routing_key,
+                        )
+                        for message in batch
+                    ),
+                    return_exceptions=True,
+                )
+                results.extend(
+                    BaseRepository.__to_result(message, confirm)
+                    for message, confirm in zip(batch, confirms)
+                )
+
+        return results
+
+    @staticmethod
+    def __to_result(message: Any, confirm: Any) -> PublishResult:
+        """Convert confirmation frame or error of the publish to result."""
+
+        if isinstance(confirm, BaseException):
+            return PublishResult(message=message, confirmed=False, error=repr(confirm))
+        if isinstance(confirm, Basic.Ack):
+            return PublishResult(message=message, confirmed=True)
+        return PublishResult(
+            message=message,
+            confirmed=False,
+            error=type(confirm).__name__,
+        )
+
     @staticmethod
     async def listen_queue(routing_key: str):
         """Listen to a specific message queue and process incoming messages.
@@ -47,9 +145,241 @@ class BaseRepository:
         async with get_connection() as channel:
             if not isinstance(channel, aio_pika.Channel):
                 raise TypeError("Expected aio_pika.Channel, but got something else.")
-            queue = await channel.declare_queue(routing_key, durable=True)
+            queue = await channel.declare_queue(
+                routing_key,
+                durable=True,
+                arguments=BaseRepository.queue_arguments(),
+            )
 
             async for message in queue:
                 async with message.process():
-                    message_body = json.loads(message.body.decode("utf-8"))
+                    message_body = json.loads(message.body)
                     yield message_body
+
+    @staticmethod
+    async def consume_queue(
+        routing_key: str,
+        prefetch_count: int,
+    ) -> AsyncGenerator[AbstractIncomingMessage, None]:
+        """Listen to a specific message queue and yield raw deliveries.
+
+        Unlike :meth:`.listen_queue`, deliveries are not acked here. The caller
+        **must** settle every message, e.g. with ``message.process()``.
+
+        Args:
+            routing_key (str): The routing key (queue name) to listen to.
+            prefetch_count (int): Channel QoS, max count of unacked deliveries.
+        """
+
+        async with get_connection() as channel:
+            if not isinstance(channel, aio_pika.Channel):
+                raise TypeError("Expected aio_pika.Channel, but got something else.")
+            await channel.set_qos(prefetch_count=prefetch_count)
+            queue = await channel.declare_queue(
+                routing_key,
+                durable=True,
+                arguments=BaseRepository.queue_arguments(),
+            )
+
+            async with queue.iterator() as queue_iter:
+                async for message in queue_iter:
+                    yield message
+
+    @staticmethod
+    async def declare_retry_queues(
+        routing_key: str,
+        delays: dict[int, float],
+        postpone_delay: float,
+    ) -> None:
+        """Declare delay queues and dead-letter queue of ``routing_key``.
+
+        Delay queue of each attempt, and the queue of postponed deliveries,
+        has TTL and dead-letters expired messages back to ``routing_key``
+        through the default exchange, so waiting for a retry never occupies
+        the consumer.
+
+        Args:
+            routing_key (str): The routing key (queue name) of the main queue.
+            delays (dict[int, float]): Max delay in seconds by number of failed
+                attempt.
+            postpone_delay (float): Delay in seconds of postponed deliveries.
+        """
+
+        async with get_connection() as channel:
+            queues = {
+                BaseRepository.retry_queue_name(routing_key, attempt): delay
+                for attempt, delay in delays.items()
+            }
+            queues[BaseRepository.postponed_queue_name(routing_key)] = postpone_delay
+            for name, delay in queues.items():
+                await channel.declare_queue(
+                    name,
+                    durable=True,
+                    arguments={
+                        "x-message-ttl": int(delay * 1000),
+                        "x-dead-letter-exchange": "",
+                        "x-dead-letter-routing-key": routing_key,
+                    },
+                )
+            await channel.declare_queue(
+                BaseRepository.dead_letter_queue_name(routing_key),
+                durable=True,
+            )
+
+    @staticmethod
+    async def publish_retry(
+        message: AbstractIncomingMessage,
+        routing_key: str,
+        attempt: int,
+        delay: float,
+    ) -> None:
+        """Schedule next attempt of the failed delivery.
+
+        Args:
+            message (AbstractIncomingMessage): Failed delivery.
+            routing_key (str): The routing key (queue name) of the main queue.
+            attempt (int): Number of the failed attempt.
+            delay (float): Delay in seconds before the next attempt.
+        """
+
+        await BaseRepository.__republish(
+            message,
+            routing_key=BaseRepository.retry_queue_name(routing_key, attempt),
+            headers={ATTEMPT_HEADER: attempt + 1},
+            expiration=delay,
+        )
+
+    @staticmethod
+    async def publish_postponed(
+        message: AbstractIncomingMessage,
+        routing_key: str,
+    ) -> None:
+        """Process the delivery again after the delay of the postponed queue.
+
+        Number of the attempt is kept, so postponing is not a send attempt.
+
+        Args:
+            message (AbstractIncomingMessage): Postponed delivery.
+            routing_key (str): The routing key (queue name) of the main queue.
+        """
+
+        await BaseRepository.__republish(
+            message,
+            routing_key=BaseRepository.postponed_queue_name(routing_key),
+            headers={},
+        )
+
+    @staticmethod
+    async def publish_dead(
+        message: AbstractIncomingMessage,
+        routing_key: str,
+        reason: str,
+    ) -> None:
+        """Move the delivery to the dead-letter queue.
+
+        Args:
+            message (AbstractIncomingMessage): Failed delivery.
+            routing_key (str): The routing key (queue name) of the main queue.
+            reason (str): Reason of the failure.
+        """
+
+        await BaseRepository.__republish(
+            message,
+            routing_key=BaseRepository.dead_letter_queue_name(routing_key),
+            headers={DEAD_REASON_HEADER: reason},
+        )
+
+    @staticmethod
+    def queue_arguments() -> dict[str, Any]:
+        """Arguments of the main queues: broker delivers messages of higher
+        priority first."""
+
+        return {"x-max-priority": settings.RABBITMQ.MAX_PRIORITY}
+
+    @staticmethod
+    def priority_queue_name(routing_key: str) -> str:
+        """Name of the high-priority lane of ``routing_key``."""
+
+        return f"{routing_key}.priority"
+
+    @staticmethod
+    def laned_routing_keys() -> tuple[str, ...]:
+        """Routing keys with a high-priority lane, declared and consumed by
+        :class:`.ChannelDispatcherWorker`."""
+
+        return settings.RABBITMQ.NOTIFICATION_KEY, settings.RABBITMQ.TELEGRAM_KEY
+
+    @staticmethod
+    def lane_routing_key(routing_key: str, priority: int | None) -> str:
+        """Routing key of the lane the message of ``priority`` belongs to.
+
+        Keys without a high-priority lane are never rewritten, the message is
+        published to ``routing_key`` with its priority.
+        """
+
+        if (
+            priority is not None
+            and priority >= settings.RABBITMQ.HIGH_PRIORITY
+            and routing_key in BaseRepository.laned_routing_keys()
+        ):
+            return BaseRepository.priority_queue_name(routing_key)
+        return routing_key
+
+    @staticmethod
+    def get_attempt(message: AbstractIncomingMessage) -> int:
+        """Get number of the send attempt of the delivery."""
+
+        return int((message.headers or {}).get(ATTEMPT_HEADER, 1))
+
+    @staticmethod
+    def retry_queue_name(routing_key: str, attempt: int) -> str:
+        """Name of the delay queue after failed ``attempt``."""
+
+        return f"{routing_key}.retry.{attempt}"
+
+    @staticmethod
+    def postponed_queue_name(routing_key: str) -> str:
+        """Name of the delay queue of postponed deliveries."""
+
+        return f"{routing_key}.postponed"
+
+    @staticmethod
+    def dead_letter_queue_name(routing_key: str) -> str:
+        """Name of the dead-letter queue of ``routing_key``."""
+
+        return f"{routing_key}.dead"
+
+    @staticmethod
+    async def __republish(
+        message: AbstractIncomingMessage,
+        routing_key: str,
+        headers: dict[str, Any],
+        expiration: float | None = None,
+    ) -> None:
+        """Publish persistent copy of the delivery with extra headers."""
+
+        async with get_connection() as channel:
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=message.body,
+                    content_type=message.content_type,
+                    headers={**(message.headers or {}), **headers},
+                    priority=message.priority,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    expiration=expiration,
+                ),
+                routing_key=routing_key,
+            )
+
+    @staticmethod
+    def decode_message(message: AbstractIncomingMessage) -> dict[str, Any]:
+        """Decode body of the delivery.
+
+        Args:
+            message (AbstractIncomingMessage): Delivery from the queue.
+
+        Returns:
+            dict[str, Any]: Decoded message body.
+        """
+
+        return json.loads(message.body)
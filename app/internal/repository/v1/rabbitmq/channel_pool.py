@@ -0,0 +1,105 @@
+"""Pool of rabbitmq channels over pooled connections."""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from logging import Logger
+from typing import AsyncIterator
+
+import aio_pika
+from aio_pika.abc import AbstractChannel
+
+from app.pkg.logger import get_logger
+
+__all__ = ["ChannelPool"]
+
+
+class ChannelPool:
+    """Pool of opened channels layered on :class:`aio_pika.pool.Pool`.
+
+    Channel is opened on a connection taken from the connection pool, so
+    channels are spread over all pooled connections. Closed channels, e.g.
+    after a channel-level AMQP error, are dropped on release and on acquire,
+    and a new one is opened instead.
+
+    Examples:
+        ::
+
+            >>> async def publish(pool: aio_pika.pool.Pool) -> None:
+            ...     channels = ChannelPool(connection_pool=pool, max_size=8)
+            ...     async with channels.acquire() as channel:
+            ...         await channel.default_exchange.publish(
+            ...             aio_pika.Message(body=b"{}"),
+            ...             routing_key="queue_name",
+            ...         )
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(self, connection_pool: aio_pika.pool.Pool, max_size: int):
+        """Initialize channel pool.
+
+        Args:
+            connection_pool: Pool of robust connections.
+            max_size: Max count of channels in use at the same time.
+        """
+
+        self.connection_pool = connection_pool
+        self._limit = asyncio.Semaphore(max_size)
+        self._idle: deque[AbstractChannel] = deque()
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed or self.connection_pool.is_closed
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AbstractChannel]:
+        """Acquire opened channel from pool.
+
+        Returns:
+            Channel with publisher confirms.
+        """
+
+        async with self._limit:
+            channel = self.__take_idle() or await self.__open()
+            try:
+                yield channel
+            finally:
+                if channel.is_closed:
+                    self.__logger.debug("Drop closed rabbitmq channel.")
+                elif self.is_closed:
+                    await asyncio.gather(channel.close(), return_exceptions=True)
+                else:
+                    self._idle.append(channel)
+
+    async def close(self) -> None:
+        """Close all idle channels.
+
+        Channels in use are closed when they are released.
+        """
+
+        self._closed = True
+        channels = list(self._idle)
+        self._idle.clear()
+        await asyncio.gather(
+            *(channel.close() for channel in channels),
+            return_exceptions=True,
+        )
+
+    def __take_idle(self) -> AbstractChannel | None:
+        """Take the most recently used channel that is still open."""
+
+        while self._idle:
+            channel = self._idle.pop()
+            if not channel.is_closed:
+                return channel
+        return None
+
+    async def __open(self) -> AbstractChannel:
+        """Open new channel on a pooled connection."""
+
+        async with self.connection_pool.acquire() as conn:
+            channel = await conn.channel(publisher_confirms=True)
+        self.__logger.debug("Rabbitmq channel is opened.")
+        return channel
@@ -6,9 +6,19 @@ from typing import Union
 import aio_pika
 from dependency_injector.wiring import Provide, inject
 
+from app.internal.repository.v1.rabbitmq.channel_pool import ChannelPool
 from app.pkg.connectors import Connectors
+from app.pkg.settings import settings
 
-__all__ = ["get_connection", "acquire_connection"]
+__all__ = [
+    "get_connection",
+    "acquire_connection",
+    "get_channel_pool",
+    "close_channel_pools",
+]
+
+#: dict[int, ChannelPool]: Channel pool of each connection pool by its id.
+_channel_pools: dict[int, ChannelPool] = {}
 
 
 @asynccontextmanager
@@ -75,10 +85,47 @@ async def acquire_connection(
             ...             queue = await _cursor.get_queue("queue_name")
             ...             await queue.get()
 
+    Notes:
+        Channels are pooled, see :class:`.ChannelPool`. Channel is returned to
+        the pool on exit, so it must not be closed by the caller.
+
     Returns:
         Async connection to rabbitmq.
     """
 
-    async with pool.acquire() as conn:
-        channel = await conn.channel()
+    async with get_channel_pool(pool).acquire() as channel:
         yield channel
+
+
+def get_channel_pool(pool: aio_pika.pool.Pool) -> ChannelPool:
+    """Get channel pool layered on connection pool.
+
+    Args:
+        pool:
+            Getings from :func:`.get_connection` rabbitmq pool.
+
+    Returns:
+        Channel pool of ``pool`` with ``settings.RABBITMQ.MAX_CHANNEL`` size.
+    """
+
+    channel_pool = _channel_pools.get(id(pool))
+    if channel_pool is None or channel_pool.connection_pool is not pool:
+        channel_pool = ChannelPool(
+            connection_pool=pool,
+            max_size=settings.RABBITMQ.MAX_CHANNEL,
+        )
+        _channel_pools[id(pool)] = channel_pool
+    return channel_pool
+
+
+async def close_channel_pools() -> None:
+    """Close channel pools of all connection pools and forget them.
+
+    Must be called before connection pools are closed, so idle channels are
+    closed gracefully instead of being dropped with their connections.
+    """
+
+    channel_pools = list(_channel_pools.values())
+    _channel_pools.clear()
+    for channel_pool in channel_pools:
+        await channel_pool.close()
@@ -1,7 +1,7 @@
 """User repository for PostgresSQL database."""
 
 from abc import ABC
-from typing import Type, TypeVar
+from typing import Any, AsyncGenerator, Type, TypeVar
 
 from app.internal.repository.v1.redis.connection import get_connection
 from app.internal.repository.v1.redis.handlers.collect_response import collect_response
@@ -23,9 +23,7 @@ class BaseRedisRepository(ABC):
         expire_time: int | None = None,
     ):
         async with get_connection() as connect:
-            await connect.set(redis_key, redis_value)
-            if expire_time:
-                await connect.expire(redis_key, expire_time)
+            await connect.set(redis_key, redis_value, ex=expire_time or None)
 
     @collect_response
     async def read(
@@ -35,3 +33,116 @@ class BaseRedisRepository(ABC):
     ) -> Type[BaseModel]:
         async with get_connection() as connect:
             return await connect.get(redis_key)
+
+    @staticmethod
+    async def create_if_not_exists(
+        redis_key: str,
+        redis_value: str,
+        expire_time: int | None = None,
+    ) -> bool:
+        """Atomically set the key only if it does not exist (SET NX).
+
+        Args:
+            redis_key: Key to set.
+            redis_value: Value of the key.
+            expire_time: TTL of the key in seconds.
+
+        Returns:
+            True if the key was set, False if it already exists.
+        """
+
+        async with get_connection() as connect:
+            return bool(
+                await connect.set(redis_key, redis_value, ex=expire_time or None, nx=True),
+            )
+
+    @staticmethod
+    async def read_value(redis_key: str) -> str | None:
+        """Read raw string value of the key.
+
+        Args:
+            redis_key: Key to read.
+
+        Returns:
+            Value of the key or None if the key does not exist.
+        """
+
+        async with get_connection() as connect:
+            value = await connect.get(redis_key)
+            return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    @staticmethod
+    async def delete(redis_key: str) -> None:
+        """Delete the key.
+
+        Args:
+            redis_key: Key to delete.
+        """
+
+        async with get_connection() as connect:
+            await connect.delete(redis_key)
+
+    @staticmethod
+    async def run_script(script: str, keys: list[str], args: list[Any]) -> Any:
+        """Run Lua script atomically.
+
+        Script is sent once and then called by its SHA (EVALSHA).
+
+        Args:
+            script: Source of the Lua script.
+            keys: Keys used by the script (``KEYS``).
+            args: Arguments of the script (``ARGV``).
+
+        Returns:
+            Result of the script.
+        """
+
+        async with get_connection() as connect:
+            return await connect.register_script(script)(keys=keys, args=args)
+
+    @staticmethod
+    async def increment(redis_key: str, amount: int = 1) -> int:
+        """Atomically increment integer value of the key.
+
+        Args:
+            redis_key: Key of the counter.
+            amount: Increment. Use ``0`` to read the current value.
+
+        Returns:
+            Value of the counter after increment.
+        """
+
+        async with get_connection() as connect:
+            return await connect.incrby(redis_key, amount)
+
+    @staticmethod
+    async def publish(channel: str, message: str) -> int:
+        """Publish message to the pub/sub channel.
+
+        Args:
+            channel: Name of the channel.
+            message: Message to publish.
+
+        Returns:
+            Count of subscribers received the message.
+        """
+
+        async with get_connection() as connect:
+            return await connect.publish(channel, message)
+
+    @staticmethod
+    async def subscribe(channel: str) -> AsyncGenerator[str, None]:
+        """Subscribe to the pub/sub channel and yield incoming messages.
+
+        Args:
+            channel: Name of the channel.
+        """
+
+        async with get_connection() as connect:
+            pubsub = connect.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(channel)
+            try:
+                async for message in pubsub.listen():
+                    yield message["data"].decode("utf-8")
+            finally:
+                await pubsub.aclose()
@@ -1,10 +1,10 @@
 """Create connection to redis."""
 
 from contextlib import asynccontextmanager
-from typing import Union
+from typing import AsyncGenerator
 
 from dependency_injector.wiring import Provide, inject
-from redis.asyncio.connection import Connection, ConnectionPool
+from redis.asyncio import Redis
 
 from app.pkg.connectors import Connectors
 
@@ -14,27 +14,27 @@ __all__ = ["get_connection"]
 @asynccontextmanager
 @inject
 async def get_connection(
-    pool: ConnectionPool = Provide[Connectors.redis.connector],
-    return_pool: bool = False,
-) -> Union[Connection, ConnectionPool]:
+    pool: Redis = Provide[Connectors.redis.connector],
+    return_pool: bool = False,  # pylint: disable=unused-argument
+) -> AsyncGenerator[Redis, None]:
     """Get async connection pool to redis.
 
     Args:
         pool:
-            redis connection pool.
+            redis client, which owns the connection pool.
         return_pool:
-            if True, return pool, else return connection.
+            kept for compatibility, redis client is returned in both cases.
+
+    Notes:
+        The client is shared by the whole process, so it is **not** closed on
+        exit of the context manager. Connections are returned to the pool of
+        the client after each command.
 
     Returns:
         Async connection to redis.
     """
 
-    if not isinstance(pool, ConnectionPool):
+    if not isinstance(pool, Redis):
         pool = await pool
 
-    if return_pool:
-        yield pool
-        return
-
-    async with pool as connection:
-        yield connection
+    yield pool
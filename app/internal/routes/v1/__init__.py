@@ -1,6 +1,7 @@
 """Routes for version 1 of the API."""
 
 from fastapi import APIRouter
+from app.internal.routes.v1.delivery import router as delivery_router
 from app.internal.routes.v1.email_correspondent import router as email_correspondent_router
 from app.internal.routes.v1.telegram_correspondent import router as telegram_correspondent_router
 from app.internal.routes.v1.text_template import router as text_template_router
@@ -11,7 +12,8 @@ router = APIRouter(
 )
 
 routes = sorted(
-    [email_correspondent_router,
+    [delivery_router,
+    email_correspondent_router,
     telegram_correspondent_router,
     text_template_router
     ],
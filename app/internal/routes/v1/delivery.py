@@ -0,0 +1,35 @@
+"""Routes for Delivery module."""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+
+from app.internal.services import Services
+from app.internal.services.v1 import DeliveryService
+from app.pkg.models import v1 as models
+from app.pkg.models.base.request_id_route import RequestIDRoute
+
+router = APIRouter(
+    prefix="/delivery",
+    tags=["Delivery"],
+    route_class=RequestIDRoute
+)
+
+
+@router.post(
+    "/events",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=models.DeliveryEventsIngestResponse,
+    description="""
+    Description: Accept batch of delivery events reported by the provider.
+    Used: Method is used by provider webhooks. Events are written in batches,
+    so statuses are updated with a short delay. Responds 503 without keeping
+    any event of the batch when the buffer is full, the batch must be retried.
+    """,
+)
+@inject
+async def ingest_delivery_events(
+    cmd: models.DeliveryEventsIngestCommand,
+    delivery_service: DeliveryService = Depends(
+        Provide[Services.v1.delivery_service]),
+) -> models.DeliveryEventsIngestResponse:
+    return await delivery_service.ingest_delivery_events(cmd)
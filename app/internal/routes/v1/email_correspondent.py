@@ -6,15 +6,16 @@ from uuid import UUID
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, status, Query
 
+from app.internal.pkg.middlewares.unit_of_work_route import UnitOfWorkRoute
 from app.internal.services import Services
 from app.internal.services.v1 import EmailCorrespondentService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.settings import settings
 
 router = APIRouter(
     prefix="/email_correspondent",
     tags=["Email Correspondent"],
-    route_class=RequestIDRoute
+    route_class=UnitOfWorkRoute
 )
 
 
@@ -38,7 +39,7 @@ async def create_correspondent(
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=list[models.EmailCorrespondentResponse],
+    response_model=models.Page[models.EmailCorrespondentResponse],
     description="""
     Description: Get list email correspondents.
     Used: Method is used to get email correspondents.
@@ -47,14 +48,18 @@ async def create_correspondent(
 @inject
 async def get_email_correspondents(
     email_correspondent_id: Annotated[UUID, Query(..., description="Email correspondent id.")] = None,
-    email_correspondent_name: Annotated[str, Query(..., description="Email correspondent name")] = None,
+    email_correspondent_name: Annotated[str, Query(..., min_length=settings.SEARCH.MIN_LENGTH, description="Substring of email correspondent name.")] = None,
     email_correspondent_is_active: Annotated[bool, Query(..., description="Email correspondent is active")] = None,
+    cursor: Annotated[str, Query(description="Cursor of the page, next_cursor of the previous one.")] = None,
+    limit: Annotated[int, Query(ge=1, le=settings.PAGINATION.MAX_LIMIT, description="Page size.")] = settings.PAGINATION.DEFAULT_LIMIT,
     email_correspondent_service: EmailCorrespondentService = Depends(Provide[Services.v1.email_correspondent_service]),
-) -> list[models.EmailCorrespondentResponse]:
+) -> models.Page[models.EmailCorrespondentResponse]:
     query = models.EmailCorrespondentReadQuery(
             email_correspondent_id=email_correspondent_id,
             email_correspondent_name=email_correspondent_name,
             email_correspondent_is_active=email_correspondent_is_active,
+            cursor=models.PageCursor.decode(cursor) if cursor else None,
+            limit=limit,
         )
     return await email_correspondent_service.get_email_correspondent(query)
 
@@ -6,15 +6,16 @@ from uuid import UUID
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, status, Query
 
+from app.internal.pkg.middlewares.unit_of_work_route import UnitOfWorkRoute
 from app.internal.services import Services
 from app.internal.services.v1 import TelegramCorrespondentService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.settings import settings
 
 router = APIRouter(
     prefix="/telegram_correspondent",
     tags=["Telegram Correspondent"],
-    route_class=RequestIDRoute
+    route_class=UnitOfWorkRoute
 )
 
 
@@ -39,7 +40,7 @@ async def create_correspondent(
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=list[models.TelegramCorrespondentResponse],
+    response_model=models.Page[models.TelegramCorrespondentResponse],
     description="""
     Description: Get all telegram correspondents.
     Used: Method is used to get all telegram correspondents.
@@ -48,15 +49,19 @@ async def create_correspondent(
 @inject
 async def get_telegram_correspondents(
     telegram_correspondent_id: Annotated[UUID, Query(..., description="Telegram correspondent id.")] = None,
-    telegram_correspondent_name: Annotated[str, Query(..., description="Telegram correspondent name")] = None,
+    telegram_correspondent_name: Annotated[str, Query(..., min_length=settings.SEARCH.MIN_LENGTH, description="Substring of telegram correspondent name.")] = None,
     telegram_correspondent_is_active: Annotated[bool, Query(..., description="Telegram correspondent is active")] = None,
+    cursor: Annotated[str, Query(description="Cursor of the page, next_cursor of the previous one.")] = None,
+    limit: Annotated[int, Query(ge=1, le=settings.PAGINATION.MAX_LIMIT, description="Page size.")] = settings.PAGINATION.DEFAULT_LIMIT,
     telegram_correspondent_service: TelegramCorrespondentService = Depends(
         Provide[Services.v1.telegram_correspondent_service]),
-) -> list[models.TelegramCorrespondentResponse]:
+) -> models.Page[models.TelegramCorrespondentResponse]:
     query = models.TelegramCorrespondentReadQuery(
             telegram_correspondent_id=telegram_correspondent_id,
             telegram_correspondent_name=telegram_correspondent_name,
             telegram_correspondent_is_active=telegram_correspondent_is_active,
+            cursor=models.PageCursor.decode(cursor) if cursor else None,
+            limit=limit,
         )
     return await telegram_correspondent_service.get_telegram_correspondent(query)
 
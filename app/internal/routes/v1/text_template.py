@@ -6,16 +6,17 @@ from uuid import UUID
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, status, Query
 
+from app.internal.pkg.middlewares.unit_of_work_route import UnitOfWorkRoute
 from app.internal.services import Services
 from app.internal.services.v1 import TextTemplateService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
 from app.pkg.models.v1 import ChannelEnum
+from app.pkg.settings import settings
 
 router = APIRouter(
     prefix="/text-template",
     tags=["Text Template"],
-    route_class=RequestIDRoute
+    route_class=UnitOfWorkRoute
 )
 
 
@@ -37,7 +38,7 @@ async def create_text_template(
 @router.get(
     "/",
     status_code=status.HTTP_201_CREATED,
-    response_model=list[models.TextTemplate],
+    response_model=models.Page[models.TextTemplate],
     description="""
     """,
 )
@@ -48,20 +49,27 @@ async def get_text_template(
     text_template_is_active: Annotated[
         bool, Query(..., description="Text template is active.")] = None,
     text_template_code: Annotated[
-        str, Query(..., description="Text template code.")] = None,
+        str, Query(..., min_length=settings.SEARCH.MIN_LENGTH, description="Substring of text template code.")] = None,
     text_template_subject: Annotated[
         str, Query(..., description="Text template subject.")] = None,
     text_template_channel: Annotated[
         ChannelEnum, Query(..., description="Text template channel.")] = None,
+    cursor: Annotated[
+        str, Query(description="Cursor of the page, next_cursor of the previous one.")] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.PAGINATION.MAX_LIMIT, description="Page size.")
+    ] = settings.PAGINATION.DEFAULT_LIMIT,
     text_template_service: TextTemplateService = Depends(
         Provide[Services.v1.text_template_service]),
-) -> list[models.TextTemplate]:
+) -> models.Page[models.TextTemplate]:
     query = models.TextTemplateReadQuery(
         text_template_id=text_template_id,
         text_template_is_active=text_template_is_active,
         text_template_code=text_template_code,
         text_template_subject=text_template_subject,
         text_template_channel=text_template_channel,
+        cursor=models.PageCursor.decode(cursor) if cursor else None,
+        limit=limit,
     )
     return await text_template_service.get_text_template(query)
 
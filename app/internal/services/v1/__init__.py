@@ -4,6 +4,8 @@ from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories
 from app.internal.repository.v1 import postgresql, rabbitmq, redis
+from app.internal.services.v1.delivery import DeliveryService
+from app.internal.services.v1.delivery_event_buffer import DeliveryEventBuffer
 from app.internal.services.v1.message import MessageService
 from app.internal.services.v1.recipient import RecipientService
 from app.internal.services.v1.telegram_correspondent_service import TelegramCorrespondentService
@@ -52,9 +54,15 @@ class Services(containers.DeclarativeContainer):
         message_repository=postgres_repositories.message_repository,
     )
 
-    delivery_service = providers.Factory(RecipientService)
+    delivery_event_buffer = providers.Singleton(
+        DeliveryEventBuffer,
+        delivery_repository=postgres_repositories.delivery_repository,
+    )
+
+    delivery_service = providers.Factory(DeliveryService)
     delivery_service.add_attributes(
         delivery_repository=postgres_repositories.delivery_repository,
+        delivery_event_buffer=delivery_event_buffer,
     )
 
     recipient_service = providers.Factory(RecipientService)
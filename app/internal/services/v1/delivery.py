@@ -3,6 +3,7 @@
 from logging import Logger
 
 from app.internal.repository.v1.postgresql import DeliveryRepository
+from app.internal.services.v1.delivery_event_buffer import DeliveryEventBuffer
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 from app.pkg.models.v1.exceptions.repository import DriverError, EmptyResult
@@ -11,7 +12,33 @@ __all__ = ["DeliveryService"]
 
 
 class DeliveryService:
-    """Recipient service class."""
+    """Delivery service class."""
 
     delivery_repository: DeliveryRepository
-    __logger: Logger = get_logger(__name__)
\ No newline at end of file
+    delivery_event_buffer: DeliveryEventBuffer
+    __logger: Logger = get_logger(__name__)
+
+    async def ingest_delivery_events(
+        self,
+        cmd: models.DeliveryEventsIngestCommand,
+    ) -> models.DeliveryEventsIngestResponse:
+        """Accept status transitions reported by the provider.
+
+        Events are buffered and written in batches, see
+        :class:`.DeliveryEventBuffer`.
+
+        Args:
+            cmd: Batch of events.
+
+        Returns:
+            Count of accepted events.
+
+        Raises:
+            DeliveryEventsOverloaded: Buffer of events is full and can not be
+                written, the provider must retry the batch.
+        """
+
+        await self.delivery_event_buffer.add(cmd.delivery_events)
+        return models.DeliveryEventsIngestResponse(
+            delivery_events_accepted=len(cmd.delivery_events),
+        )
@@ -0,0 +1,148 @@
+"""Buffer of delivery events reported by providers."""
+
+import asyncio
+from logging import Logger
+from typing import Iterable
+
+from app.internal.repository.v1.postgresql import DeliveryRepository
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.delivery import DeliveryEventsOverloaded
+from app.pkg.settings import settings
+
+__all__ = ["DeliveryEventBuffer"]
+
+#: dict[str, int]: Order of reported statuses, the furthest one of a delivery
+#  is kept in the buffer.
+_EVENT_RANK = {
+    models.DeliveryEventStatusEnum.DELIVERED.value: 0,
+    models.DeliveryEventStatusEnum.FAILED.value: 0,
+    models.DeliveryEventStatusEnum.BOUNCED.value: 0,
+    models.DeliveryEventStatusEnum.OPENED.value: 1,
+    models.DeliveryEventStatusEnum.CLICKED.value: 2,
+}
+
+
+class DeliveryEventBuffer:
+    """Collect provider events in memory and write them in batches.
+
+    Events of one delivery are merged by ``delivery_provider_message_id``, only
+    the furthest status is written. The buffer is written with one set-based
+    statement, see :meth:`.DeliveryRepository.update_statuses_by_provider_message_id`,
+    when it holds ``settings.WEBHOOK.BATCH_SIZE`` deliveries or
+    ``settings.WEBHOOK.FLUSH_MS`` milliseconds after its first event.
+
+    Buffer never holds more than ``settings.WEBHOOK.BUFFER_SIZE`` deliveries,
+    including the ones being written. When events do not fit, :meth:`.add`
+    writes the buffer itself, so providers get slower responses instead of the
+    process growing memory. If they still do not fit, e.g. PostgreSQL is down,
+    the request is rejected and none of its events are kept, so the retry of
+    the provider is not a duplicate. Flushes are run one at a time.
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(self, delivery_repository: DeliveryRepository):
+        self.delivery_repository = delivery_repository
+        #: dict[str, DeliveryEvent]: Furthest event by provider message ID.
+        self.__pending: dict[str, models.DeliveryEvent] = {}
+        #: int: Count of deliveries being written by the running flush.
+        self.__writing = 0
+        self.__timer: asyncio.TimerHandle | None = None
+        self.__flushes: set[asyncio.Task] = set()
+        self.__lock = asyncio.Lock()
+
+    async def add(self, events: list[models.DeliveryEvent]) -> None:
+        """Buffer the events.
+
+        Args:
+            events: Events reported by the provider.
+
+        Raises:
+            DeliveryEventsOverloaded: Events do not fit the buffer, it can not
+                be written. None of the events are kept.
+        """
+
+        if not self.__fits(events):
+            await self.flush()
+            if not self.__fits(events):
+                raise DeliveryEventsOverloaded
+
+        self.__merge(events)
+        if len(self.__pending) >= settings.WEBHOOK.BATCH_SIZE:
+            self.__start_flush()
+        elif self.__timer is None:
+            self.__timer = asyncio.get_running_loop().call_later(
+                settings.WEBHOOK.FLUSH_MS / 1000,
+                self.__start_flush,
+            )
+
+    async def flush(self) -> None:
+        """Write all buffered events.
+
+        Failed events are returned to the buffer and retried with the next
+        flush.
+        """
+
+        async with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__pending:
+                return
+
+            pending, self.__pending = self.__pending, {}
+            self.__writing = len(pending)
+            try:
+                await self.delivery_repository.update_statuses_by_provider_message_id(
+                    cmds=list(pending.values()),
+                )
+            except Exception:
+                self.__logger.exception("Failed to write %s delivery events.", len(pending))
+                # Events buffered meanwhile were counted with the written ones,
+                # so the merged buffer still fits.
+                buffered, self.__pending = self.__pending, pending
+                self.__merge(buffered.values())
+                self.__timer = asyncio.get_running_loop().call_later(
+                    settings.WEBHOOK.FLUSH_MS / 1000,
+                    self.__start_flush,
+                )
+            finally:
+                self.__writing = 0
+
+    async def close(self) -> None:
+        """Wait for running flushes and write the rest of the buffer."""
+
+        await asyncio.gather(*self.__flushes, return_exceptions=True)
+        await self.flush()
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__pending:
+            self.__logger.error("%s delivery events are lost.", len(self.__pending))
+
+    def __fits(self, events: list[models.DeliveryEvent]) -> bool:
+        """Check the buffer has room for deliveries of the events."""
+
+        new = {event.delivery_provider_message_id for event in events} - self.__pending.keys()
+        return self.__writing + len(self.__pending) + len(new) <= settings.WEBHOOK.BUFFER_SIZE
+
+    def __merge(self, events: Iterable[models.DeliveryEvent]) -> None:
+        """Keep the furthest event of each delivery."""
+
+        for event in events:
+            current = self.__pending.get(event.delivery_provider_message_id)
+            if current is None or (
+                _EVENT_RANK[event.delivery_status] >= _EVENT_RANK[current.delivery_status]
+            ):
+                self.__pending[event.delivery_provider_message_id] = event
+
+    def __start_flush(self) -> None:
+        """Run flush in background."""
+
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        task = asyncio.create_task(self.flush())
+        self.__flushes.add(task)
+        task.add_done_callback(self.__flushes.discard)
@@ -1,9 +1,15 @@
 """Models for EmailCorrespondent object."""
 
+from functools import partial
 from logging import Logger
+from uuid import UUID
+
 from passlib.handlers.bcrypt import bcrypt
 
+from app.internal.pkg.cache import LookupCache
 from app.internal.repository.v1.postgresql import EmailCorrespondentRepository
+from app.internal.repository.v1.postgresql.connection import after_commit
+from app.pkg.cache import CacheStats
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 from app.pkg.models.v1.exceptions.correspondent import CorrespondentCreateError, CorrespondentReadError, \
@@ -18,6 +24,13 @@ class EmailCorrespondentService:
 
     email_correspondent_repository: EmailCorrespondentRepository
     __logger: Logger = get_logger(__name__)
+    #: LookupCache: Process-wide cache of correspondents by name.
+    __cache: LookupCache[str, models.EmailCorrespondentResponse] = LookupCache(
+        namespace="email_correspondent",
+        model=models.EmailCorrespondentResponse,
+        identity=lambda correspondent: correspondent.email_correspondent_id,
+        secret_fields=("email_password",),
+    )
 
     async def create_correspondent(
         self,
@@ -44,22 +57,64 @@ class EmailCorrespondentService:
     async def get_email_correspondent(
         self,
         query: models.EmailCorrespondentReadQuery
-    ) -> list[models.EmailCorrespondentResponse]:
+    ) -> models.Page[models.EmailCorrespondentResponse]:
         """Retrieves email correspondents by optional filters.
 
         Args:
             query (models.EmailCorrespondentReadQuery): Filters such as id, name, and is_active.
 
         Returns:
-            list[models.EmailCorrespondentResponse]: Matching correspondents.
+            models.Page[models.EmailCorrespondentResponse]: Page of matching correspondents.
         """
 
         try:
-            return await self.email_correspondent_repository.read(query)
+            rows = await self.email_correspondent_repository.read(query)
         except DriverError as exc:
             self.__logger.exception("Failed to read email correspondents")
             raise CorrespondentReadError from exc
 
+        return models.Page[models.EmailCorrespondentResponse].from_rows(
+            rows=rows,
+            limit=query.limit,
+            key=lambda row: models.PageCursor(
+                create_at=row.email_correspondent_create_at,
+                id=row.email_correspondent_id,
+                rank=row.email_correspondent_search_rank,
+            ),
+        )
+
+    async def get_email_correspondent_by_name(
+        self,
+        query: models.EmailCorrespondentReadByNameQuery,
+    ) -> models.EmailCorrespondentResponse:
+        """Retrieves email correspondent by name.
+
+        Result is cached in-process and in redis, see ``settings.CACHE``. The
+        password is not cached in redis, it is kept in-process and read by id
+        on a redis hit of a row not seen by the process.
+
+        Args:
+            query (models.EmailCorrespondentReadByNameQuery): Name of the correspondent.
+
+        Returns:
+            models.EmailCorrespondentResponse: Found correspondent.
+        """
+
+        try:
+            return await self.__cache.get_or_load(
+                query.email_correspondent_name,
+                lambda: self.email_correspondent_repository.read_by_name(query=query),
+                lambda payload: self.email_correspondent_repository.read_secrets(
+                    query=models.EmailCorrespondentReadSecretsQuery.model_validate(payload),
+                ),
+            )
+        except EmptyResult as exc:
+            self.__logger.exception("Email correspondent not found")
+            raise CorrespondentNotFound from exc
+        except DriverError as exc:
+            self.__logger.exception("Failed to read email correspondent")
+            raise CorrespondentReadError from exc
+
     async def update_email_correspondent(
         self,
         cmd: models.EmailCorrespondentUpdateCommand,
@@ -74,7 +129,7 @@ class EmailCorrespondentService:
         """
 
         try:
-            return await self.email_correspondent_repository.update(cmd)
+            correspondent = await self.email_correspondent_repository.update(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to update email correspondent")
             raise CorrespondentNotFound from exc
@@ -85,6 +140,9 @@ class EmailCorrespondentService:
             self.__logger.exception("Failed to update email correspondent")
             raise CorrespondentUpdateError from exc
 
+        await after_commit(partial(self.invalidate_cache, cmd.email_correspondent_id))
+        return correspondent
+
     async def delete_email_correspondent(
         self,
         cmd: models.EmailCorrespondentDeleteCommand,
@@ -99,10 +157,29 @@ class EmailCorrespondentService:
         """
 
         try:
-            return await self.email_correspondent_repository.delete(cmd)
+            correspondent = await self.email_correspondent_repository.delete(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to delete email correspondent")
             raise CorrespondentNotFound from exc
         except DriverError as exc:
             self.__logger.exception("Failed to delete email correspondent")
             raise CorrespondentDeleteError from exc
+
+        await after_commit(partial(self.invalidate_cache, cmd.email_correspondent_id))
+        return correspondent
+
+    @classmethod
+    async def invalidate_cache(cls, email_correspondent_id: UUID) -> None:
+        """Drop cached lookups of the correspondent on every replica.
+
+        Args:
+            email_correspondent_id (UUID): Identifier of the changed correspondent.
+        """
+
+        await cls.__cache.invalidate(email_correspondent_id)
+
+    @classmethod
+    def cache_stats(cls) -> list[CacheStats]:
+        """Get hit/miss counters of the correspondent cache."""
+
+        return cls.__cache.stats()
@@ -1,8 +1,13 @@
 """Models for TelegramCorrespondent object."""
 
+from functools import partial
 from logging import Logger
+from uuid import UUID
 
+from app.internal.pkg.cache import LookupCache
 from app.internal.repository.v1.postgresql import TelegramCorrespondentRepository
+from app.internal.repository.v1.postgresql.connection import after_commit
+from app.pkg.cache import CacheStats
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 from app.pkg.models.v1.exceptions.correspondent import CorrespondentCreateError, CorrespondentReadError, \
@@ -17,6 +22,13 @@ class TelegramCorrespondentService:
 
     telegram_correspondent_repository: TelegramCorrespondentRepository
     __logger: Logger = get_logger(__name__)
+    #: LookupCache: Process-wide cache of correspondents by name.
+    __cache: LookupCache[str, models.TelegramCorrespondentResponse] = LookupCache(
+        namespace="telegram_correspondent",
+        model=models.TelegramCorrespondentResponse,
+        identity=lambda correspondent: correspondent.telegram_correspondent_id,
+        secret_fields=("telegram_bot_token",),
+    )
 
     async def create_telegram_correspondent(
             self,
@@ -43,18 +55,60 @@ class TelegramCorrespondentService:
     async def get_telegram_correspondent(
             self,
             query: models.TelegramCorrespondentReadQuery
-    ) -> list[models.TelegramCorrespondentResponse]:
+    ) -> models.Page[models.TelegramCorrespondentResponse]:
         """Retrieves telegram correspondents matching the given filters.
 
         Args:
             query (models.TelegramCorrespondentReadQuery): Query containing filters for retrieving correspondents.
 
         Returns:
-            list[models.TelegramCorrespondentResponse]: The list of telegram correspondents matching the filters.
+            models.Page[models.TelegramCorrespondentResponse]: Page of telegram correspondents matching the filters.
         """
 
         try:
-            return await self.telegram_correspondent_repository.read(query)
+            rows = await self.telegram_correspondent_repository.read(query)
+        except DriverError as exc:
+            self.__logger.exception("Failed to read telegram correspondent.")
+            raise CorrespondentReadError from exc
+
+        return models.Page[models.TelegramCorrespondentResponse].from_rows(
+            rows=rows,
+            limit=query.limit,
+            key=lambda row: models.PageCursor(
+                create_at=row.telegram_correspondent_create_at,
+                id=row.telegram_correspondent_id,
+                rank=row.telegram_correspondent_search_rank,
+            ),
+        )
+
+    async def get_telegram_correspondent_by_name(
+            self,
+            query: models.TelegramCorrespondentReadByNameQuery
+    ) -> models.TelegramCorrespondentResponse:
+        """Retrieves telegram correspondent by name.
+
+        Result is cached in-process and in redis, see ``settings.CACHE``. The
+        bot token is not cached in redis, it is kept in-process and read by id
+        on a redis hit of a row not seen by the process.
+
+        Args:
+            query (models.TelegramCorrespondentReadByNameQuery): Name of the correspondent.
+
+        Returns:
+            models.TelegramCorrespondentResponse: Found correspondent.
+        """
+
+        try:
+            return await self.__cache.get_or_load(
+                query.telegram_correspondent_name,
+                lambda: self.telegram_correspondent_repository.read_by_name(query=query),
+                lambda payload: self.telegram_correspondent_repository.read_secrets(
+                    query=models.TelegramCorrespondentReadSecretsQuery.model_validate(payload),
+                ),
+            )
+        except EmptyResult as exc:
+            self.__logger.exception("Telegram correspondent not found.")
+            raise CorrespondentNotFound from exc
         except DriverError as exc:
             self.__logger.exception("Failed to read telegram correspondent.")
             raise CorrespondentReadError from exc
@@ -73,7 +127,7 @@ class TelegramCorrespondentService:
         """
 
         try:
-            return await self.telegram_correspondent_repository.update(cmd)
+            correspondent = await self.telegram_correspondent_repository.update(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to update telegram correspondent.")
             raise CorrespondentNotFound from exc
@@ -84,6 +138,9 @@ class TelegramCorrespondentService:
             self.__logger.exception("Failed to update telegram correspondent.")
             raise CorrespondentUpdateError from exc
 
+        await after_commit(partial(self.invalidate_cache, cmd.telegram_correspondent_id))
+        return correspondent
+
     async def delete_telegram_correspondent(
             self,
             cmd: models.TelegramCorrespondentDeleteCommand
@@ -98,10 +155,29 @@ class TelegramCorrespondentService:
         """
 
         try:
-            return await self.telegram_correspondent_repository.delete(cmd)
+            correspondent = await self.telegram_correspondent_repository.delete(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to delete telegram correspondent.")
             raise CorrespondentDeleteError from exc
         except DriverError as exc:
             self.__logger.exception("Failed to delete telegram correspondent.")
             raise CorrespondentDeleteError from exc
+
+        await after_commit(partial(self.invalidate_cache, cmd.telegram_correspondent_id))
+        return correspondent
+
+    @classmethod
+    async def invalidate_cache(cls, telegram_correspondent_id: UUID) -> None:
+        """Drop cached lookups of the correspondent on every replica.
+
+        Args:
+            telegram_correspondent_id (UUID): Identifier of the changed correspondent.
+        """
+
+        await cls.__cache.invalidate(telegram_correspondent_id)
+
+    @classmethod
+    def cache_stats(cls) -> list[CacheStats]:
+        """Get hit/miss counters of the correspondent cache."""
+
+        return cls.__cache.stats()
@@ -1,14 +1,22 @@
 """Models for Text template object."""
 
+from datetime import datetime
+from functools import partial
 from logging import Logger
 from typing import Any
+from uuid import UUID
 
+from app.internal.pkg.cache import LookupCache
+from app.internal.repository.v1.postgresql.connection import after_commit
 from app.internal.repository.v1.postgresql.text_template import TextTemplateRepository
+from app.pkg.cache import CacheStats, TTLCache
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 from app.pkg.models.v1.exceptions.repository import DriverError, EmptyResult
 from app.pkg.models.v1.exceptions.text_template import TextTemplateCreateError, TextTemplateReadError, \
-    TextTemplateUpdateError, TextTemplateNotFound, TextTemplateDeleteError
+    TextTemplateUpdateError, TextTemplateNotFound, TextTemplateDeleteError, TextTemplateContentError
+from app.pkg.settings import settings
+from app.pkg.template import RenderPlan, TemplateError, compile_template
 
 __all__ = ["TextTemplateService"]
 
@@ -18,6 +26,18 @@ class TextTemplateService:
 
     text_template_repository: TextTemplateRepository
     __logger: Logger = get_logger(__name__)
+    #: LookupCache: Process-wide cache of templates by (code, channel).
+    __cache: LookupCache[tuple[str, str], models.TextTemplate] = LookupCache(
+        namespace="text_template",
+        model=models.TextTemplate,
+        identity=lambda text_template: text_template.text_template_id,
+    )
+    #: TTLCache: Process-wide cache of render plans by (id, update timestamp).
+    __render_plans: TTLCache[tuple[UUID, datetime | None], RenderPlan] = TTLCache(
+        name="text_template_render_plan",
+        max_size=settings.CACHE.MAX_SIZE,
+        ttl=settings.CACHE.TTL,
+    )
 
     async def create_text_template(
         self,
@@ -32,27 +52,68 @@ class TextTemplateService:
             models.TextTemplate: The created text template object.
         """
 
+        self.__validate_content(cmd.text_template_content, cmd.text_template_variables)
         try:
-            return await self.text_template_repository.create(cmd)
+            text_template = await self.text_template_repository.create(cmd)
         except DriverError as exc:
             self.__logger.exception("Failed to create text template.")
             raise TextTemplateCreateError from exc
 
+        await after_commit(self.__cache.invalidate)
+        return text_template
+
     async def get_text_template(
         self,
         query: models.TextTemplateReadQuery
-    ) -> list[models.TextTemplate]:
+    ) -> models.Page[models.TextTemplate]:
         """Retrieves text templates based on provided filters.
 
         Args:
             query (models.TextTemplateReadQuery): Query with filters for searching templates.
 
         Returns:
-            list[models.TextTemplate]: A list of matched text templates.
+            models.Page[models.TextTemplate]: Page of matched text templates.
+        """
+
+        try:
+            rows = await self.text_template_repository.read(query)
+        except DriverError as exc:
+            self.__logger.exception("Failed to read text template.")
+            raise TextTemplateReadError from exc
+
+        return models.Page[models.TextTemplate].from_rows(
+            rows=rows,
+            limit=query.limit,
+            key=lambda row: models.PageCursor(
+                create_at=row.text_template_create_at,
+                id=row.text_template_id,
+                rank=row.text_template_search_rank,
+            ),
+        )
+
+    async def get_text_template_by_code(
+        self,
+        query: models.TextTemplateReadByCodeQuery
+    ) -> models.TextTemplate:
+        """Retrieves text template by code and channel.
+
+        Result is cached in-process and in redis, see ``settings.CACHE``.
+
+        Args:
+            query (models.TextTemplateReadByCodeQuery): Code and channel of the template.
+
+        Returns:
+            models.TextTemplate: The found text template.
         """
 
         try:
-            return await self.text_template_repository.read(query)
+            return await self.__cache.get_or_load(
+                (query.text_template_code, query.text_template_channel),
+                lambda: self.text_template_repository.read_by_code(query=query),
+            )
+        except EmptyResult as exc:
+            self.__logger.exception("Text template not found.")
+            raise TextTemplateNotFound from exc
         except DriverError as exc:
             self.__logger.exception("Failed to read text template.")
             raise TextTemplateReadError from exc
@@ -70,8 +131,10 @@ class TextTemplateService:
             models.TextTemplate: The updated text template object.
         """
 
+        if cmd.text_template_content is not None:
+            self.__validate_content(cmd.text_template_content, cmd.text_template_variables)
         try:
-            return await self.text_template_repository.update(cmd)
+            text_template = await self.text_template_repository.update(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to update text template.")
             raise TextTemplateNotFound from exc
@@ -79,6 +142,9 @@ class TextTemplateService:
             self.__logger.exception("Failed to update text template.")
             raise TextTemplateUpdateError from exc
 
+        await after_commit(partial(self.invalidate_cache, cmd.text_template_id))
+        return text_template
+
     async def delete_text_template(
         self,
         cmd: models.TextTemplateDeleteCommand
@@ -93,7 +159,7 @@ class TextTemplateService:
         """
 
         try:
-            return await self.text_template_repository.delete(cmd)
+            text_template = await self.text_template_repository.delete(cmd)
         except EmptyResult as exc:
             self.__logger.exception("Failed to delete text template.")
             raise TextTemplateNotFound from exc
@@ -101,12 +167,69 @@ class TextTemplateService:
             self.__logger.exception("Failed to delete text template.")
             raise TextTemplateDeleteError from exc
 
-    @staticmethod
-    async def render_template_content(
+        await after_commit(partial(self.invalidate_cache, cmd.text_template_id))
+        return text_template
+
+    @classmethod
+    async def invalidate_cache(cls, text_template_id: UUID) -> None:
+        """Drop cached lookups of the text template on every replica.
+
+        Args:
+            text_template_id (UUID): Identifier of the changed text template.
+        """
+
+        await cls.__cache.invalidate(text_template_id)
+
+    @classmethod
+    def cache_stats(cls) -> list[CacheStats]:
+        """Get hit/miss counters of the text template cache."""
+
+        return cls.__cache.stats()
+
+    @classmethod
+    def render_template_content(
+        cls,
         template: models.TextTemplate,
         context: dict[str, Any]
     ) -> str:
+        """Render content of the text template.
+
+        Content is compiled once per template version, see
+        :func:`app.pkg.template.compile_template`.
+
+        Args:
+            template (models.TextTemplate): Template to render.
+            context (dict[str, Any]): Values of the template variables.
+
+        Raises:
+            TemplateError: Content is invalid or some variables are missing.
+
+        Returns:
+            str: Rendered content.
+        """
+
+        key = (template.text_template_id, template.text_template_update_at)
+        plan = cls.__render_plans.get(key)
+        if plan is None:
+            plan = compile_template(
+                template.text_template_content,
+                template.text_template_variables or None,
+            )
+            cls.__render_plans.set(key, plan)
+        return plan.render(context)
+
+    def __validate_content(self, content: str, variables: dict[str, Any] | None) -> None:
+        """Check placeholders of the content against declared variables.
+
+        Empty ``variables`` means the template declares nothing, so only the
+        syntax of placeholders is checked.
+
+        Raises:
+            TextTemplateContentError: Content is invalid.
+        """
+
         try:
-            return template.text_template_content.format(**context)
-        except KeyError as e:
-            raise ValueError(f"Missing variable in context: {e}")
+            compile_template(content, variables or None)
+        except TemplateError as exc:
+            self.__logger.warning("Invalid text template content: %s", exc)
+            raise TextTemplateContentError(message=str(exc)) from exc
@@ -5,7 +5,12 @@ from dependency_injector import containers, providers
 from app.internal.repository import Repositories
 from app.internal.repository.v1 import postgresql, rabbitmq, redis
 from app.internal.services import Services
-from app.internal.workers.email_sender import EmailSenderWorker
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.internal.workers.history_writer import DeliveryHistoryWriter
+from app.internal.workers.idempotency import IdempotencyGuard
+from app.internal.workers.rate_limiter import RateLimiter
+from app.internal.workers.senders import EmailSender, TelegramSender
+from app.internal.workers.status_writer import MessageStatusWriter
 from app.pkg.clients import Clients
 from app.pkg.settings import settings
 
@@ -32,13 +37,53 @@ class Workers(containers.DeclarativeContainer):
         Repositories.v1.postgres,
     )  # type: ignore
 
-    mail_sender_worker = providers.Singleton(EmailSenderWorker)
-    mail_sender_worker.add_attributes(
+    idempotency_guard = providers.Singleton(
+        IdempotencyGuard,
         redis_repository=redis_repositories.base_redis_repository,
-        rabbitmq_repository=rabbitmq_repositories.base_repository,
-        email_correspondent_repository=postgres_repositories.email_correspondent_repository,
-        text_template_repository=postgres_repositories.text_template_repository,
+    )
+
+    rate_limiter = providers.Singleton(
+        RateLimiter,
+        redis_repository=redis_repositories.base_redis_repository,
+    )
+
+    status_writer = providers.Singleton(
+        MessageStatusWriter,
         message_repository=postgres_repositories.message_repository,
-        text_template_service=services.v1.text_template_service,
+    )
+
+    history_writer = providers.Singleton(
+        DeliveryHistoryWriter,
+        recipient_repository=postgres_repositories.recipient_repository,
+        delivery_repository=postgres_repositories.delivery_repository,
+    )
+
+    email_sender = providers.Singleton(
+        EmailSender,
+        concurrency=configuration.SMTP.CONCURRENCY,
+    )
+    email_sender.add_attributes(
+        email_correspondent_service=services.v1.email_correspondent_service,
         mail_client=clients.v1.email_client,
+        rate_limiter=rate_limiter,
+    )
+
+    telegram_sender = providers.Singleton(
+        TelegramSender,
+        concurrency=configuration.TELEGRAM.CONCURRENCY,
+    )
+    telegram_sender.add_attributes(
+        telegram_correspondent_service=services.v1.telegram_correspondent_service,
+        telegram_client=clients.v1.telegram_client,
+        rate_limiter=rate_limiter,
+    )
+
+    dispatcher_worker = providers.Singleton(ChannelDispatcherWorker)
+    dispatcher_worker.add_attributes(
+        rabbitmq_repository=rabbitmq_repositories.base_repository,
+        text_template_service=services.v1.text_template_service,
+        idempotency_guard=idempotency_guard,
+        status_writer=status_writer,
+        history_writer=history_writer,
+        senders=providers.List(email_sender, telegram_sender),
     )
@@ -0,0 +1,21 @@
+"""Run workers apart from the API server.
+
+Examples:
+    ::
+
+        $ python -m app.internal.workers
+"""
+
+from app.internal.workers.process import run_worker_process
+from app.internal.workers.supervisor import WorkerSupervisor
+from app.pkg.settings import settings
+
+if __name__ == "__main__":
+    WorkerSupervisor(
+        target=run_worker_process,
+        processes=settings.WORKER.PROCESSES,
+        restart_delay=settings.WORKER.RESTART_DELAY,
+        max_restart_delay=settings.WORKER.MAX_RESTART_DELAY,
+        # Children drain in-flight messages before exit.
+        stop_timeout=settings.WORKER.DRAIN_TIMEOUT + 10,
+    ).run()
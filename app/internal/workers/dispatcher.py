@@ -0,0 +1,608 @@
+"""Module for channel dispatcher worker."""
+
+import asyncio
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging import Logger
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from aio_pika.abc import AbstractIncomingMessage
+from pydantic import ValidationError
+
+from app.internal.repository.v1.postgresql.connection import unit_of_work
+from app.internal.repository.v1.rabbitmq import BaseRepository
+from app.internal.services.v1 import TextTemplateService
+from app.internal.workers.history_writer import DeliveryHistoryWriter
+from app.internal.workers.idempotency import EventInProgress, IdempotencyGuard
+from app.internal.workers.payload import PayloadDecoder
+from app.internal.workers.retry_policy import RetryPolicy
+from app.internal.workers.send_batch import SendBatch, current_batch
+from app.internal.workers.senders import ChannelSender, RecipientAddressMissing
+from app.internal.workers.status_writer import MessageStatusWriter
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.correspondent import CorrespondentNotFound
+from app.pkg.models.v1.exceptions.text_template import TextTemplateNotFound
+from app.pkg.settings import settings
+from app.pkg.template import TemplateError
+
+__all__ = ["ChannelDispatcherWorker", "ChannelNotSupported", "ChannelStats"]
+
+#: tuple: Errors of any channel that can not be fixed by a retry.
+_PERMANENT_ERRORS = (
+    ValidationError,
+    CorrespondentNotFound,
+    TextTemplateNotFound,
+    TemplateError,
+    RecipientAddressMissing,
+)
+
+
+class ChannelNotSupported(ValueError):
+    """No sender is registered for the channel of the message."""
+
+
+@dataclass(frozen=True)
+class ChannelStats:
+    """Snapshot of dispatcher counters of one channel.
+
+    Attributes:
+        channel: Channel of the messages.
+        sent: Count of sent messages.
+        failed: Count of failed send attempts.
+        retried: Count of deliveries scheduled for a retry.
+        dead: Count of deliveries moved to the dead-letter queue.
+        skipped: Count of redelivered events that are already processed.
+        postponed: Count of deliveries of events in progress on another
+            consumer, postponed without counting an attempt.
+    """
+
+    channel: str
+    sent: int
+    failed: int
+    retried: int
+    dead: int
+    skipped: int
+    postponed: int
+
+
+class ChannelDispatcherWorker:
+    """Worker dispatching notifications to senders of their channels.
+
+    Every delivery is decoded once into :class:`.MessageNotification`, then
+    its event is claimed, and the template of the event is looked up by
+    ``text_template_channel`` and rendered. The rendered message is handed
+    off to the :class:`.ChannelSender` registered for the channel. Sends of
+    each channel are limited by the ``concurrency`` of its sender, so a slow
+    channel never takes all send slots.
+
+    Queues:
+
+    * ``settings.RABBITMQ.NOTIFICATION_KEY``, the default channel is email;
+    * ``settings.RABBITMQ.TELEGRAM_KEY``, the default channel is Telegram.
+
+    Each queue has its high-priority lane.
+
+    ``channel`` of the message overrides the default channel of the queue.
+
+    If the message carries ``message_id``, its final status, ``sent`` or
+    ``failed``, is written behind by :class:`.MessageStatusWriter`.
+    """
+
+    rabbitmq_repository: BaseRepository
+    text_template_service: TextTemplateService
+    idempotency_guard: IdempotencyGuard
+    status_writer: MessageStatusWriter
+    history_writer: DeliveryHistoryWriter
+    senders: list[ChannelSender]
+    __logger: Logger = get_logger(__name__)
+    __retry_policy: RetryPolicy = RetryPolicy.from_settings()
+    __decoder: PayloadDecoder[models.MessageNotification] = PayloadDecoder(
+        models.MessageNotification,
+        schemas={"message_verified.v1", "message_notification.v1"},
+    )
+
+    def __init__(self):
+        #: set[asyncio.Task]: Deliveries being processed right now.
+        self.__in_flight: set[asyncio.Task] = set()
+        #: dict[str, ChannelEnum]: Default channel of the consumed queues.
+        self.__default_channels: dict[str, models.ChannelEnum] = {}
+        #: dict[ChannelEnum, asyncio.Semaphore]: Send slots of the channels.
+        self.__limits: dict[models.ChannelEnum, asyncio.Semaphore] = {}
+        #: Counter: Counters of the channels by (channel, outcome).
+        self.__counters: Counter[tuple[models.ChannelEnum, str]] = Counter()
+
+    async def listen_sending_message(self):
+        """Listen to the notification queues and dispatch incoming messages.
+
+        Messages of each queue are consumed from two lanes: the high-priority
+        lane, e.g. verification codes, and the bulk lane. Each lane has its own
+        channel prefetch and concurrency, so a backlog of bulk traffic never
+        delays messages of the high-priority lane.
+
+        Consumer mode is selected by ``settings.WORKER.CONSUMER_MODE``. In
+        ``batch`` mode only the bulk lane of ``settings.RABBITMQ.NOTIFICATION_KEY``
+        is batched, so messages of high-priority lanes never wait for a batch
+        to fill up. Failed sends are retried through delay queues, see
+        :meth:`.handle_delivery`.
+        """
+
+        routing_key = settings.RABBITMQ.NOTIFICATION_KEY
+        lanes, self.__default_channels = {}, {}
+        # Publishers route high-priority messages of these keys to their
+        # lanes, see :meth:`.BaseRepository.lane_routing_key`.
+        for key in self.rabbitmq_repository.laned_routing_keys():
+            channel = (
+                models.ChannelEnum.TELEGRAM if key == settings.RABBITMQ.TELEGRAM_KEY
+                else models.ChannelEnum.EMAIL
+            )
+            priority_lane = self.rabbitmq_repository.priority_queue_name(key)
+            lanes[priority_lane] = settings.WORKER.HIGH_PRIORITY_CONCURRENCY
+            lanes[key] = settings.WORKER.CONCURRENCY
+            self.__default_channels[priority_lane] = self.__default_channels[key] = channel
+        if settings.WORKER.CONSUMER_MODE == "sequential":
+            lanes = dict.fromkeys(lanes, 1)
+
+        self.__limits = {
+            sender.channel: asyncio.Semaphore(sender.concurrency)
+            for sender in self.senders
+        }
+
+        try:
+            for lane in lanes:
+                await self.rabbitmq_repository.declare_retry_queues(
+                    routing_key=lane,
+                    delays={
+                        attempt: self.__retry_policy.delay_cap(attempt)
+                        for attempt in self.__retry_policy.retry_levels
+                    },
+                    postpone_delay=settings.IDEMPOTENCY.POSTPONE_DELAY,
+                )
+        except Exception:
+            self.__logger.exception("Error declare retry queues in RebbitMQ.")
+            return
+
+        consumers = [
+            asyncio.create_task(
+                self.__listen_batched(lane)
+                if settings.WORKER.CONSUMER_MODE == "batch" and lane == routing_key
+                else self.__listen_lane(lane, concurrency=concurrency),
+            )
+            for lane, concurrency in lanes.items()
+        ]
+        try:
+            # Worker is restarted if any lane stops, so all lanes are stopped.
+            await asyncio.wait(consumers, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+
+    async def __listen_lane(self, routing_key: str, concurrency: int):
+        """Listen to the lane queue and process up to ``concurrency`` messages
+        at once.
+
+        Channel prefetch is equal to ``concurrency``, so the broker never
+        pushes more deliveries than the worker is able to process. Each
+        delivery is acked only after its own processing is finished.
+
+        Args:
+            routing_key: The routing key (queue name) of the lane.
+            concurrency: Max count of in-flight messages of the lane.
+        """
+
+        self.__logger.info(
+            "Start listen %s. Concurrency: %s.",
+            routing_key,
+            concurrency,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        try:
+            async for message in self.rabbitmq_repository.consume_queue(
+                routing_key=routing_key,
+                prefetch_count=concurrency,
+            ):
+                await semaphore.acquire()
+                task = self.__track(
+                    asyncio.create_task(self.handle_delivery(message, routing_key=routing_key)),
+                )
+                task.add_done_callback(lambda _: semaphore.release())
+        except Exception:
+            self.__logger.exception("Error listen queue from RebbitMQ.")
+
+    async def __listen_batched(self, routing_key: str):
+        """Listen to the lane queue and process deliveries in batches.
+
+        A batch is closed after ``settings.WORKER.BATCH_SIZE`` deliveries or
+        ``settings.WORKER.BATCH_WAIT_MS`` milliseconds after its first
+        delivery. Sends of senders supporting batches are grouped, see
+        :class:`.SendBatch`. Every delivery is still settled by its own result.
+
+        Args:
+            routing_key: The routing key (queue name) of the lane.
+        """
+
+        size = settings.WORKER.BATCH_SIZE
+        wait = settings.WORKER.BATCH_WAIT_MS / 1000
+        self.__logger.info("Start listen %s. Batch size: %s.", routing_key, size)
+
+        buffer: asyncio.Queue[AbstractIncomingMessage | None] = asyncio.Queue()
+        pump = asyncio.create_task(self.__pump(routing_key, prefetch_count=size, buffer=buffer))
+        loop = asyncio.get_running_loop()
+        try:
+            while (message := await buffer.get()) is not None:
+                batch = [message]
+                deadline = loop.time() + wait
+                while len(batch) < size:
+                    try:
+                        message = await asyncio.wait_for(buffer.get(), deadline - loop.time())
+                    except asyncio.TimeoutError:
+                        break
+                    if message is None:
+                        break
+                    batch.append(message)
+                self.__start_batch(batch, routing_key=routing_key)
+                if message is None:
+                    break
+        finally:
+            pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+            # Deliveries that are not started yet are returned to the queue.
+            while not buffer.empty():
+                if (message := buffer.get_nowait()) is not None:
+                    await message.nack(requeue=True)
+
+    async def __pump(
+        self,
+        routing_key: str,
+        prefetch_count: int,
+        buffer: asyncio.Queue,
+    ):
+        """Move deliveries of the lane to ``buffer``. None marks the end."""
+
+        try:
+            async for message in self.rabbitmq_repository.consume_queue(
+                routing_key=routing_key,
+                prefetch_count=prefetch_count,
+            ):
+                buffer.put_nowait(message)
+        except Exception:
+            self.__logger.exception("Error listen queue from RebbitMQ.")
+        buffer.put_nowait(None)
+
+    def __start_batch(self, messages: list[AbstractIncomingMessage], routing_key: str):
+        """Start processing of the batch: a tracked task per delivery."""
+
+        batch = SendBatch(size=len(messages))
+
+        async def handle(message: AbstractIncomingMessage):
+            current_batch.set(batch)
+            try:
+                await self.handle_delivery(message, routing_key=routing_key)
+            finally:
+                batch.leave()
+
+        for message in messages:
+            self.__track(asyncio.create_task(handle(message)))
+
+    def __track(self, task: asyncio.Task) -> asyncio.Task:
+        """Track the delivery task for drain."""
+
+        self.__in_flight.add(task)
+        task.add_done_callback(self.__in_flight.discard)
+        return task
+
+    async def drain(self, consumer: asyncio.Task, timeout: float):
+        """Stop the worker without losing messages being sent.
+
+        #. Cancel ``consumer``: the broker stops pushing deliveries and the
+           prefetched ones that are not started yet are requeued.
+        #. Wait up to ``timeout`` seconds for in-flight deliveries. Those still
+           running after the deadline are cancelled and requeued.
+        #. Write buffered message statuses and send history.
+        #. Close connections of the senders.
+
+        Args:
+            consumer: Task running :meth:`.listen_sending_message`.
+            timeout: Deadline in seconds for in-flight deliveries.
+        """
+
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+
+        if self.__in_flight:
+            self.__logger.info("Drain %s in-flight messages.", len(self.__in_flight))
+            _, pending = await asyncio.wait(set(self.__in_flight), timeout=timeout)
+            if pending:
+                self.__logger.warning(
+                    "%s messages are not sent within %s s. Requeue them.",
+                    len(pending),
+                    timeout,
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        await self.status_writer.close()
+        await self.history_writer.close()
+        for sender in self.senders:
+            await sender.close()
+        self.__logger.info("Worker is drained.")
+
+    def stats(self) -> list[ChannelStats]:
+        """Get counters of every registered channel."""
+
+        return [
+            ChannelStats(
+                channel=str(sender.channel),
+                **{
+                    outcome: self.__counters[(sender.channel, outcome)]
+                    for outcome in ("sent", "failed", "retried", "dead", "skipped", "postponed")
+                },
+            )
+            for sender in self.senders
+        ]
+
+    async def handle_delivery(
+        self,
+        message: AbstractIncomingMessage,
+        routing_key: str | None = None,
+    ):
+        """Process single delivery and settle it.
+
+        Failed attempt is republished to the delay queue of the attempt and the
+        delivery is acked, so the consumer is never blocked by a retry. After
+        ``settings.RETRY.MAX_ATTEMPTS`` attempts, or on an error that can not be
+        fixed by a retry, the delivery is moved to the dead-letter queue.
+
+        Delivery of the event in progress on another consumer, e.g. redelivered
+        after a crash of the consumer, is postponed without counting an
+        attempt, see ``settings.IDEMPOTENCY.POSTPONE_DELAY``.
+
+        If republishing fails, the delivery is requeued.
+
+        Args:
+            message: Delivery from the queue.
+            routing_key: The routing key (queue name) of the lane the delivery
+                is consumed from. Defaults to ``settings.RABBITMQ.NOTIFICATION_KEY``.
+        """
+
+        routing_key = routing_key or settings.RABBITMQ.NOTIFICATION_KEY
+        channel = self.__default_channels.get(routing_key, models.ChannelEnum.EMAIL)
+        attempt = self.rabbitmq_repository.get_attempt(message)
+        message_id = None
+        try:
+            async with message.process(requeue=True):
+                try:
+                    sending_message = self.__decoder.decode(message.body, message.headers)
+                    message_id = sending_message.message_id
+                    if sending_message.channel:
+                        channel = models.ChannelEnum(sending_message.channel)
+                    await self.__process_once(sending_message, channel=channel, attempt=attempt)
+                except EventInProgress:
+                    self.__logger.info("Event of the message is in progress. Postpone it.")
+                    await self.rabbitmq_repository.publish_postponed(message, routing_key=routing_key)
+                    self.__counters[(channel, "postponed")] += 1
+                except Exception as exc:
+                    await self.__retry_or_dead(
+                        message,
+                        routing_key=routing_key,
+                        channel=channel,
+                        attempt=attempt,
+                        exc=exc,
+                        message_id=message_id,
+                    )
+        except Exception:
+            self.__logger.exception("Error process message from RebbitMQ.")
+
+    async def __process_once(
+        self,
+        sending_message: models.MessageNotification,
+        channel: models.ChannelEnum,
+        attempt: int,
+    ):
+        """Process the message unless its event is already processed in the
+        channel.
+
+        Redelivered event is skipped after a single Redis lookup. Event that
+        is in progress on another consumer raises :class:`.EventInProgress`.
+        """
+
+        key = f"{channel}:{sending_message.event_id}"
+        if not await self.idempotency_guard.claim(key):
+            self.__logger.info("Event %s is already processed. Skip.", key)
+            self.__counters[(channel, "skipped")] += 1
+            return
+
+        try:
+            await self.process_sending_message(sending_message, channel=channel, attempt=attempt)
+        except BaseException:
+            await self.idempotency_guard.release(key)
+            raise
+        await self.idempotency_guard.complete(key)
+
+    async def __retry_or_dead(
+        self,
+        message: AbstractIncomingMessage,
+        routing_key: str,
+        channel: models.ChannelEnum,
+        attempt: int,
+        exc: Exception,
+        message_id: UUID | None = None,
+    ):
+        """Schedule next attempt of the failed delivery or move it to DLQ.
+
+        Delay is not shorter than the delay requested by the provider. Message
+        moved to DLQ is marked as failed.
+        """
+
+        sender = self.__sender(channel, strict=False)
+        permanent = _PERMANENT_ERRORS + (sender.permanent_errors if sender else ())
+        if isinstance(exc, (ChannelNotSupported, *permanent)) or not self.__retry_policy.can_retry(attempt):
+            self.__logger.error(
+                "Attempt %s of %s failed. Move to DLQ.",
+                attempt,
+                self.__retry_policy.max_attempts,
+                exc_info=exc,
+            )
+            await self.rabbitmq_repository.publish_dead(
+                message,
+                routing_key=routing_key,
+                reason=repr(exc),
+            )
+            self.__counters[(channel, "dead")] += 1
+            if message_id:
+                self.status_writer.record(message_id, models.MessageStatusEnum.FAILED)
+            return
+
+        delay = self.__retry_policy.delay(attempt)
+        retry_after = sender.retry_after(exc) if sender else None
+        if retry_after is not None:
+            delay = min(max(delay, retry_after), self.__retry_policy.delay_cap(attempt))
+        self.__logger.warning(
+            "Attempt %s of %s failed. Retry in %.1f s.",
+            attempt,
+            self.__retry_policy.max_attempts,
+            delay,
+        )
+        await self.rabbitmq_repository.publish_retry(
+            message,
+            routing_key=routing_key,
+            attempt=attempt,
+            delay=delay,
+        )
+        self.__counters[(channel, "retried")] += 1
+
+    async def process_sending_message(
+        self,
+        sending_message: models.MessageNotification,
+        channel: models.ChannelEnum = models.ChannelEnum.EMAIL,
+        attempt: int = 1,
+    ):
+        """Process sending message.
+
+        PostgreSQL lookups of the template and the correspondent share one
+        unit of work, its connection is returned to the pool before the send,
+        so it is not held while the provider responds or the batch fills up.
+        Statuses and attempts are written by write-behind buffers with their
+        own sessions.
+
+        Args:
+            sending_message: Message to send.
+            channel: Channel of the message.
+            attempt: Number of the send attempt, recorded as
+                ``Delivery.delivery_attempt_no``.
+        """
+
+        sender = self.__sender(channel)
+        address = sender.address(sending_message)
+        correspondent, lookup_error = None, None
+        async with unit_of_work():
+            text_template = await self.text_template_service.get_text_template_by_code(
+                query=models.TextTemplateReadByCodeQuery(
+                    text_template_code=sending_message.event,
+                    text_template_channel=channel,
+                ),
+            )
+            # Failed lookup of the correspondent is recorded as a failed
+            # attempt below, after the connection is released.
+            try:
+                correspondent = await sender.correspondent(sending_message)
+            except Exception as exc:
+                lookup_error = exc
+        content = self.text_template_service.render_template_content(
+            template=text_template,
+            context=sender.context(sending_message),
+        )
+
+        # Sends of a batch are limited by the batch, a slot held while waiting
+        # for the flush would block other members of the batch.
+        batched = sender.batched and current_batch.get() is not None
+        try:
+            if lookup_error is not None:
+                raise lookup_error
+            async with nullcontext() if batched else self.__limits[channel]:
+                provider_message_id = await sender.send(
+                    sending_message,
+                    correspondent=correspondent,
+                    content=content,
+                    subject=text_template.text_template_subject,
+                )
+        except Exception as exc:
+            self.__logger.exception("Error send %s message.", channel)
+            self.__counters[(channel, "failed")] += 1
+            await self.__record_delivery(
+                sending_message,
+                sender=sender,
+                address=address,
+                attempt=attempt,
+                exc=exc,
+            )
+            raise exc
+
+        self.__counters[(channel, "sent")] += 1
+        if sending_message.message_id:
+            self.status_writer.record(sending_message.message_id, models.MessageStatusEnum.SENT)
+        await self.__record_delivery(
+            sending_message,
+            sender=sender,
+            address=address,
+            attempt=attempt,
+            provider_message_id=provider_message_id,
+        )
+
+    def __sender(self, channel: models.ChannelEnum, strict: bool = True) -> ChannelSender | None:
+        """Get sender registered for the channel."""
+
+        for sender in self.senders:
+            if sender.channel == channel:
+                return sender
+        if strict:
+            raise ChannelNotSupported(f"No sender of channel {channel}.")
+        return None
+
+    async def __record_delivery(
+        self,
+        sending_message: models.MessageNotification,
+        sender: ChannelSender,
+        address: str,
+        attempt: int,
+        provider_message_id: str | None = None,
+        exc: Exception | None = None,
+    ):
+        """Record the send attempt.
+
+        Attempt is written in batches by :class:`.DeliveryHistoryWriter`, this
+        waits only while its buffer is full. Recipient ID is derived from
+        ``event_id``, so all attempts of the event are recorded under one
+        recipient. Errors are logged and never fail the send.
+        """
+
+        now = datetime.now(timezone.utc)
+        recipient_id = uuid5(NAMESPACE_URL, str(sending_message.event_id))
+        try:
+            await self.history_writer.write(
+                recipient=models.RecipientCreateCommand(
+                    recipient_id=recipient_id,
+                    recipient_user_id=sending_message.user_id,
+                    recipient_address=address,
+                ),
+                delivery=models.DeliveryCreateCommand(
+                    recipient_id=recipient_id,
+                    delivery_attempt_no=attempt,
+                    delivery_provider=sender.provider,
+                    delivery_status=(
+                        models.DeliveryStatusEnum.FAILED if exc
+                        else models.DeliveryStatusEnum.SENT
+                    ),
+                    delivery_provider_message_id=provider_message_id,
+                    delivery_error_code=type(exc).__name__ if exc else None,
+                    delivery_error_message=str(exc) if exc else None,
+                    delivery_sent_at=None if exc else now,
+                    delivery_finalized_at=now,
+                ),
+            )
+        except Exception:
+            self.__logger.exception("Error record delivery attempt %s.", attempt)
@@ -0,0 +1,120 @@
+"""Bulk writer of the send history."""
+
+import asyncio
+from logging import Logger
+
+from app.internal.repository.v1.postgresql import DeliveryRepository, RecipientRepository
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+__all__ = ["DeliveryHistoryWriter"]
+
+
+class DeliveryHistoryWriter:
+    """Write recipients and delivery attempts to PostgreSQL in batches.
+
+    :meth:`.write` puts the attempt into a bounded buffer of
+    ``settings.WORKER.HISTORY_BUFFER_SIZE`` attempts. Background task takes up
+    to ``settings.WORKER.HISTORY_BATCH_SIZE`` attempts, waiting no longer than
+    ``settings.WORKER.HISTORY_FLUSH_MS`` milliseconds after the first one, and
+    writes them with COPY: recipients first, then their deliveries.
+
+    When PostgreSQL is slower than sends, the buffer fills up and
+    :meth:`.write` waits for a free slot. The delivery is not acked meanwhile,
+    so the consumer stops taking new deliveries instead of growing memory.
+
+    Batch failed ``settings.WORKER.HISTORY_FLUSH_ATTEMPTS`` times in a row is
+    logged and dropped: history never blocks sends for good.
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        recipient_repository: RecipientRepository,
+        delivery_repository: DeliveryRepository,
+    ):
+        self.recipient_repository = recipient_repository
+        self.delivery_repository = delivery_repository
+        self.__buffer: asyncio.Queue[
+            tuple[models.RecipientCreateCommand, models.DeliveryCreateCommand]
+        ] = asyncio.Queue(maxsize=settings.WORKER.HISTORY_BUFFER_SIZE)
+        self.__flusher: asyncio.Task | None = None
+
+    async def write(
+        self,
+        recipient: models.RecipientCreateCommand,
+        delivery: models.DeliveryCreateCommand,
+    ) -> None:
+        """Buffer the delivery attempt. Waits while the buffer is full.
+
+        Args:
+            recipient: Recipient of the attempt, skipped if it exists.
+            delivery: The delivery attempt.
+        """
+
+        if self.__flusher is None or self.__flusher.done():
+            self.__flusher = asyncio.create_task(self.__run())
+        await self.__buffer.put((recipient, delivery))
+
+    async def close(self) -> None:
+        """Write all buffered attempts and stop the background task."""
+
+        if self.__flusher is None:
+            return
+
+        if not self.__flusher.done():
+            await self.__buffer.join()
+        self.__flusher.cancel()
+        await asyncio.gather(self.__flusher, return_exceptions=True)
+        self.__flusher = None
+
+    async def __run(self) -> None:
+        """Take batches from the buffer and write them."""
+
+        size = settings.WORKER.HISTORY_BATCH_SIZE
+        wait = settings.WORKER.HISTORY_FLUSH_MS / 1000
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.__buffer.get()]
+            deadline = loop.time() + wait
+            while len(batch) < size:
+                try:
+                    batch.append(await asyncio.wait_for(self.__buffer.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.__write_batch(batch)
+            finally:
+                for _ in batch:
+                    self.__buffer.task_done()
+
+    async def __write_batch(
+        self,
+        batch: list[tuple[models.RecipientCreateCommand, models.DeliveryCreateCommand]],
+    ) -> None:
+        """Write the batch, retrying failed attempts."""
+
+        attempts = settings.WORKER.HISTORY_FLUSH_ATTEMPTS
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.recipient_repository.create_many(
+                    cmds=[recipient for recipient, _ in batch],
+                )
+                await self.delivery_repository.create_many(
+                    cmds=[delivery for _, delivery in batch],
+                )
+                return
+            except Exception:
+                self.__logger.exception(
+                    "Attempt %s of %s to write %s deliveries failed.",
+                    attempt,
+                    attempts,
+                    len(batch),
+                )
+                if attempt < attempts:
+                    await asyncio.sleep(attempt * settings.WORKER.HISTORY_FLUSH_MS / 1000)
+
+        self.__logger.error("History of %s deliveries is lost.", len(batch))
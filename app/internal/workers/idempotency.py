@@ -0,0 +1,120 @@
+"""Idempotency guard of processed events."""
+
+from logging import Logger
+from uuid import UUID
+
+from redis import RedisError
+
+from app.internal.repository.v1.redis import BaseRedisRepository
+from app.pkg.logger import get_logger
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+__all__ = ["IdempotencyGuard", "EventInProgress"]
+
+#: str: State of the event claimed by a consumer.
+IN_PROGRESS = "in_progress"
+#: str: State of the processed event.
+DONE = "done"
+
+
+class EventInProgress(Exception):
+    """Event is being processed by another consumer."""
+
+
+class IdempotencyGuard:
+    """Guard against double processing of the same event.
+
+    Key ``{prefix}:{event_id}`` moves through states:
+
+    * absent - event is not processed, may be claimed;
+    * ``in_progress`` - claimed with ``SET NX``, expires after
+      ``settings.IDEMPOTENCY.IN_PROGRESS_TTL`` if the consumer crashed;
+    * ``done`` - processed, kept for ``settings.IDEMPOTENCY.DONE_TTL``.
+
+    Redis errors are logged and the event is processed: a duplicate message is
+    preferred over a lost one.
+
+    Examples:
+        ::
+
+            >>> async def handle(guard: IdempotencyGuard, event_id: UUID) -> None:
+            ...     if not await guard.claim(event_id):
+            ...         return
+            ...     try:
+            ...         await send()
+            ...     except Exception:
+            ...         await guard.release(event_id)
+            ...         raise
+            ...     await guard.complete(event_id)
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(self, redis_repository: BaseRedisRepository):
+        self.redis_repository = redis_repository
+
+    async def claim(self, event_id: UUID | str) -> bool:
+        """Claim the event for processing.
+
+        Args:
+            event_id: Idempotency key of the event.
+
+        Raises:
+            EventInProgress: Event is claimed by another consumer.
+
+        Returns:
+            True if the event must be processed, False if it is already done.
+        """
+
+        key = self.__key(event_id)
+        try:
+            if await self.redis_repository.create_if_not_exists(
+                redis_key=key,
+                redis_value=IN_PROGRESS,
+                expire_time=settings.IDEMPOTENCY.IN_PROGRESS_TTL,
+            ):
+                return True
+            state = await self.redis_repository.read_value(key)
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to claim event %s.", event_id)
+            return True
+
+        if state == DONE:
+            return False
+        if state == IN_PROGRESS:
+            raise EventInProgress(f"Event {event_id} is in progress.")
+        # Claim expired between SET NX and GET.
+        return await self.claim(event_id)
+
+    async def complete(self, event_id: UUID | str) -> None:
+        """Mark the event as processed.
+
+        Args:
+            event_id: Idempotency key of the event.
+        """
+
+        try:
+            await self.redis_repository.create(
+                redis_key=self.__key(event_id),
+                redis_value=DONE,
+                expire_time=settings.IDEMPOTENCY.DONE_TTL,
+            )
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to complete event %s.", event_id)
+
+    async def release(self, event_id: UUID | str) -> None:
+        """Release the claim, so the event may be processed again.
+
+        Args:
+            event_id: Idempotency key of the event.
+        """
+
+        try:
+            await self.redis_repository.delete(self.__key(event_id))
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to release event %s.", event_id)
+
+    @staticmethod
+    def __key(event_id: UUID | str) -> str:
+        return f"{settings.IDEMPOTENCY.REDIS_PREFIX}:{event_id}"
@@ -0,0 +1,100 @@
+"""Decoder of queue payloads into models."""
+
+from types import UnionType
+from typing import Annotated, Any, Collection, Generic, Mapping, TypeVar, Union, get_args, get_origin
+
+from pydantic import EmailStr, TypeAdapter, with_config
+from typing_extensions import NotRequired, TypedDict
+
+from app.pkg.models.base import BaseModel
+from app.pkg.settings import settings
+
+__all__ = ["PayloadDecoder", "SCHEMA_HEADER"]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+#: str: Header with the schema of the payload, set by producers that validate
+#  the payload against this schema before publish.
+SCHEMA_HEADER = "x-schema"
+
+
+class PayloadDecoder(Generic[_M]):
+    """Decode JSON body of the delivery into ``model``.
+
+    * Default path - body bytes are parsed and validated by the compiled
+      validator of ``model`` in one pass, without ``bytes.decode`` and
+      ``json.loads``.
+    * Trusted path - if ``settings.WORKER.TRUST_SCHEMA_HEADER`` is enabled and
+      :data:`SCHEMA_HEADER` of the delivery is one of ``schemas``, the payload
+      is checked by a precompiled adapter with the fields, constraints and
+      config of ``model``, and the model is built without validating it
+      again. Only email syntax validation is skipped.
+
+    Both paths return equal models and raise :class:`pydantic.ValidationError`
+    on invalid payload.
+
+    Examples:
+        ::
+
+            >>> decoder = PayloadDecoder(MessageVerified, schemas={"message_verified.v1"})
+            >>> message = decoder.decode(body, headers={"x-schema": "message_verified.v1"})
+    """
+
+    def __init__(self, model: type[_M], schemas: Collection[str]):
+        """Initialize decoder.
+
+        Args:
+            model: Model of the payload.
+            schemas: Names and versions of payload schemas trusted by the decoder.
+                Every schema must be compatible with ``model``.
+        """
+
+        self.model = model
+        self.schemas = frozenset(schemas)
+        self._trusted = TypeAdapter(self.__trusted_schema(model))
+
+    def decode(self, body: bytes, headers: Mapping[str, Any] | None = None) -> _M:
+        """Decode body of the delivery.
+
+        Args:
+            body: Raw JSON body of the delivery.
+            headers: Headers of the delivery.
+
+        Returns:
+            Instance of ``model``.
+        """
+
+        if (
+            settings.WORKER.TRUST_SCHEMA_HEADER
+            and headers
+            and headers.get(SCHEMA_HEADER) in self.schemas
+        ):
+            return self.model.model_construct(**self._trusted.validate_json(body))
+        return self.model.model_validate_json(body)
+
+    @staticmethod
+    def __trusted_schema(model: type[_M]) -> type:
+        """Build TypedDict with fields of ``model`` and plain ``str`` emails.
+
+        Constraints of the fields and config of ``model``, e.g.
+        ``use_enum_values`` and ``str_strip_whitespace``, are kept.
+        """
+
+        def plain(annotation: Any) -> Any:
+            if annotation is EmailStr:
+                return str
+            if get_origin(annotation) in (Union, UnionType):
+                return Union[tuple(plain(arg) for arg in get_args(annotation))]
+            return annotation
+
+        fields = {}
+        for name, field in model.model_fields.items():
+            annotation = plain(field.annotation)
+            if field.metadata:
+                annotation = Annotated[(annotation, *field.metadata)]
+            fields[field.alias or name] = (
+                annotation if field.is_required() else NotRequired[annotation]
+            )
+        return with_config(model.model_config)(
+            TypedDict(f"Trusted{model.__name__}", fields),
+        )
@@ -0,0 +1,71 @@
+"""Entrypoint of a single worker process."""
+
+import asyncio
+import signal
+from logging import Logger
+
+from dependency_injector.wiring import Provide, inject
+
+from app.configuration import __containers__
+from app.configuration.events import close_pools
+from app.internal.pkg.cache import LookupCache
+from app.internal.workers import Workers
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.pkg.logger import get_logger
+from app.pkg.settings import settings
+
+__all__ = ["run_worker_process", "serve"]
+
+logger: Logger = get_logger(__name__)
+
+
+def run_worker_process(index: int) -> None:
+    """Wire containers and run consumers until SIGTERM or SIGINT.
+
+    Args:
+        index: Index of the process given by the supervisor.
+    """
+
+    __containers__.wire_packages()
+    logger.info("Worker process %s is serving.", index)
+    asyncio.run(serve())
+
+
+@inject
+async def serve(
+    dispatcher_worker: ChannelDispatcherWorker = Provide[Workers.dispatcher_worker],
+) -> None:
+    """Run consumers of the process and drain them on SIGTERM or SIGINT.
+
+    Args:
+        dispatcher_worker: Worker dispatching notifications to channel senders.
+
+    Raises:
+        SystemExit: Consumer stopped by itself, the process must be restarted.
+    """
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    consumer = asyncio.create_task(dispatcher_worker.listen_sending_message())
+    cache_invalidation = asyncio.create_task(LookupCache.listen_invalidations())
+    stopped = asyncio.create_task(stop.wait())
+
+    done, _ = await asyncio.wait(
+        {stopped, consumer},
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+
+    await dispatcher_worker.drain(
+        consumer=consumer,
+        timeout=settings.WORKER.DRAIN_TIMEOUT,
+    )
+    for task in (cache_invalidation, stopped):
+        task.cancel()
+    await asyncio.gather(cache_invalidation, stopped, return_exceptions=True)
+    await close_pools()
+
+    if stopped not in done:
+        raise SystemExit(1)
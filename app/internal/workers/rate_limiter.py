@@ -0,0 +1,99 @@
+"""Distributed rate limiter of sends."""
+
+import asyncio
+from logging import Logger
+
+from redis import RedisError
+
+from app.internal.repository.v1.redis import BaseRedisRepository
+from app.pkg.logger import get_logger
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+__all__ = ["RateLimiter"]
+
+#: str: Token bucket in the GCRA form. The key holds the theoretical arrival
+#  time (TAT) of the next send in milliseconds. A send always reserves a slot
+#  and gets the time to wait before using it, so one round trip is enough.
+#
+#  KEYS[1] - key of the bucket.
+#  ARGV[1] - interval between sends in ms (1000 / rate).
+#  ARGV[2] - burst, count of sends allowed in a row.
+_RESERVE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+local interval = tonumber(ARGV[1])
+local tolerance = interval * (tonumber(ARGV[2]) - 1)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local wait = tat - tolerance - now
+if wait < 0 then
+    wait = 0
+end
+local next_tat = tat + interval
+redis.call('SET', KEYS[1], tostring(next_tat), 'PX', math.ceil(next_tat - now + interval))
+return tostring(wait)
+"""
+
+
+class RateLimiter:
+    """Token bucket shared by all worker replicas.
+
+    Bucket of ``key`` is refilled with ``rate`` tokens per second and holds up
+    to ``burst`` tokens. :meth:`.acquire` never fails: a send over the limit
+    waits for its token.
+
+    Redis errors are logged and the send is not limited.
+
+    Examples:
+        ::
+
+            >>> async def send(limiter: RateLimiter) -> None:
+            ...     await limiter.acquire("smtp:support@yourapp.io", rate=5, burst=10)
+            ...     await smtp_send()
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(self, redis_repository: BaseRedisRepository):
+        self.redis_repository = redis_repository
+
+    async def acquire(
+        self,
+        key: str,
+        rate: float | None = None,
+        burst: int | None = None,
+    ) -> float:
+        """Wait for a token of the bucket.
+
+        Args:
+            key: Name of the bucket.
+            rate: Tokens per second. Defaults to
+                ``settings.RATE_LIMIT.DEFAULT_RATE``.
+            burst: Capacity of the bucket. Defaults to
+                ``settings.RATE_LIMIT.DEFAULT_BURST``.
+
+        Returns:
+            Seconds waited.
+        """
+
+        rate = rate or settings.RATE_LIMIT.DEFAULT_RATE
+        burst = burst or settings.RATE_LIMIT.DEFAULT_BURST
+        try:
+            wait_ms = float(
+                await self.redis_repository.run_script(
+                    _RESERVE_SCRIPT,
+                    keys=[f"{settings.RATE_LIMIT.REDIS_PREFIX}:{key}"],
+                    args=[1000 / rate, burst],
+                ),
+            )
+        except (RedisError, DriverError):
+            self.__logger.exception("Failed to acquire token of %s.", key)
+            return 0
+
+        if wait_ms > 0:
+            self.__logger.debug("Rate limit of %s. Wait %.0f ms.", key, wait_ms)
+            await asyncio.sleep(wait_ms / 1000)
+        return wait_ms / 1000
@@ -0,0 +1,59 @@
+"""Retry policy of failed sends."""
+
+import random
+from dataclasses import dataclass
+
+from app.pkg.settings import settings
+
+__all__ = ["RetryPolicy"]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter.
+
+    Delay before attempt ``n + 1`` is a random value in
+    ``[delay_cap(n) / 2, delay_cap(n)]``, where
+    ``delay_cap(n) = min(base_delay * 2 ** (n - 1), max_delay)``.
+
+    Attributes:
+        max_attempts: Max count of attempts, including the first one.
+        base_delay: Delay cap in seconds after the first failed attempt.
+        max_delay: Upper bound of the delay in seconds.
+    """
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """Build policy from ``settings.RETRY``."""
+
+        return cls(
+            max_attempts=settings.RETRY.MAX_ATTEMPTS,
+            base_delay=settings.RETRY.BASE_DELAY,
+            max_delay=settings.RETRY.MAX_DELAY,
+        )
+
+    @property
+    def retry_levels(self) -> range:
+        """Numbers of failed attempts that are retried."""
+
+        return range(1, self.max_attempts)
+
+    def can_retry(self, attempt: int) -> bool:
+        """Check if the failed ``attempt`` may be retried."""
+
+        return attempt < self.max_attempts
+
+    def delay_cap(self, attempt: int) -> float:
+        """Max delay in seconds after failed ``attempt``."""
+
+        return min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+
+    def delay(self, attempt: int) -> float:
+        """Jittered delay in seconds after failed ``attempt``."""
+
+        cap = self.delay_cap(attempt)
+        return random.uniform(cap / 2, cap)  # noqa: S311
@@ -0,0 +1,116 @@
+"""Batch of sends grouped by sender."""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable
+
+__all__ = ["SendBatch", "current_batch"]
+
+#: Callable: Coroutine function sending items of one group and returning
+#  error of each item, None if the item is sent.
+SendGroup = Callable[[list[Any]], Awaitable[list[Exception | None]]]
+
+
+class SendBatch:
+    """Barrier collecting sends of a batch of deliveries.
+
+    Every delivery of the batch is processed by its own task. The task either
+    submits its send with :meth:`submit`, or leaves the batch with
+    :meth:`leave` when it ends without a send, e.g. skipped or failed delivery.
+    When every task of the batch has done one of them, submitted sends are
+    flushed: items of each group are passed to ``send_group`` of the group at
+    once, and groups are sent concurrently.
+
+    Examples:
+        ::
+
+            >>> batch = SendBatch(size=2)
+            >>> async def deliver(item) -> None:
+            ...     try:
+            ...         await batch.submit(
+            ...             group=item.sender,
+            ...             item=item,
+            ...             send_group=send_over_one_session,
+            ...         )
+            ...     finally:
+            ...         batch.leave()
+    """
+
+    def __init__(self, size: int):
+        """Initialize batch.
+
+        Args:
+            size: Count of tasks of the batch.
+        """
+
+        self.__waiting = size
+        self.__arrived: set[asyncio.Task] = set()
+        self.__groups: dict[Hashable, tuple[SendGroup, list[tuple[Any, asyncio.Future]]]] = {}
+        self.__flush_task: asyncio.Task | None = None
+
+    async def submit(self, group: Hashable, item: Any, send_group: SendGroup) -> None:
+        """Submit send of the current task and wait for the flush.
+
+        Args:
+            group: Key of the group, e.g. identifier of the sender.
+            item: Item to send.
+            send_group: Coroutine function sending items of the group. The
+                function of the first item of the group is used.
+
+        Raises:
+            Exception: Error of the send of ``item``.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.__groups.setdefault(group, (send_group, []))[1].append((item, future))
+        self.__arrive()
+        error = await future
+        if error is not None:
+            raise error
+
+    def leave(self) -> None:
+        """Leave the batch. No-op if the current task has submitted a send."""
+
+        self.__arrive()
+
+    def __arrive(self) -> None:
+        """Count the current task and flush the batch after the last one."""
+
+        task = asyncio.current_task()
+        if task in self.__arrived:
+            return
+
+        self.__arrived.add(task)
+        self.__waiting -= 1
+        if self.__waiting == 0:
+            self.__flush_task = asyncio.create_task(self.__flush())
+
+    async def __flush(self) -> None:
+        """Send all groups concurrently."""
+
+        await asyncio.gather(
+            *(
+                self.__flush_group(send_group, entries)
+                for send_group, entries in self.__groups.values()
+            ),
+        )
+
+    @staticmethod
+    async def __flush_group(
+        send_group: SendGroup,
+        entries: list[tuple[Any, asyncio.Future]],
+    ) -> None:
+        """Send items of one group and resolve futures of their tasks."""
+
+        try:
+            errors = await send_group([item for item, _ in entries])
+        except Exception as exc:
+            errors = [exc] * len(entries)
+
+        for (_, future), error in zip(entries, errors):
+            if not future.done():
+                future.set_result(error)
+
+
+#: ContextVar[SendBatch | None]: Batch of the delivery processed by the task.
+current_batch: ContextVar[SendBatch | None] = ContextVar("current_batch", default=None)
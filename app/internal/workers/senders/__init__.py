@@ -0,0 +1,7 @@
+"""Channel senders of the dispatcher worker."""
+
+from app.internal.workers.senders.base import ChannelSender, RecipientAddressMissing
+from app.internal.workers.senders.email import EmailSender
+from app.internal.workers.senders.telegram import TelegramSender
+
+__all__ = ["ChannelSender", "RecipientAddressMissing", "EmailSender", "TelegramSender"]
@@ -0,0 +1,86 @@
+"""Base class of channel senders."""
+
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+from app.pkg.models import v1 as models
+
+__all__ = ["ChannelSender", "RecipientAddressMissing"]
+
+
+class RecipientAddressMissing(ValueError):
+    """Message has no address of the recipient in the channel."""
+
+
+class ChannelSender(ABC):
+    """Sender of one channel plugged into :class:`.ChannelDispatcherWorker`.
+
+    Dispatcher decodes the message, claims its event, looks up and renders the
+    template of the channel and records the delivery. Sender only resolves the
+    correspondent of the channel and sends rendered content. Lookups run in the
+    PostgreSQL unit of work of the message, which is released before the send.
+    """
+
+    #: ChannelEnum: Channel served by the sender.
+    channel: ClassVar[models.ChannelEnum]
+    #: str: Provider recorded as ``Delivery.delivery_provider``.
+    provider: ClassVar[str]
+    #: tuple: Errors of the sender that can not be fixed by a retry.
+    permanent_errors: ClassVar[tuple[type[Exception], ...]] = ()
+    #: bool: Sends of the sender are grouped by :class:`.SendBatch` in
+    #  ``batch`` consumer mode.
+    batched: ClassVar[bool] = False
+
+    def __init__(self, concurrency: int):
+        """Initialize sender.
+
+        Args:
+            concurrency: Max count of sends of the channel at once.
+        """
+
+        self.concurrency = concurrency
+
+    @abstractmethod
+    def address(self, message: models.MessageNotification) -> str:
+        """Get address of the recipient in the channel.
+
+        Raises:
+            RecipientAddressMissing: Message has no address of the channel.
+        """
+
+    def context(self, message: models.MessageNotification) -> dict[str, Any]:
+        """Get values of the template variables."""
+
+        return {"verification_code": message.verification_code}
+
+    @abstractmethod
+    async def correspondent(self, message: models.MessageNotification) -> Any:
+        """Look up the correspondent sending the message in the channel."""
+
+    @abstractmethod
+    async def send(
+        self,
+        message: models.MessageNotification,
+        correspondent: Any,
+        content: str,
+        subject: str | None,
+    ) -> str | None:
+        """Send rendered message.
+
+        Args:
+            message: Decoded message.
+            correspondent: Correspondent returned by :meth:`correspondent`.
+            content: Rendered content of the template.
+            subject: Subject of the template.
+
+        Returns:
+            Identifier of the message given by the provider, if any.
+        """
+
+    def retry_after(self, exc: Exception) -> float | None:  # pylint: disable=unused-argument
+        """Get min delay of the retry requested by the provider, if any."""
+
+        return None
+
+    async def close(self) -> None:
+        """Close connections of the sender."""
@@ -0,0 +1,111 @@
+"""Email channel sender."""
+
+from email.utils import make_msgid
+from typing import Any
+
+from app.internal.services.v1 import EmailCorrespondentService
+from app.internal.workers.rate_limiter import RateLimiter
+from app.internal.workers.send_batch import current_batch
+from app.internal.workers.senders.base import ChannelSender, RecipientAddressMissing
+from app.pkg.clients.v1.email import EmailClient
+from app.pkg.models import v1 as models
+
+__all__ = ["EmailSender"]
+
+
+class EmailSender(ChannelSender):
+    """Send emails with SMTP account of the correspondent of the event.
+
+    In ``batch`` consumer mode emails of one correspondent are sent over one
+    SMTP session, see :class:`.SendBatch`.
+    """
+
+    channel = models.ChannelEnum.EMAIL
+    provider = "smtp"
+    batched = True
+
+    email_correspondent_service: EmailCorrespondentService
+    mail_client: EmailClient
+    rate_limiter: RateLimiter
+
+    def address(self, message: models.MessageNotification) -> str:
+        if not message.email:
+            raise RecipientAddressMissing("Message has no email.")
+        return str(message.email)
+
+    def context(self, message: models.MessageNotification) -> dict[str, Any]:
+        return {"username": message.email, **super().context(message)}
+
+    async def correspondent(self, message: models.MessageNotification) -> models.EmailCorrespondentResponse:
+        return await self.email_correspondent_service.get_email_correspondent_by_name(
+            query=models.EmailCorrespondentReadByNameQuery(
+                email_correspondent_name=message.event,
+            ),
+        )
+
+    async def send(
+        self,
+        message: models.MessageNotification,
+        correspondent: models.EmailCorrespondentResponse,
+        content: str,
+        subject: str | None,
+    ) -> str:
+        """Send the email, return its ``Message-ID`` header.
+
+        ``Message-ID`` is generated here, so events of the provider can be
+        matched with the recorded delivery.
+        """
+
+        cmd = models.MessageSendCommand(
+            email_host=correspondent.email_host,
+            email_port=correspondent.email_port,
+            email_sender=correspondent.email_username,
+            message_receiver=message.email,
+            email_password=correspondent.email_password,
+            email_message_id=make_msgid(
+                domain=correspondent.email_username.rpartition("@")[2] or correspondent.email_host,
+            ),
+            text_template_subject=subject,
+            text_template_content=content,
+        )
+
+        batch = current_batch.get()
+        if batch is not None:
+            await batch.submit(
+                group=correspondent.email_correspondent_id,
+                item=(correspondent, cmd),
+                send_group=self.__send_group,
+            )
+            return cmd.email_message_id
+
+        await self.__acquire_rate(correspondent)
+        await self.mail_client.message_send_email(cmd)
+        return cmd.email_message_id
+
+    async def close(self) -> None:
+        await self.mail_client.session_pool.close()
+
+    async def __send_group(
+        self,
+        items: list[tuple[models.EmailCorrespondentResponse, models.MessageSendCommand]],
+    ) -> list[Exception | None]:
+        """Send emails of one correspondent over one SMTP session."""
+
+        correspondent = items[0][0]
+
+        async def acquire_rate(_: models.MessageSendCommand):
+            await self.__acquire_rate(correspondent)
+
+        return await self.mail_client.message_send_emails(
+            [cmd for _, cmd in items],
+            before_send=acquire_rate,
+        )
+
+    async def __acquire_rate(self, correspondent: models.EmailCorrespondentResponse):
+        """Wait for a send token of the correspondent."""
+
+        await self.rate_limiter.acquire(
+            key=f"email_correspondent:{correspondent.email_correspondent_id}",
+            rate=correspondent.email_rate_limit,
+            burst=correspondent.email_rate_burst,
+        )
@@ -0,0 +1,77 @@
+"""Telegram channel sender."""
+
+from app.internal.services.v1 import TelegramCorrespondentService
+from app.internal.workers.rate_limiter import RateLimiter
+from app.internal.workers.senders.base import ChannelSender, RecipientAddressMissing
+from app.pkg.clients.v1.telegram import TelegramClient
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.telegram import TelegramChatUnavailable, TelegramRetryAfter
+from app.pkg.settings import settings
+
+__all__ = ["TelegramSender"]
+
+
+class TelegramSender(ChannelSender):
+    """Send messages with the bot of the correspondent of the event.
+
+    Telegram limits are enforced with token buckets shared by all replicas,
+    see ``settings.TELEGRAM``:
+
+    * ``GLOBAL_RATE`` messages per second of one bot;
+    * ``CHAT_RATE`` messages per second of one bot to one chat.
+    """
+
+    channel = models.ChannelEnum.TELEGRAM
+    provider = "telegram"
+    permanent_errors = (TelegramChatUnavailable,)
+
+    telegram_correspondent_service: TelegramCorrespondentService
+    telegram_client: TelegramClient
+    rate_limiter: RateLimiter
+
+    def address(self, message: models.MessageNotification) -> str:
+        if message.telegram_chat_id is None:
+            raise RecipientAddressMissing("Message has no telegram chat id.")
+        return str(message.telegram_chat_id)
+
+    async def correspondent(self, message: models.MessageNotification) -> models.TelegramCorrespondentResponse:
+        return await self.telegram_correspondent_service.get_telegram_correspondent_by_name(
+            query=models.TelegramCorrespondentReadByNameQuery(
+                telegram_correspondent_name=message.event,
+            ),
+        )
+
+    async def send(
+        self,
+        message: models.MessageNotification,
+        correspondent: models.TelegramCorrespondentResponse,
+        content: str,
+        subject: str | None,
+    ) -> str:
+        bot = f"telegram_bot:{correspondent.telegram_correspondent_id}"
+        await self.rate_limiter.acquire(
+            key=bot,
+            rate=settings.TELEGRAM.GLOBAL_RATE,
+            burst=max(int(settings.TELEGRAM.GLOBAL_RATE), 1),
+        )
+        await self.rate_limiter.acquire(
+            key=f"{bot}:{message.telegram_chat_id}",
+            rate=settings.TELEGRAM.CHAT_RATE,
+            burst=1,
+        )
+
+        return await self.telegram_client.message_send_telegram(
+            models.TelegramSendCommand(
+                telegram_bot_token=correspondent.telegram_bot_token,
+                telegram_chat_id=message.telegram_chat_id,
+                text_template_content=content,
+            ),
+        )
+
+    def retry_after(self, exc: Exception) -> float | None:
+        if isinstance(exc, TelegramRetryAfter):
+            return exc.retry_after
+        return None
+
+    async def close(self) -> None:
+        await self.telegram_client.bot_pool.close()
@@ -0,0 +1,117 @@
+"""Write-behind buffer of message statuses."""
+
+import asyncio
+from logging import Logger
+from uuid import UUID
+
+from app.internal.repository.v1.postgresql import MessageRepository
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+__all__ = ["MessageStatusWriter"]
+
+
+class MessageStatusWriter:
+    """Buffer status transitions of messages and write them in batches.
+
+    :meth:`.record` only puts the transition into memory, so a send never waits
+    for PostgreSQL. The buffer is written with one set-based statement, see
+    :meth:`.MessageRepository.message_update_statuses`, when it holds
+    ``settings.WORKER.STATUS_BATCH_SIZE`` messages or
+    ``settings.WORKER.STATUS_FLUSH_MS`` milliseconds after its first transition.
+
+    Only the last transition of each message is written. Flushes are run one at
+    a time, so transitions of a message are never reordered. Failed flush is
+    returned to the buffer and retried with the next one. Transitions buffered
+    when the process crashes are lost, statuses are bookkeeping, while
+    deliveries remain the source of truth.
+
+    Examples:
+        ::
+
+            >>> writer = MessageStatusWriter(message_repository=MessageRepository())
+            >>> writer.record(message_id, models.MessageStatusEnum.SENT)
+            >>> await writer.close()
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(self, message_repository: MessageRepository):
+        self.message_repository = message_repository
+        #: dict[UUID, MessageStatusEnum]: Last buffered status by message.
+        self.__pending: dict[UUID, models.MessageStatusEnum] = {}
+        self.__timer: asyncio.TimerHandle | None = None
+        self.__flushes: set[asyncio.Task] = set()
+        self.__lock = asyncio.Lock()
+
+    def record(self, message_id: UUID, status: models.MessageStatusEnum) -> None:
+        """Buffer the status of the message.
+
+        Args:
+            message_id: ID of the message.
+            status: New status of the message.
+        """
+
+        self.__pending[message_id] = status
+        if len(self.__pending) >= settings.WORKER.STATUS_BATCH_SIZE:
+            self.__start_flush()
+        elif self.__timer is None:
+            self.__timer = asyncio.get_running_loop().call_later(
+                settings.WORKER.STATUS_FLUSH_MS / 1000,
+                self.__start_flush,
+            )
+
+    async def flush(self) -> None:
+        """Write all buffered statuses."""
+
+        async with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__pending:
+                return
+
+            pending, self.__pending = self.__pending, {}
+            try:
+                await self.message_repository.message_update_statuses(
+                    cmds=[
+                        models.MessageUpdateStatusCommand(
+                            message_id=message_id,
+                            message_status=status,
+                        )
+                        for message_id, status in pending.items()
+                    ],
+                )
+            except Exception:
+                self.__logger.exception(
+                    "Failed to write statuses of %s messages. Retry later.",
+                    len(pending),
+                )
+                # Transitions buffered meanwhile are newer.
+                self.__pending = {**pending, **self.__pending}
+                self.__timer = asyncio.get_running_loop().call_later(
+                    settings.WORKER.STATUS_FLUSH_MS / 1000,
+                    self.__start_flush,
+                )
+
+    async def close(self) -> None:
+        """Wait for running flushes and write the rest of the buffer."""
+
+        await asyncio.gather(*self.__flushes, return_exceptions=True)
+        await self.flush()
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__pending:
+            self.__logger.error("Statuses of %s messages are lost.", len(self.__pending))
+
+    def __start_flush(self) -> None:
+        """Run flush in background."""
+
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        task = asyncio.create_task(self.flush())
+        self.__flushes.add(task)
+        task.add_done_callback(self.__flushes.discard)
@@ -0,0 +1,157 @@
+"""Supervisor of worker processes."""
+
+import multiprocessing
+import signal
+import time
+from logging import Logger
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from typing import Callable
+
+from app.pkg.logger import get_logger
+
+__all__ = ["WorkerSupervisor"]
+
+
+class WorkerSupervisor:
+    """Run ``processes`` copies of ``target`` and restart crashed ones.
+
+    Each child gets its own index, so logs of the children can be told apart.
+    A child that crashes is restarted after ``restart_delay`` seconds. The delay
+    is doubled on each crash that happens within ``max_restart_delay`` seconds
+    after start, and reset after a child has run longer than that.
+
+    On SIGTERM or SIGINT children receive SIGTERM and get ``stop_timeout``
+    seconds to exit before they are killed.
+
+    Examples:
+        ::
+
+            >>> def run(index: int) -> None:
+            ...     ...
+            >>> WorkerSupervisor(target=run, processes=4).run()
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        processes: int,
+        restart_delay: float = 1,
+        max_restart_delay: float = 60,
+        stop_timeout: float = 30,
+    ):
+        """Initialize supervisor.
+
+        Args:
+            target: Importable function run in each child with its index.
+            processes: Count of children.
+            restart_delay: Initial delay in seconds before restart of a child.
+            max_restart_delay: Upper bound of the restart delay in seconds.
+            stop_timeout: Seconds given to children to exit on stop.
+        """
+
+        self._target = target
+        self._processes = processes
+        self._restart_delay = restart_delay
+        self._max_restart_delay = max_restart_delay
+        self._stop_timeout = stop_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._children: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._delays: dict[int, float] = {}
+        self._restart_at: dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Start children and supervise them until SIGTERM or SIGINT."""
+
+        signal.signal(signal.SIGTERM, self.__request_stop)
+        signal.signal(signal.SIGINT, self.__request_stop)
+
+        self.__logger.info("Start %s worker processes.", self._processes)
+        for index in range(self._processes):
+            self.__start(index)
+
+        try:
+            while not self._stopping:
+                self.__supervise()
+        finally:
+            self.__stop_children()
+
+    def __supervise(self) -> None:
+        """Wait for exited children and restart them when their delay passes."""
+
+        now = time.monotonic()
+        timeout = min(
+            (at - now for at in self._restart_at.values()),
+            default=1.0,
+        )
+        sentinels = {child.sentinel: index for index, child in self._children.items()}
+        for sentinel in wait(list(sentinels), timeout=max(timeout, 0)):
+            self.__on_exit(sentinels[sentinel])
+
+        now = time.monotonic()
+        for index, at in list(self._restart_at.items()):
+            if at <= now and not self._stopping:
+                del self._restart_at[index]
+                self.__start(index)
+
+    def __on_exit(self, index: int) -> None:
+        """Schedule restart of the exited child."""
+
+        child = self._children.pop(index)
+        child.join()
+        if self._stopping:
+            return
+
+        uptime = time.monotonic() - self._started_at[index]
+        if uptime > self._max_restart_delay:
+            self._delays[index] = self._restart_delay
+        delay = self._delays.get(index, self._restart_delay)
+        self._delays[index] = min(delay * 2, self._max_restart_delay)
+        self._restart_at[index] = time.monotonic() + delay
+
+        self.__logger.error(
+            "Worker process %s exited with code %s. Restart in %.1f s.",
+            index,
+            child.exitcode,
+            delay,
+        )
+
+    def __start(self, index: int) -> None:
+        """Start child with ``index``."""
+
+        child = self._context.Process(
+            target=self._target,
+            args=(index,),
+            name=f"worker-{index}",
+            daemon=False,
+        )
+        child.start()
+        self._children[index] = child
+        self._started_at[index] = time.monotonic()
+        self.__logger.info("Worker process %s started. PID: %s.", index, child.pid)
+
+    def __request_stop(self, signum: int, _frame: object) -> None:
+        """Signal handler: stop the supervise loop."""
+
+        self.__logger.info("Received %s. Stop worker processes.", signal.Signals(signum).name)
+        self._stopping = True
+
+    def __stop_children(self) -> None:
+        """Terminate children, wait for them and kill the ones left."""
+
+        for child in self._children.values():
+            if child.is_alive():
+                child.terminate()
+
+        deadline = time.monotonic() + self._stop_timeout
+        for child in self._children.values():
+            child.join(timeout=max(deadline - time.monotonic(), 0))
+            if child.is_alive():
+                self.__logger.warning("Worker process %s is killed.", child.name)
+                child.kill()
+                child.join()
+        self._children.clear()
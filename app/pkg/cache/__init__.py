@@ -0,0 +1,5 @@
+"""In-process caches."""
+
+# ruff: noqa
+
+from app.pkg.cache.ttl_cache import CacheStats, TTLCache
@@ -0,0 +1,158 @@
+"""In-process read-through cache with TTL and LRU eviction."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+__all__ = ["CacheStats", "TTLCache"]
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        name: Name of the cache.
+        hits: Count of lookups served from the cache.
+        misses: Count of lookups that were not found or expired.
+        evictions: Count of entries evicted by LRU policy.
+        size: Current count of entries.
+    """
+
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TTLCache(Generic[_K, _V]):
+    """In-process cache with TTL and LRU eviction.
+
+    Not thread-safe: the cache must be used only from the event loop thread.
+
+    Examples:
+        ::
+
+            >>> cache = TTLCache(name="text_template", max_size=2, ttl=60)
+            >>> async def read(code: str) -> str:
+            ...     return await cache.get_or_load(code, lambda: load(code))
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float):
+        """Initialize cache.
+
+        Args:
+            name: Name of the cache, used in stats.
+            max_size: Max count of entries. The least recently used entry is
+                evicted when the cache is full.
+            ttl: Time to live of an entry in seconds.
+        """
+
+        self.name = name
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: OrderedDict[_K, tuple[float, _V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: _K) -> _V | None:
+        """Get value by key.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            Cached value or None if entry is missing or expired.
+        """
+
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expire_at, value = entry
+        if expire_at <= time.monotonic():
+            del self._data[key]
+            self._misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: _K, value: _V) -> None:
+        """Set value by key.
+
+        Args:
+            key: Key of the entry.
+            value: Value of the entry.
+        """
+
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_load(self, key: _K, loader: Callable[[], Awaitable[_V]]) -> _V:
+        """Read-through lookup: get value from cache or load and cache it.
+
+        Exceptions of ``loader`` are not cached and propagated to the caller.
+
+        Args:
+            key: Key of the entry.
+            loader: Coroutine function loading value on cache miss.
+
+        Returns:
+            Cached or loaded value.
+        """
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = await loader()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: _K) -> None:
+        """Drop entry by key."""
+
+        self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[_V], bool]) -> int:
+        """Drop all entries which value matches ``predicate``.
+
+        Args:
+            predicate: Function returning True for value to drop.
+
+        Returns:
+            Count of dropped entries.
+        """
+
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+
+        self._data.clear()
+
+    def stats(self) -> CacheStats:
+        """Get snapshot of cache counters."""
+
+        return CacheStats(
+            name=self.name,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._data),
+        )
@@ -2,7 +2,10 @@
 
 from dependency_injector import containers, providers
 
+from app.pkg.clients.v1.bot_api_pool import BotAPIClientPool
 from app.pkg.clients.v1.email import EmailClient
+from app.pkg.clients.v1.smtp_pool import SMTPSessionPool
+from app.pkg.clients.v1.telegram import TelegramClient
 from app.pkg.settings import settings
 
 __all__ = [
@@ -16,6 +19,32 @@ class Clients(containers.DeclarativeContainer):
     configuration = providers.Configuration(name="settings")
     configuration.from_dict(settings.model_dump())
 
+    smtp_session_pool = providers.Singleton(
+        SMTPSessionPool,
+        max_size=configuration.SMTP.POOL_MAX_SIZE,
+        idle_timeout=configuration.SMTP.IDLE_TIMEOUT,
+        timeout=configuration.SMTP.TIMEOUT,
+        max_workers=configuration.SMTP.MAX_WORKERS,
+    )
+
     email_client = providers.Factory(
         EmailClient
     )
+    email_client.add_attributes(
+        session_pool=smtp_session_pool,
+    )
+
+    bot_api_pool = providers.Singleton(
+        BotAPIClientPool,
+        base_url=configuration.TELEGRAM.API_URL,
+        timeout=configuration.TELEGRAM.TIMEOUT,
+        max_connections=configuration.TELEGRAM.MAX_CONNECTIONS,
+        keepalive_expiry=configuration.TELEGRAM.KEEPALIVE_EXPIRY,
+    )
+
+    telegram_client = providers.Factory(
+        TelegramClient
+    )
+    telegram_client.add_attributes(
+        bot_pool=bot_api_pool,
+    )
@@ -0,0 +1,92 @@
+"""Pool of keep-alive Telegram Bot API clients."""
+
+from logging import Logger
+
+import httpx
+
+from app.pkg.logger import get_logger
+
+__all__ = ["BotAPIClientPool"]
+
+
+class BotAPIClientPool:
+    """Shared keep-alive HTTP clients of Telegram Bot API, one per bot.
+
+    Client of a bot is created on the first request of the bot and reused by
+    all its requests, so TCP and TLS handshakes are paid once per connection
+    of the pool instead of once per message.
+
+    Examples:
+        ::
+
+            >>> pool = BotAPIClientPool(
+            ...     base_url="https://api.telegram.org",
+            ...     timeout=10,
+            ...     max_connections=16,
+            ...     keepalive_expiry=60,
+            ... )
+            >>> async def send() -> None:
+            ...     client = pool.get("123456789:AAH7f5Lr2q8x")
+            ...     await client.post("sendMessage", json={"chat_id": 1, "text": "hi"})
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        max_connections: int,
+        keepalive_expiry: float,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize pool of Bot API clients.
+
+        Args:
+            base_url: Base URL of Bot API.
+            timeout: Timeout of requests in seconds.
+            max_connections: Max count of connections per bot.
+            keepalive_expiry: Seconds after which an idle connection is closed.
+            transport: Transport of all clients, e.g. :class:`httpx.MockTransport`
+                in tests. By default connections are opened by the clients.
+        """
+
+        self._base_url = base_url.rstrip("/")
+        self._timeout = httpx.Timeout(timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, token: str) -> httpx.AsyncClient:
+        """Get client of the bot. Request paths are relative to the bot URL.
+
+        Args:
+            token: Token of the bot.
+
+        Returns:
+            Shared :class:`httpx.AsyncClient` of the bot.
+        """
+
+        client = self._clients.get(token)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=f"{self._base_url}/bot{token}/",
+                timeout=self._timeout,
+                limits=self._limits,
+                transport=self._transport,
+            )
+            self._clients[token] = client
+        return client
+
+    async def close(self) -> None:
+        """Close clients of all bots."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+        self.__logger.debug("Closed %s Bot API clients.", len(clients))
@@ -1,17 +1,12 @@
 """Models for Mail object."""
 
-import datetime
-import email
-import imaplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.policy import default
 from logging import Logger
-from smtplib import SMTP, SMTPException
-from bs4 import BeautifulSoup
-from pydantic import EmailStr
-from email.utils import parseaddr, formataddr
+from smtplib import SMTPServerDisconnected
+from typing import Awaitable, Callable, Sequence
 
+from app.pkg.clients.v1.smtp_pool import SMTPSessionPool
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 
@@ -19,14 +14,22 @@ from app.pkg.models import v1 as models
 __all__ = ["EmailClient"]
 
 
+class _SessionBroken(Exception):
+    """Session is broken by a send and must be replaced."""
+
+
 class EmailClient:
     """MailService service."""
 
+    session_pool: SMTPSessionPool
     __logger: Logger = get_logger(__name__)
 
     async def message_send_email(self, cmd: models.MessageSendCommand) -> bool:
         """Sends an email via SMTP.
 
+        Session is taken from :class:`.SMTPSessionPool`, so connection, STARTTLS
+        and LOGIN are paid only once per (host, port, username).
+
         Args:
             cmd (models.SendEmailCommand): Email parameters, including sender, recipient, subject, body, and server details.
 
@@ -34,23 +37,13 @@ class EmailClient:
             bool: True if the email is sent successfully, False if an error occurs.
         """
         try:
-            with SMTP(cmd.email_host, cmd.email_port, timeout=10) as smtp:
-                self.__logger.debug("SMTP connection is successful")
-                smtp.starttls()
-                smtp.login(cmd.email_sender, cmd.email_password)
-                self.__logger.debug("SMTP login is successful")
-
-                msg = MIMEMultipart()
-                msg["From"] = cmd.email_sender
-                msg["To"] = ", ".join(str(email_item ) for email_item in [cmd.message_receiver])
-                msg["Subject"] = cmd.text_template_subject
-                msg.attach(MIMEText(cmd.text_template_content, "plain"))
-
-                smtp.sendmail(
-                    cmd.email_sender,
-                    [str(email_item ) for email_item in [cmd.message_receiver]],
-                    msg.as_string(),
-                )
+            async with self.session_pool.acquire(
+                host=cmd.email_host,
+                port=cmd.email_port,
+                username=cmd.email_sender,
+                password=cmd.email_password,
+            ) as smtp:
+                await smtp.sendmail(*self.__build_envelope(cmd))
                 self.__logger.info(
                     "Email sent successfully from %s to %s",
                     cmd.email_sender,
@@ -60,6 +53,90 @@ class EmailClient:
         except Exception as exc:
             self.__logger.exception(
                 "Failed to send email from %s to %s. Error: %s",
+                cmd.email_sender,
+                cmd.message_receiver,
                 exc,
             )
             raise exc
+
+    async def message_send_emails(
+        self,
+        cmds: Sequence[models.MessageSendCommand],
+        before_send: Callable[[models.MessageSendCommand], Awaitable[None]] | None = None,
+    ) -> list[Exception | None]:
+        """Sends emails of one sender over a single SMTP session.
+
+        Each email is a separate MAIL FROM/RCPT TO transaction, so an email
+        refused by the server does not fail the others. If the session is
+        dropped, the remaining emails are sent over a new one.
+
+        Args:
+            cmds: Emails with the same host, port and sender.
+            before_send: Coroutine function awaited before each email, e.g. a
+                rate limiter.
+
+        Returns:
+            list[Exception | None]: Error of each email in the order of ``cmds``,
+            None if the email is sent.
+        """
+
+        results: list[Exception | None] = [None] * len(cmds)
+        if not cmds:
+            return results
+
+        first = cmds[0]
+        index = 0
+        while index < len(cmds):
+            try:
+                async with self.session_pool.acquire(
+                    host=first.email_host,
+                    port=first.email_port,
+                    username=first.email_sender,
+                    password=first.email_password,
+                ) as smtp:
+                    while index < len(cmds):
+                        cmd = cmds[index]
+                        try:
+                            if before_send is not None:
+                                await before_send(cmd)
+                            await smtp.sendmail(*self.__build_envelope(cmd))
+                        except (SMTPServerDisconnected, OSError) as exc:
+                            results[index] = exc
+                            index += 1
+                            raise _SessionBroken from exc
+                        except Exception as exc:
+                            results[index] = exc
+                        index += 1
+            except _SessionBroken:
+                self.__logger.warning("SMTP session of %s is broken. Reconnect.", first.email_sender)
+            except Exception as exc:
+                # Connect or login is failed: no email of the batch can be sent.
+                for rest in range(index, len(cmds)):
+                    results[rest] = exc
+                break
+
+        self.__logger.info(
+            "Sent %s of %s emails from %s over one session.",
+            results.count(None),
+            len(cmds),
+            first.email_sender,
+        )
+        return results
+
+    @staticmethod
+    def __build_envelope(cmd: models.MessageSendCommand) -> tuple[str, list[str], str]:
+        """Build envelope sender, recipients and message of ``cmd``."""
+
+        msg = MIMEMultipart()
+        msg["From"] = cmd.email_sender
+        msg["To"] = ", ".join(str(email_item ) for email_item in [cmd.message_receiver])
+        msg["Subject"] = cmd.text_template_subject
+        if cmd.email_message_id:
+            msg["Message-ID"] = cmd.email_message_id
+        msg.attach(MIMEText(cmd.text_template_content, "plain"))
+
+        return (
+            cmd.email_sender,
+            [str(email_item ) for email_item in [cmd.message_receiver]],
+            msg.as_string(),
+        )
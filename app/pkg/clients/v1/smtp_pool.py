@@ -0,0 +1,226 @@
+"""Pool of authenticated SMTP sessions."""
+
+import asyncio
+import time
+from collections import deque
+from concurrent import futures
+from contextlib import asynccontextmanager
+from functools import partial
+from logging import Logger
+from smtplib import SMTP, SMTPException
+from typing import AsyncIterator, Callable, TypeVar
+
+from app.pkg.logger import get_logger
+
+__all__ = ["SMTPSession", "SMTPSessionPool"]
+
+_T = TypeVar("_T")
+
+#: tuple[str, int, str]: Key of the pool bucket: (host, port, username).
+SessionKey = tuple[str, int, str]
+
+
+class SMTPSession:
+    """Authenticated SMTP session.
+
+    All blocking ``smtplib`` calls are executed in the executor of the pool, so
+    the event loop is never blocked by network I/O.
+    """
+
+    key: SessionKey
+    last_used_at: float
+
+    def __init__(self, smtp: SMTP, key: SessionKey, executor: futures.Executor):
+        self.key = key
+        self.last_used_at = time.monotonic()
+        self._smtp = smtp
+        self._executor = executor
+
+    async def _run(self, fn: Callable[..., _T], *args: object) -> _T:
+        """Run blocking ``fn`` in the executor of the pool."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args))
+
+    async def sendmail(self, from_addr: str, to_addrs: list[str], msg: str) -> dict:
+        """Send message over current session.
+
+        Args:
+            from_addr: Envelope sender (MAIL FROM).
+            to_addrs: Envelope recipients (RCPT TO).
+            msg: Message as string.
+
+        Returns:
+            Dict of refused recipients, see :meth:`smtplib.SMTP.sendmail`.
+        """
+
+        return await self._run(self._smtp.sendmail, from_addr, to_addrs, msg)
+
+    async def is_alive(self) -> bool:
+        """Check liveness of the session with NOOP command."""
+
+        try:
+            code, _ = await self._run(self._smtp.noop)
+        except (SMTPException, OSError):
+            return False
+        return code == 250
+
+    async def close(self) -> None:
+        """Quit from the SMTP server and close the socket."""
+
+        try:
+            await self._run(self._smtp.quit)
+        except (SMTPException, OSError):
+            self._smtp.close()
+
+
+class SMTPSessionPool:
+    """Pool of logged-in SMTP sessions grouped by (host, port, username).
+
+    Sessions are reused across messages. Idle session is checked with NOOP
+    before reuse and closed after ``idle_timeout`` seconds without use.
+
+    Examples:
+        ::
+
+            >>> pool = SMTPSessionPool(max_size=4, idle_timeout=60, timeout=10)
+            >>> async def send() -> None:
+            ...     async with pool.acquire("smtp.host", 587, "user", "pass") as s:
+            ...         await s.sendmail("user", ["to@host"], "message")
+    """
+
+    __logger: Logger = get_logger(__name__)
+
+    def __init__(
+        self,
+        max_size: int,
+        idle_timeout: int,
+        timeout: int,
+        max_workers: int | None = None,
+    ):
+        """Initialize pool of SMTP sessions.
+
+        Args:
+            max_size: Max count of opened sessions per (host, port, username).
+            idle_timeout: Seconds after which an unused session is closed.
+            timeout: Timeout of SMTP socket operations.
+            max_workers: Count of threads executing blocking SMTP calls.
+        """
+
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="smtp",
+        )
+        self._idle: dict[SessionKey, deque[SMTPSession]] = {}
+        self._limits: dict[SessionKey, asyncio.Semaphore] = {}
+        self._reaper: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+    ) -> AsyncIterator[SMTPSession]:
+        """Acquire authenticated session from pool.
+
+        Session that raised an error is closed and not returned to pool.
+
+        Args:
+            host: SMTP host.
+            port: SMTP port.
+            username: Login of SMTP account.
+            password: Password of SMTP account.
+
+        Returns:
+            Authenticated :class:`.SMTPSession`.
+        """
+
+        self.__start_reaper()
+        key = (host, port, username)
+        limit = self._limits.setdefault(key, asyncio.Semaphore(self._max_size))
+
+        async with limit:
+            session = await self.__take_idle(key) or await self.__connect(
+                key=key,
+                password=password,
+            )
+            try:
+                yield session
+            except BaseException:
+                await session.close()
+                raise
+            session.last_used_at = time.monotonic()
+            self._idle.setdefault(key, deque()).append(session)
+
+    async def close(self) -> None:
+        """Close all idle sessions and stop the executor."""
+
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        sessions = [s for bucket in self._idle.values() for s in bucket]
+        self._idle.clear()
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+        self._executor.shutdown(wait=False)
+
+    async def __take_idle(self, key: SessionKey) -> SMTPSession | None:
+        """Take the most recently used alive session of ``key``."""
+
+        bucket = self._idle.get(key)
+        while bucket:
+            session = bucket.pop()
+            if await session.is_alive():
+                return session
+            self.__logger.debug("SMTP session %s is dead. Reconnect.", key)
+            await session.close()
+        return None
+
+    async def __connect(self, key: SessionKey, password: str) -> SMTPSession:
+        """Open new session: connect, STARTTLS and LOGIN."""
+
+        host, port, username = key
+
+        def connect() -> SMTP:
+            smtp = SMTP(host, port, timeout=self._timeout)
+            try:
+                smtp.starttls()
+                smtp.login(username, password)
+            except BaseException:
+                smtp.close()
+                raise
+            return smtp
+
+        loop = asyncio.get_running_loop()
+        smtp = await loop.run_in_executor(self._executor, connect)
+        self.__logger.debug("SMTP session %s is opened.", key)
+        return SMTPSession(smtp=smtp, key=key, executor=self._executor)
+
+    def __start_reaper(self) -> None:
+        """Start background task closing idle sessions."""
+
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self.__reap_idle())
+
+    async def __reap_idle(self) -> None:
+        """Close sessions unused for more than ``idle_timeout`` seconds."""
+
+        while True:
+            await asyncio.sleep(max(self._idle_timeout / 2, 1))
+            deadline = time.monotonic() - self._idle_timeout
+            expired = []
+            for bucket in self._idle.values():
+                # Bucket is ordered by last use: the oldest sessions are on the left.
+                while bucket and bucket[0].last_used_at < deadline:
+                    expired.append(bucket.popleft())
+            if expired:
+                self.__logger.debug("Close %s idle SMTP sessions.", len(expired))
+                await asyncio.gather(
+                    *(s.close() for s in expired),
+                    return_exceptions=True,
+                )
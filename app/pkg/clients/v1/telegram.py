@@ -0,0 +1,73 @@
+"""Telegram Bot API client."""
+
+from logging import Logger
+
+import httpx
+
+from app.pkg.clients.v1.bot_api_pool import BotAPIClientPool
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.telegram import (
+    TelegramChatUnavailable,
+    TelegramRetryAfter,
+    TelegramSendError,
+)
+
+__all__ = ["TelegramClient"]
+
+
+class TelegramClient:
+    """Telegram Bot API client."""
+
+    bot_pool: BotAPIClientPool
+    __logger: Logger = get_logger(__name__)
+
+    async def message_send_telegram(self, cmd: models.TelegramSendCommand) -> str:
+        """Sends a message to the Telegram chat.
+
+        Client of the bot is taken from :class:`.BotAPIClientPool`, so
+        connections are kept alive between messages of the bot.
+
+        Args:
+            cmd (models.TelegramSendCommand): Bot token, chat and text of the message.
+
+        Raises:
+            TelegramRetryAfter: Flood limit of Bot API is exceeded.
+            TelegramChatUnavailable: Chat is not found or the bot is blocked.
+            TelegramSendError: Any other error of the request.
+
+        Returns:
+            str: Identifier of the sent message in the chat.
+        """
+
+        try:
+            response = await self.bot_pool.get(cmd.telegram_bot_token).post(
+                "sendMessage",
+                json={
+                    "chat_id": cmd.telegram_chat_id,
+                    "text": cmd.text_template_content,
+                },
+            )
+            body = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            self.__logger.exception("Failed to send telegram message to %s.", cmd.telegram_chat_id)
+            raise TelegramSendError(exc) from exc
+
+        if body.get("ok"):
+            self.__logger.info("Telegram message sent successfully to %s.", cmd.telegram_chat_id)
+            return str(body["result"]["message_id"])
+
+        error_code = body.get("error_code", response.status_code)
+        description = body.get("description") or TelegramSendError.message
+        self.__logger.error(
+            "Failed to send telegram message to %s. Error %s: %s",
+            cmd.telegram_chat_id,
+            error_code,
+            description,
+        )
+        if error_code == 429:
+            retry_after = (body.get("parameters") or {}).get("retry_after", 1)
+            raise TelegramRetryAfter(retry_after=float(retry_after), message=description)
+        if error_code in (400, 403):
+            raise TelegramChatUnavailable(description)
+        raise TelegramSendError(description)
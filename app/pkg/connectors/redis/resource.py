@@ -1,6 +1,6 @@
 """Async resource for Redis connector."""
 
-from redis.asyncio import ConnectionPool, from_url
+from redis.asyncio import Redis, from_url
 
 from app.pkg.connectors.resources import BaseAsyncResource
 
@@ -10,19 +10,19 @@ __all__ = ["RedisResource"]
 class RedisResource(BaseAsyncResource):
     """Redis connector using aiopg."""
 
-    async def init(self, dsn: str, *args, **kwargs) -> ConnectionPool:
-        """Getting connection pool in asynchronous.
+    async def init(self, dsn: str, *args, **kwargs) -> Redis:
+        """Getting client with connection pool in asynchronous.
 
         Args:
             dsn: D.S.N - Data Source Name.
 
         Returns:
-            Created connection pool.
+            Created client.
         """
 
         return await from_url(url=dsn, **kwargs)
 
-    async def shutdown(self, resource: ConnectionPool) -> None:
+    async def shutdown(self, resource: Redis) -> None:
         """Close connection.
 
         Args:
@@ -35,4 +35,4 @@ class RedisResource(BaseAsyncResource):
             ``Closing`` provider is used.
         """
 
-        await resource.disconnect()
+        await resource.aclose()
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID as UUIDType
 
-from sqlalchemy import Enum as SQLEnum, ForeignKey
+from sqlalchemy import Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -39,3 +39,12 @@ class Delivery(Base):
     delivery_finalized_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
     recipient = relationship("Recipient", back_populates="deliveries")
+
+    __table_args__ = (
+        # Updates of provider events by provider message ID.
+        Index(
+            "ix_delivery_provider_message_id",
+            "delivery_provider_message_id",
+            postgresql_where=delivery_provider_message_id.isnot(None),
+        ),
+    )
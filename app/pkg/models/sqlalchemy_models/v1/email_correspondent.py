@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID as UUIDType
 
-from sqlalchemy import func
+from sqlalchemy import Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,9 +24,33 @@ class EmailCorrespondent(Base):
     email_port: Mapped[int] = mapped_column(nullable=False)
     email_username: Mapped[str] = mapped_column(nullable=False)
     email_password: Mapped[str] = mapped_column(nullable=False)
+    email_rate_limit: Mapped[Optional[float]] = mapped_column(nullable=True)
+    email_rate_burst: Mapped[Optional[int]] = mapped_column(nullable=True)
     email_correspondent_create_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False
     )
     email_correspondent_update_at: Mapped[Optional[datetime]] = mapped_column(
         onupdate=func.now()
     )
+
+    __table_args__ = (
+        # Lookup of the send path: active correspondent by name.
+        Index(
+            "ix_email_correspondent_name_active",
+            "email_correspondent_name",
+            postgresql_where=email_correspondent_is_active.is_(True),
+        ),
+        # Keyset pagination of the list: newest first.
+        Index(
+            "ix_email_correspondent_create_at_id",
+            "email_correspondent_create_at",
+            "email_correspondent_id",
+        ),
+        # Substring search of the list.
+        Index(
+            "ix_email_correspondent_name_trgm",
+            "email_correspondent_name",
+            postgresql_using="gin",
+            postgresql_ops={"email_correspondent_name": "gin_trgm_ops"},
+        ),
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from uuid import UUID as UUIDType
 
-from sqlalchemy import Enum as SQLEnum, ForeignKey, func
+from sqlalchemy import Enum as SQLEnum, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,3 +33,8 @@ class Message(Base):
     created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
 
     recipient = relationship("Recipient", back_populates="messages", passive_deletes=True)
+
+    __table_args__ = (
+        # Scans of messages in a status, oldest first.
+        Index("ix_message_status_created_at", "message_status", "created_at"),
+    )
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID as UUIDType
 
-from sqlalchemy import func
+from sqlalchemy import Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,3 +27,25 @@ class TelegramCorrespondent(Base):
     telegram_correspondent_update_at: Mapped[Optional[datetime]] = mapped_column(
         onupdate=func.now()
     )
+
+    __table_args__ = (
+        # Lookup of the send path: active correspondent by name.
+        Index(
+            "ix_telegram_correspondent_name_active",
+            "telegram_correspondent_name",
+            postgresql_where=telegram_correspondent_is_active.is_(True),
+        ),
+        # Keyset pagination of the list: newest first.
+        Index(
+            "ix_telegram_correspondent_create_at_id",
+            "telegram_correspondent_create_at",
+            "telegram_correspondent_id",
+        ),
+        # Substring search of the list.
+        Index(
+            "ix_telegram_correspondent_name_trgm",
+            "telegram_correspondent_name",
+            postgresql_using="gin",
+            postgresql_ops={"telegram_correspondent_name": "gin_trgm_ops"},
+        ),
+    )
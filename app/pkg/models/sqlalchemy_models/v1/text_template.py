@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID as UUIDType
 
-from sqlalchemy import Enum as SQLEnum, func
+from sqlalchemy import Enum as SQLEnum, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -36,3 +36,26 @@ class TextTemplate(Base):
     text_template_update_at: Mapped[Optional[datetime]] = mapped_column(
         onupdate=func.now()
     )
+
+    __table_args__ = (
+        # Lookup of the send path: active template by code and channel.
+        Index(
+            "ix_text_template_code_channel_active",
+            "text_template_code",
+            "text_template_channel",
+            postgresql_where=text_template_is_active.is_(True),
+        ),
+        # Keyset pagination of the list: newest first.
+        Index(
+            "ix_text_template_create_at_id",
+            "text_template_create_at",
+            "text_template_id",
+        ),
+        # Substring search of the list.
+        Index(
+            "ix_text_template_code_trgm",
+            "text_template_code",
+            postgresql_using="gin",
+            postgresql_ops={"text_template_code": "gin_trgm_ops"},
+        ),
+    )
@@ -1,3 +1,4 @@
+from app.pkg.models.v1.app.page import *
 from app.pkg.models.v1.app.email_correspondent import *
 from app.pkg.models.v1.app.telegram_correspondent import *
 from app.pkg.models.v1.app.message import *
@@ -8,7 +8,13 @@ from app.pkg.models.base import BaseModel, BaseEnum
 from app.pkg.models.base.optional_field import create_optional_fields_class
 
 __all__ = [
-    "DeliveryStatusEnum"
+    "DeliveryStatusEnum",
+    "DeliveryEventStatusEnum",
+    "Delivery",
+    "DeliveryEvent",
+    "DeliveryCreateCommand",
+    "DeliveryEventsIngestCommand",
+    "DeliveryEventsIngestResponse",
 ]
 
 
@@ -19,6 +25,69 @@ class BaseDelivery(BaseModel):
 class DeliveryFields:
     """Delivery fields."""
 
+    delivery_id: UUID = Field(
+        description="Unique identifier of the delivery attempt.",
+        examples=["5c1e4b0a-2f7d-4c39-9a52-0b1f3e6d8a21"],
+    )
+    recipient_id: UUID = Field(
+        description="Unique identifier of the recipient.",
+        examples=["123e4567-e89b-12d3-a456-426614174000"],
+    )
+    delivery_attempt_no: int = Field(
+        description="Number of the send attempt, starting from 1.",
+        ge=1,
+        examples=[1, 2],
+    )
+    delivery_provider: str = Field(
+        description="Provider used to send the message.",
+        examples=["smtp", "telegram"],
+    )
+    delivery_status: "DeliveryStatusEnum" = Field(
+        description="Status of the delivery attempt.",
+        examples=["sent", "failed"],
+    )
+    delivery_provider_message_id: str = Field(
+        description="Identifier of the message on the provider side.",
+        examples=["<20240912101530.1234@smtp.yourapp.io>"],
+    )
+    delivery_error_code: str = Field(
+        description="Code of the error of the failed attempt.",
+        examples=["SMTPServerDisconnected"],
+    )
+    delivery_error_message: str = Field(
+        description="Message of the error of the failed attempt.",
+        examples=["Connection unexpectedly closed"],
+    )
+    delivery_queued_at: datetime = Field(
+        description="Date and time when the message was queued.",
+        examples=["2024-09-12T10:15:30Z"],
+    )
+    delivery_sent_at: datetime = Field(
+        description="Date and time when the message was sent.",
+        examples=["2024-09-12T10:15:31Z"],
+    )
+    delivery_finalized_at: datetime = Field(
+        description="Date and time when the attempt was finished.",
+        examples=["2024-09-12T10:15:31Z"],
+    )
+    delivery_event_status: "DeliveryEventStatusEnum" = Field(
+        description="Status of the delivery reported by the provider.",
+        examples=["delivered", "opened", "bounced"],
+    )
+    delivery_events: list["DeliveryEvent"] = Field(
+        description="Status transitions reported by the provider.",
+        min_length=1,
+        max_length=1000,
+    )
+    delivery_events_accepted: int = Field(
+        description="Count of accepted status transitions.",
+        examples=[1000],
+    )
+
+
+OptionalDeliveryFields = create_optional_fields_class(DeliveryFields)
+
+
 class DeliveryStatusEnum(BaseEnum):
     QUEUED = "queued"
     SENT = "sent"
@@ -26,4 +95,65 @@ class DeliveryStatusEnum(BaseEnum):
     DELIVERED = "delivered"
     OPENED = "opened"
     CLICKED = "clicked"
-    BOUNCED = "bounced"
\ No newline at end of file
+    BOUNCED = "bounced"
+
+
+class DeliveryEventStatusEnum(BaseEnum):
+    """Statuses reported by providers after the send."""
+
+    DELIVERED = "delivered"
+    OPENED = "opened"
+    CLICKED = "clicked"
+    BOUNCED = "bounced"
+    FAILED = "failed"
+
+
+class Delivery(BaseDelivery):
+    """Delivery model."""
+
+    delivery_id: UUID = DeliveryFields.delivery_id
+    recipient_id: UUID = DeliveryFields.recipient_id
+    delivery_attempt_no: int = DeliveryFields.delivery_attempt_no
+    delivery_provider: str = DeliveryFields.delivery_provider
+    delivery_status: DeliveryStatusEnum = DeliveryFields.delivery_status
+    delivery_provider_message_id: str | None = OptionalDeliveryFields.delivery_provider_message_id
+    delivery_error_code: str | None = OptionalDeliveryFields.delivery_error_code
+    delivery_error_message: str | None = OptionalDeliveryFields.delivery_error_message
+    delivery_queued_at: datetime | None = OptionalDeliveryFields.delivery_queued_at
+    delivery_sent_at: datetime | None = OptionalDeliveryFields.delivery_sent_at
+    delivery_finalized_at: datetime | None = OptionalDeliveryFields.delivery_finalized_at
+
+
+class DeliveryEvent(BaseDelivery):
+    """Status transition of the delivery reported by the provider."""
+
+    delivery_provider_message_id: str = DeliveryFields.delivery_provider_message_id
+    delivery_status: DeliveryEventStatusEnum = DeliveryFields.delivery_event_status
+
+
+class DeliveryEventsIngestResponse(BaseDelivery):
+    """Result of the events ingestion."""
+
+    delivery_events_accepted: int = DeliveryFields.delivery_events_accepted
+
+
+# Command.
+class DeliveryCreateCommand(BaseDelivery):
+    """Delivery create command."""
+
+    recipient_id: UUID = DeliveryFields.recipient_id
+    delivery_attempt_no: int = DeliveryFields.delivery_attempt_no
+    delivery_provider: str = DeliveryFields.delivery_provider
+    delivery_status: DeliveryStatusEnum = DeliveryFields.delivery_status
+    delivery_provider_message_id: str | None = OptionalDeliveryFields.delivery_provider_message_id
+    delivery_error_code: str | None = OptionalDeliveryFields.delivery_error_code
+    delivery_error_message: str | None = OptionalDeliveryFields.delivery_error_message
+    delivery_queued_at: datetime | None = OptionalDeliveryFields.delivery_queued_at
+    delivery_sent_at: datetime | None = OptionalDeliveryFields.delivery_sent_at
+    delivery_finalized_at: datetime | None = OptionalDeliveryFields.delivery_finalized_at
+
+
+class DeliveryEventsIngestCommand(BaseDelivery):
+    """Batch of status transitions reported by the provider."""
+
+    delivery_events: list[DeliveryEvent] = DeliveryFields.delivery_events
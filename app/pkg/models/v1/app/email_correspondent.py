@@ -6,6 +6,7 @@ from pydantic.fields import Field
 
 from app.pkg.models.base import BaseModel
 from app.pkg.models.base.optional_field import create_optional_fields_class
+from app.pkg.models.v1.app.page import PageCursor, PageFields
 
 __all__ = [
     "EmailCorrespondent",
@@ -14,7 +15,9 @@ __all__ = [
     "EmailCorrespondentUpdateCommand",
     "EmailCorrespondentDeleteCommand",
     "EmailCorrespondentReadQuery",
-    "EmailCorrespondentReadByNameQuery"
+    "EmailCorrespondentReadByNameQuery",
+    "EmailCorrespondentSecrets",
+    "EmailCorrespondentReadSecretsQuery",
 ]
 
 
@@ -57,6 +60,16 @@ class EmailCorrespondentFields:
         description="Пароль или app password для SMTP.",
         examples=["••••••••"],
     )
+    email_rate_limit: float = Field(
+        description="Лимит отправки, писем в секунду. Если не задан - settings.RATE_LIMIT.",
+        gt=0,
+        examples=[1.5, 10],
+    )
+    email_rate_burst: int = Field(
+        description="Количество писем, которое можно отправить подряд без ожидания.",
+        ge=1,
+        examples=[1, 20],
+    )
     email_correspondent_create_at: datetime = Field(
         description="Момент создания записи (UTC).",
         examples=["2025-09-13T12:34:56Z"],
@@ -66,6 +79,12 @@ class EmailCorrespondentFields:
         description="Момент последнего обновления записи (UTC).",
         examples=[None, "2025-09-13T12:45:01Z"],
     )
+    email_correspondent_search_rank: float = Field(
+        description="Сходство имени с искомой подстрокой, от 0 до 1. Заполняется только при поиске.",
+        ge=0,
+        le=1,
+        examples=[0.42],
+    )
 
 
 OptionalEmailCorrespondentFields = create_optional_fields_class(EmailCorrespondentFields)
@@ -80,6 +99,8 @@ class EmailCorrespondent(BaseEmailCorrespondent):
     email_port: int = EmailCorrespondentFields.email_port
     email_username: str = EmailCorrespondentFields.email_username
     email_password: str = EmailCorrespondentFields.email_password
+    email_rate_limit: float | None = OptionalEmailCorrespondentFields.email_rate_limit
+    email_rate_burst: int | None = OptionalEmailCorrespondentFields.email_rate_burst
     email_correspondent_is_active: bool = EmailCorrespondentFields.email_correspondent_is_active
     email_correspondent_create_at: datetime = EmailCorrespondentFields.email_correspondent_create_at
     email_correspondent_update_at: datetime | None = EmailCorrespondentFields.email_correspondent_update_at
@@ -94,9 +115,23 @@ class EmailCorrespondentResponse(BaseEmailCorrespondent):
     email_port: int = EmailCorrespondentFields.email_port
     email_password: str = EmailCorrespondentFields.email_password
     email_username: str = EmailCorrespondentFields.email_username
+    email_rate_limit: float | None = OptionalEmailCorrespondentFields.email_rate_limit
+    email_rate_burst: int | None = OptionalEmailCorrespondentFields.email_rate_burst
     email_correspondent_is_active: bool = EmailCorrespondentFields.email_correspondent_is_active
     email_correspondent_create_at: datetime = EmailCorrespondentFields.email_correspondent_create_at
     email_correspondent_update_at: datetime | None = OptionalEmailCorrespondentFields.email_correspondent_update_at
+    email_correspondent_search_rank: float | None = OptionalEmailCorrespondentFields.email_correspondent_search_rank
+
+
+class EmailCorrespondentSecrets(BaseEmailCorrespondent):
+    """EmailCorrespondent secrets model.
+
+    Secrets are never written to the shared cache, they are read from the
+    database on a cache hit of a row not seen by the process.
+    """
+
+    email_correspondent_id: UUID = EmailCorrespondentFields.email_correspondent_id
+    email_password: str = EmailCorrespondentFields.email_password
 
 
 # Command.
@@ -108,6 +143,8 @@ class EmailCorrespondentCreateCommand(BaseEmailCorrespondent):
     email_port: int = EmailCorrespondentFields.email_port
     email_username: str = EmailCorrespondentFields.email_username
     email_password: str = EmailCorrespondentFields.email_password
+    email_rate_limit: float | None = OptionalEmailCorrespondentFields.email_rate_limit
+    email_rate_burst: int | None = OptionalEmailCorrespondentFields.email_rate_burst
 
 
 class EmailCorrespondentUpdateCommand(BaseEmailCorrespondent):
@@ -119,6 +156,8 @@ class EmailCorrespondentUpdateCommand(BaseEmailCorrespondent):
     email_port: int | None = OptionalEmailCorrespondentFields.email_port
     email_username: str | None = OptionalEmailCorrespondentFields.email_username
     email_password: str | None = OptionalEmailCorrespondentFields.email_password
+    email_rate_limit: float | None = OptionalEmailCorrespondentFields.email_rate_limit
+    email_rate_burst: int | None = OptionalEmailCorrespondentFields.email_rate_burst
 
 
 class EmailCorrespondentDeleteCommand(BaseEmailCorrespondent):
@@ -134,9 +173,17 @@ class EmailCorrespondentReadQuery(BaseEmailCorrespondent):
     email_correspondent_id: UUID | None = OptionalEmailCorrespondentFields.email_correspondent_id
     email_correspondent_name: str | None = OptionalEmailCorrespondentFields.email_correspondent_name
     email_correspondent_is_active: bool | None = OptionalEmailCorrespondentFields.email_correspondent_is_active
+    cursor: PageCursor | None = PageFields.cursor
+    limit: int = PageFields.limit
 
 
 class EmailCorrespondentReadByNameQuery(BaseEmailCorrespondent):
     """EmailCorrespondent read by name query model."""
 
     email_correspondent_name: str | None = OptionalEmailCorrespondentFields.email_correspondent_name
+
+
+class EmailCorrespondentReadSecretsQuery(BaseEmailCorrespondent):
+    """EmailCorrespondent read secrets query model."""
+
+    email_correspondent_id: UUID = EmailCorrespondentFields.email_correspondent_id
@@ -13,7 +13,10 @@ __all__ = [
     "MessageStatusEnum",
     "ChannelEnum",
     "MessageVerified",
-    "MessageSendCommand"
+    "MessageNotification",
+    "MessageSendCommand",
+    "TelegramSendCommand",
+    "MessageUpdateStatusCommand",
 ]
 
 
@@ -87,6 +90,34 @@ class MessageFields:
         description="Пароль или app password для SMTP.",
         examples=["••••••••"],
     )
+    email_message_id: str = Field(
+        description="Message-ID header of the email, reported back by provider events.",
+        examples=["<175837215463.1234.5678@yourapp.io>"],
+    )
+    telegram_chat_id: int = Field(
+        description="Identifier of the Telegram chat of the user.",
+        examples=[123456789],
+    )
+    telegram_bot_token: str = Field(
+        description="Секретный токен бота, выданный @BotFather.",
+        examples=["123456789:AAH7f5Lr2q8xYv9zQpZQ0w1e2r3t4y5u6v7w"],
+    )
+    channel: "ChannelEnum" = Field(
+        description="Channel of the notification. Defaults to the channel of the queue.",
+        examples=["EMAIL", "TELEGRAM"],
+    )
+    message_id: UUID = Field(
+        description="Unique identifier of the message.",
+        examples=["9b2f1c1e-5d0c-4a53-8a0e-3f1f6c2d7b11"],
+    )
+    message_status: "MessageStatusEnum" = Field(
+        description="Status of the message.",
+        examples=["pending", "sent", "failed"],
+    )
+
+
+OptionalMessageFields = create_optional_fields_class(MessageFields)
+
 
 class MessageStatusEnum(BaseEnum):
     PENDING = "pending"
@@ -113,6 +144,26 @@ class MessageVerified(BaseMessage):
     verification_code: str = MessageFields.verification_code
 
 
+class MessageNotification(BaseMessage):
+    """Notification of any channel.
+
+    Address of the recipient is set by the field of the channel: ``email`` or
+    ``telegram_chat_id``. Status of the stored message is updated if
+    ``message_id`` is set.
+    """
+
+    event: str = MessageFields.event
+    event_id: UUID = MessageFields.event_id
+    occurred_at: datetime = MessageFields.occurred_at
+    verification_id: UUID = MessageFields.verification_id
+    user_id: UUID = MessageFields.user_id
+    verification_code: str = MessageFields.verification_code
+    channel: ChannelEnum | None = OptionalMessageFields.channel
+    email: EmailStr | None = OptionalMessageFields.user_email
+    telegram_chat_id: int | None = OptionalMessageFields.telegram_chat_id
+    message_id: UUID | None = OptionalMessageFields.message_id
+
+
 # Command.
 class MessageSendCommand(BaseMessage):
     """"""
@@ -122,5 +173,21 @@ class MessageSendCommand(BaseMessage):
     email_sender: str = MessageFields.email_sender
     message_receiver: EmailStr = MessageFields.user_email
     email_password: str = MessageFields.email_password
+    email_message_id: str | None = OptionalMessageFields.email_message_id
     text_template_subject: str = MessageFields.text_template_subject
     text_template_content: str = MessageFields.text_template_content
+
+
+class TelegramSendCommand(BaseMessage):
+    """"""
+
+    telegram_bot_token: str = MessageFields.telegram_bot_token
+    telegram_chat_id: int = MessageFields.telegram_chat_id
+    text_template_content: str = MessageFields.text_template_content
+
+
+class MessageUpdateStatusCommand(BaseMessage):
+    """Message update status command."""
+
+    message_id: UUID = MessageFields.message_id
+    message_status: MessageStatusEnum = MessageFields.message_status
@@ -0,0 +1,119 @@
+"""Page models of list endpoints."""
+
+import base64
+from datetime import datetime
+from typing import Callable, Generic, TypeVar
+from uuid import UUID
+
+from pydantic.fields import Field
+
+from app.pkg.models.base import BaseModel
+from app.pkg.models.v1.exceptions.pagination import InvalidPageCursor
+
+__all__ = [
+    "Page",
+    "PageCursor",
+]
+
+_T = TypeVar("_T")
+
+
+class PageFields:
+    """Page fields."""
+
+    items: list = Field(
+        description="Записи страницы.",
+    )
+    cursor: "PageCursor | None" = Field(
+        default=None,
+        description="Курсор, после которого начинается страница.",
+    )
+    limit: int = Field(
+        description="Максимальное количество записей на странице.",
+        ge=1,
+        examples=[50],
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы. Пустой на последней странице.",
+    )
+
+
+class PageCursor(BaseModel):
+    """Position after the last row of a page.
+
+    Rows of list endpoints are ordered by creation time and ID, both
+    descending, searched rows are ordered by their rank first. The next page
+    starts with the rows strictly below the cursor, so rows created meanwhile
+    never shift or repeat the pages.
+    """
+
+    create_at: datetime
+    id: UUID
+    #: float: Rank of the row, when the list is searched.
+    rank: float | None = None
+
+    def encode(self) -> str:
+        """Encode the cursor to an opaque string.
+
+        Returns:
+            str: URL-safe base64 of the cursor.
+        """
+
+        return base64.urlsafe_b64encode(
+            self.model_dump_json().encode(),
+        ).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        """Decode the cursor returned by :meth:`.encode`.
+
+        Args:
+            cursor: Opaque cursor.
+
+        Raises:
+            InvalidPageCursor: Cursor is not returned by :meth:`.encode`.
+
+        Returns:
+            PageCursor: Decoded cursor.
+        """
+
+        try:
+            return cls.model_validate_json(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)),
+            )
+        except ValueError as exc:
+            raise InvalidPageCursor from exc
+
+
+class Page(BaseModel, Generic[_T]):
+    """Page of a list endpoint."""
+
+    items: list[_T] = PageFields.items
+    next_cursor: str | None = PageFields.next_cursor
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: list[_T],
+        limit: int,
+        key: Callable[[_T], PageCursor],
+    ) -> "Page[_T]":
+        """Build the page from rows read with ``limit + 1``.
+
+        The extra row only tells that the next page exists, it is not returned.
+
+        Args:
+            rows: Rows of the page and the first row of the next one.
+            limit: Page size.
+            key: Cursor of the row.
+
+        Returns:
+            Page: Page with the cursor after its last row.
+        """
+
+        if len(rows) <= limit:
+            return cls(items=rows)
+
+        items = rows[:limit]
+        return cls(items=items, next_cursor=key(items[-1]).encode())
@@ -9,7 +9,8 @@ from app.pkg.models.base import BaseModel
 from app.pkg.models.base.optional_field import create_optional_fields_class
 
 __all__ = [
-
+    "Recipient",
+    "RecipientCreateCommand",
 ]
 
 
@@ -18,4 +19,52 @@ class BaseRecipient(BaseModel):
 
 
 class RecipientFields:
-    """Recipient fields."""
\ No newline at end of file
+    """Recipient fields."""
+
+    recipient_id: UUID = Field(
+        description="Unique identifier of the recipient.",
+        examples=["123e4567-e89b-12d3-a456-426614174000"],
+    )
+    recipient_user_id: UUID = Field(
+        description="Unique identifier of the user.",
+        examples=["123e4567-e89b-12d3-a456-426614174000"],
+    )
+    recipient_address: str = Field(
+        description="Address of the recipient: email or chat id.",
+        examples=["user@example.com", "123456789"],
+    )
+    recipient_locale: str = Field(
+        description="Locale of the recipient.",
+        examples=["ru", "en"],
+    )
+    recipient_timezone: str = Field(
+        description="Timezone of the recipient.",
+        examples=["Europe/Moscow"],
+    )
+    recipient_create_at: datetime = Field(
+        description="Date and time of creation.",
+        examples=["2024-09-12T10:15:30Z"],
+    )
+
+
+OptionalRecipientFields = create_optional_fields_class(RecipientFields)
+
+
+class Recipient(BaseRecipient):
+    """Recipient model."""
+
+    recipient_id: UUID = RecipientFields.recipient_id
+    recipient_user_id: UUID | None = OptionalRecipientFields.recipient_user_id
+    recipient_address: str = RecipientFields.recipient_address
+    recipient_locale: str | None = OptionalRecipientFields.recipient_locale
+    recipient_timezone: str | None = OptionalRecipientFields.recipient_timezone
+    recipient_create_at: datetime = RecipientFields.recipient_create_at
+
+
+# Command.
+class RecipientCreateCommand(BaseRecipient):
+    """Recipient create command."""
+
+    recipient_id: UUID = RecipientFields.recipient_id
+    recipient_user_id: UUID | None = OptionalRecipientFields.recipient_user_id
+    recipient_address: str = RecipientFields.recipient_address
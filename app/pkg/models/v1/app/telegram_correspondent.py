@@ -6,6 +6,7 @@ from pydantic.fields import Field
 
 from app.pkg.models.base import BaseModel
 from app.pkg.models.base.optional_field import create_optional_fields_class
+from app.pkg.models.v1.app.page import PageCursor, PageFields
 
 __all__ = [
     "TelegramCorrespondent",
@@ -13,7 +14,10 @@ __all__ = [
     "TelegramCorrespondentCreateCommand",
     "TelegramCorrespondentReadQuery",
     "TelegramCorrespondentUpdateCommand",
-    "TelegramCorrespondentDeleteCommand"
+    "TelegramCorrespondentDeleteCommand",
+    "TelegramCorrespondentReadByNameQuery",
+    "TelegramCorrespondentSecrets",
+    "TelegramCorrespondentReadSecretsQuery",
 ]
 
 
@@ -52,6 +56,12 @@ class TelegramCorrespondentFields:
         description="Момент последнего обновления записи (UTC).",
         examples=[None, "2025-09-13T12:45:01Z"],
     )
+    telegram_correspondent_search_rank: float = Field(
+        description="Сходство имени с искомой подстрокой, от 0 до 1. Заполняется только при поиске.",
+        ge=0,
+        le=1,
+        examples=[0.42],
+    )
 
 
 OptionalTelegramCorrespondentFields = create_optional_fields_class(TelegramCorrespondentFields)
@@ -77,6 +87,18 @@ class TelegramCorrespondentResponse(BaseTelegramCorrespondent):
     telegram_bot_token: str = TelegramCorrespondentFields.telegram_bot_token
     telegram_correspondent_create_at: datetime = TelegramCorrespondentFields.telegram_correspondent_create_at
     telegram_correspondent_update_at: datetime | None = OptionalTelegramCorrespondentFields.telegram_correspondent_update_at
+    telegram_correspondent_search_rank: float | None = OptionalTelegramCorrespondentFields.telegram_correspondent_search_rank
+
+
+class TelegramCorrespondentSecrets(BaseTelegramCorrespondent):
+    """TelegramCorrespondent secrets model.
+
+    Secrets are never written to the shared cache, they are read from the
+    database on a cache hit of a row not seen by the process.
+    """
+
+    telegram_correspondent_id: UUID = TelegramCorrespondentFields.telegram_correspondent_id
+    telegram_bot_token: str = TelegramCorrespondentFields.telegram_bot_token
 
 
 # Command.
@@ -108,3 +130,17 @@ class TelegramCorrespondentReadQuery(BaseTelegramCorrespondent):
     telegram_correspondent_id: UUID | None  = OptionalTelegramCorrespondentFields.telegram_correspondent_id
     telegram_correspondent_name: str | None = OptionalTelegramCorrespondentFields.telegram_correspondent_name
     telegram_correspondent_is_active: bool | None = OptionalTelegramCorrespondentFields.telegram_correspondent_is_active
+    cursor: PageCursor | None = PageFields.cursor
+    limit: int = PageFields.limit
+
+
+class TelegramCorrespondentReadByNameQuery(BaseTelegramCorrespondent):
+    """TelegramCorrespondent read by name query model."""
+
+    telegram_correspondent_name: str | None = OptionalTelegramCorrespondentFields.telegram_correspondent_name
+
+
+class TelegramCorrespondentReadSecretsQuery(BaseTelegramCorrespondent):
+    """TelegramCorrespondent read secrets query model."""
+
+    telegram_correspondent_id: UUID = TelegramCorrespondentFields.telegram_correspondent_id
@@ -8,6 +8,7 @@ from pydantic.fields import Field
 
 from app.pkg.models.base import BaseModel
 from app.pkg.models.base.optional_field import create_optional_fields_class
+from app.pkg.models.v1.app.page import PageCursor, PageFields
 
 __all__ = [
     "TextTemplate",
@@ -78,6 +79,12 @@ class TextTemplateFields:
         description="Дата и время последнего обновления шаблона.",
         examples=["2024-09-15T18:45:00Z"],
     )
+    text_template_search_rank: float = Field(
+        description="Сходство кода с искомой подстрокой, от 0 до 1. Заполняется только при поиске.",
+        ge=0,
+        le=1,
+        examples=[0.42],
+    )
 
 
 OptionalTextTemplateFields = create_optional_fields_class(TextTemplateFields)
@@ -91,10 +98,11 @@ class TextTemplate(BaseTextTemplate):
     text_template_is_active: bool = TextTemplateFields.text_template_is_active
     text_template_subject: str | None = OptionalTextTemplateFields.text_template_subject
     text_template_content: str = TextTemplateFields.text_template_content
-    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields
+    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields.text_template_variables
     text_template_channel: ChannelEnum = TextTemplateFields.text_template_channel
     text_template_create_at: datetime = TextTemplateFields.text_template_update_at
     text_template_update_at: datetime | None = OptionalTextTemplateFields.text_template_update_at
+    text_template_search_rank: float | None = OptionalTextTemplateFields.text_template_search_rank
 
 
 # Command.
@@ -104,7 +112,7 @@ class TextTemplateCreateCommand(BaseTextTemplate):
     text_template_code: str = TextTemplateFields.text_template_code
     text_template_subject: str | None = OptionalTextTemplateFields.text_template_subject
     text_template_content: str = TextTemplateFields.text_template_content
-    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields
+    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields.text_template_variables
     text_template_channel: ChannelEnum = TextTemplateFields.text_template_channel
 
 
@@ -115,7 +123,7 @@ class TextTemplateUpdateCommand(BaseTextTemplate):
     text_template_code: str | None = OptionalTextTemplateFields.text_template_code
     text_template_subject: str | None = OptionalTextTemplateFields.text_template_subject
     text_template_content: str | None = OptionalTextTemplateFields.text_template_content
-    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields
+    text_template_variables: dict[str, Any] | None = OptionalTextTemplateFields.text_template_variables
     text_template_channel: ChannelEnum | None = OptionalTextTemplateFields.text_template_channel
 
 
@@ -134,6 +142,8 @@ class TextTemplateReadQuery(BaseTextTemplate):
     text_template_code: str | None = OptionalTextTemplateFields.text_template_code
     text_template_subject: str | None = OptionalTextTemplateFields.text_template_subject
     text_template_channel: ChannelEnum | None = OptionalTextTemplateFields.text_template_channel
+    cursor: PageCursor | None = PageFields.cursor
+    limit: int = PageFields.limit
 
 
 class TextTemplateReadByCodeQuery(BaseTextTemplate):
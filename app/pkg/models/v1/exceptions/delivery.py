@@ -0,0 +1,14 @@
+"""Module with delivery exceptions for the application."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = [
+    "DeliveryEventsOverloaded",
+]
+
+
+class DeliveryEventsOverloaded(BaseAPIException):
+    message = "Delivery events can not be accepted now, retry later."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
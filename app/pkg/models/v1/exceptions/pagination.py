@@ -0,0 +1,14 @@
+"""Module with pagination exceptions for the application."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = [
+    "InvalidPageCursor",
+]
+
+
+class InvalidPageCursor(BaseAPIException):
+    message = "Page cursor is invalid."
+    status_code = status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,37 @@
+"""Module with Telegram Bot API exceptions for the application."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = [
+    "TelegramSendError",
+    "TelegramChatUnavailable",
+    "TelegramRetryAfter",
+]
+
+
+class TelegramSendError(BaseAPIException):
+    message = "Telegram message sending error."
+    status_code = status.HTTP_502_BAD_GATEWAY
+
+
+class TelegramChatUnavailable(BaseAPIException):
+    message = "Telegram chat is not found or the bot is blocked."
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TelegramRetryAfter(BaseAPIException):
+    message = "Telegram flood limit is exceeded."
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
+    def __init__(self, retry_after: float, message: str | None = None):
+        """Init TelegramRetryAfter.
+
+        Args:
+            retry_after: Seconds to wait before the next request, sent by Bot API.
+            message: Message of exception.
+        """
+
+        self.retry_after = retry_after
+        super().__init__(message)
@@ -9,7 +9,8 @@ __all__ = [
     "TextTemplateCreateError",
     "TextTemplateReadError",
     "TextTemplateUpdateError",
-    "TextTemplateDeleteError"
+    "TextTemplateDeleteError",
+    "TextTemplateContentError",
 ]
 
 
@@ -38,3 +39,6 @@ class TextTemplateDeleteError(BaseAPIException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+class TextTemplateContentError(BaseAPIException):
+    message = "Text template content is invalid."
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -7,7 +7,7 @@ from typing import Literal
 
 from dotenv import find_dotenv
 from pydantic import AmqpDsn, PostgresDsn, RedisDsn, model_validator
-from pydantic.types import PositiveInt, SecretStr
+from pydantic.types import PositiveFloat, PositiveInt, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.pkg.models.core.logger import LoggerLevel
@@ -129,6 +129,22 @@ class RabbitMQ(_Settings):
     SCHEMA: str = "amqp"
 
     NOTIFICATION_KEY: str
+    #: str: Queue of Telegram messages.
+    TELEGRAM_KEY: str = "telegram_message"
+
+    #: PositiveInt: Max count of connections in the pool.
+    MAX_CONNECTION: PositiveInt = 10
+    #: PositiveInt: Max count of channels in use at the same time.
+    MAX_CHANNEL: PositiveInt = 64
+    #: PositiveInt: Count of messages published before awaiting their confirms.
+    PUBLISH_BATCH_SIZE: PositiveInt = 500
+    #: PositiveInt: Max priority of messages, declared as ``x-max-priority``
+    #  of queues. Priority of existing queues can not be changed: they must be
+    #  deleted and redeclared.
+    MAX_PRIORITY: PositiveInt = 10
+    #: PositiveInt: Messages with priority not lower than this one are routed
+    #  to the high-priority lane, e.g. verification codes.
+    HIGH_PRIORITY: PositiveInt = 5
 
     #: str: Concatenation all settings for Resource in one string. (DSN)
     #  Builds in `root_validator` method.
@@ -212,6 +228,187 @@ class APIServer(_Settings):
     ENVIROMENT: Literal["dev", "prod"] = "dev"
 
 
+class Worker(_Settings):
+    """Notification worker settings."""
+
+    #: str: Consumer mode of the worker. ``sequential`` processes deliveries one
+    #  by one, ``concurrent`` processes up to ``CONCURRENCY`` deliveries at once,
+    #  ``batch`` collects up to ``BATCH_SIZE`` deliveries and sends emails of
+    #  each correspondent over one SMTP session.
+    CONSUMER_MODE: Literal["sequential", "concurrent", "batch"] = "sequential"
+    #: PositiveInt: Max count of in-flight messages in ``concurrent`` mode.
+    #  Also used as channel QoS prefetch count.
+    CONCURRENCY: PositiveInt = 16
+    #: PositiveInt: Max count of in-flight messages of the high-priority lane in
+    #  ``concurrent`` mode. Reserved on top of ``CONCURRENCY``, so bulk traffic
+    #  never takes slots of the high-priority lane.
+    HIGH_PRIORITY_CONCURRENCY: PositiveInt = 4
+    #: PositiveInt: Max count of deliveries of a batch in ``batch`` mode. Also
+    #  used as channel QoS prefetch count of the bulk lane.
+    BATCH_SIZE: PositiveInt = 100
+    #: PositiveInt: Max time in milliseconds to wait for a batch to fill up.
+    BATCH_WAIT_MS: PositiveInt = 50
+    #: bool: Validate only structure and types of payloads with a trusted
+    #  ``x-schema`` header. Enable it only if every producer of the queue
+    #  validates payloads before publish.
+    TRUST_SCHEMA_HEADER: bool = False
+    #: PositiveInt: Max count of buffered message status updates. The buffer is
+    #  written to PostgreSQL with one statement when it is full.
+    STATUS_BATCH_SIZE: PositiveInt = 500
+    #: PositiveInt: Max time in milliseconds a status update stays buffered.
+    STATUS_FLUSH_MS: PositiveInt = 200
+    #: PositiveInt: Max count of delivery attempts written with one COPY.
+    HISTORY_BATCH_SIZE: PositiveInt = 1000
+    #: PositiveInt: Max time in milliseconds to wait for a history batch to
+    #  fill up.
+    HISTORY_FLUSH_MS: PositiveInt = 200
+    #: PositiveInt: Max count of buffered delivery attempts. Sends wait for a
+    #  free slot when the buffer is full.
+    HISTORY_BUFFER_SIZE: PositiveInt = 10000
+    #: PositiveInt: Count of attempts to write a history batch before it is
+    #  dropped.
+    HISTORY_FLUSH_ATTEMPTS: PositiveInt = 3
+    #: bool: Run consumers inside every API process. Disable it when workers
+    #  are run apart with ``python -m app.internal.workers``.
+    EMBEDDED: bool = True
+    #: PositiveInt: Count of worker processes of ``python -m app.internal.workers``.
+    PROCESSES: PositiveInt = 2
+    #: PositiveFloat: Initial delay in seconds before restart of a crashed process.
+    RESTART_DELAY: PositiveFloat = 1
+    #: PositiveFloat: Upper bound of the restart delay in seconds.
+    MAX_RESTART_DELAY: PositiveFloat = 60
+    #: PositiveFloat: Deadline in seconds for in-flight messages on shutdown.
+    DRAIN_TIMEOUT: PositiveFloat = 30
+
+
+class Retry(_Settings):
+    """Retry settings of failed sends."""
+
+    #: PositiveInt: Max count of send attempts. After the last failed attempt
+    #  the message is moved to the dead-letter queue.
+    MAX_ATTEMPTS: PositiveInt = 5
+    #: PositiveFloat: Delay in seconds before the first retry. Every next delay
+    #  is doubled.
+    BASE_DELAY: PositiveFloat = 5
+    #: PositiveFloat: Upper bound of the retry delay in seconds.
+    MAX_DELAY: PositiveFloat = 600
+
+
+class Idempotency(_Settings):
+    """Idempotency settings of the worker."""
+
+    #: PositiveInt: TTL in seconds of the claim of an event being processed.
+    #  Claim of a crashed worker is released after this timeout.
+    IN_PROGRESS_TTL: PositiveInt = 300
+    #: PositiveInt: TTL in seconds of the mark of a processed event.
+    DONE_TTL: PositiveInt = 86400
+    #: PositiveFloat: Delay in seconds before a delivery of the event claimed
+    #  by another consumer is processed again. The delivery is postponed until
+    #  the claim is completed or expires, it does not count as a send attempt.
+    POSTPONE_DELAY: PositiveFloat = 30
+    #: str: Prefix of idempotency keys in Redis.
+    REDIS_PREFIX: str = "notification:idempotency"
+
+
+class RateLimit(_Settings):
+    """Default send rate of a correspondent.
+
+    Used when the correspondent has no own limits.
+    """
+
+    #: PositiveFloat: Count of messages per second.
+    DEFAULT_RATE: PositiveFloat = 10
+    #: PositiveInt: Count of messages sent in a row without waiting.
+    DEFAULT_BURST: PositiveInt = 10
+    #: str: Prefix of rate limiter keys in Redis.
+    REDIS_PREFIX: str = "notification:rate"
+
+
+class SMTPTransport(_Settings):
+    """SMTP transport settings."""
+
+    #: PositiveInt: Max count of opened sessions per (host, port, username).
+    POOL_MAX_SIZE: PositiveInt = 4
+    #: PositiveInt: Seconds after which an unused session is closed.
+    IDLE_TIMEOUT: PositiveInt = 60
+    #: PositiveInt: Timeout of SMTP socket operations in seconds.
+    TIMEOUT: PositiveInt = 10
+    #: PositiveInt: Count of threads executing blocking SMTP calls.
+    MAX_WORKERS: PositiveInt = 32
+    #: PositiveInt: Max count of emails being sent at once by one worker.
+    CONCURRENCY: PositiveInt = 16
+
+
+class TelegramTransport(_Settings):
+    """Telegram Bot API transport settings."""
+
+    #: str: Base URL of the Bot API. Point it to a local fake server in tests.
+    API_URL: str = "https://api.telegram.org"
+    #: PositiveFloat: Timeout of Bot API requests in seconds.
+    TIMEOUT: PositiveFloat = 10
+    #: PositiveInt: Max count of keep-alive connections per bot.
+    MAX_CONNECTIONS: PositiveInt = 16
+    #: PositiveFloat: Seconds after which an idle connection is closed.
+    KEEPALIVE_EXPIRY: PositiveFloat = 60
+    #: PositiveFloat: Max messages per second of one bot to all chats.
+    GLOBAL_RATE: PositiveFloat = 30
+    #: PositiveFloat: Max messages per second of one bot to one chat.
+    CHAT_RATE: PositiveFloat = 1
+    #: PositiveInt: Max count of messages being sent at once by one worker.
+    CONCURRENCY: PositiveInt = 16
+
+
+class Cache(_Settings):
+    """Lookup cache settings."""
+
+    #: PositiveInt: Time to live of lookup cached in-process in seconds.
+    TTL: PositiveInt = 60
+    #: PositiveInt: Max count of entries in one cache.
+    MAX_SIZE: PositiveInt = 1024
+    #: PositiveInt: Time to live of lookup cached in redis in seconds.
+    REDIS_TTL: PositiveInt = 600
+    #: PositiveInt: Time to live of secret fields of lookups, e.g. SMTP
+    #  passwords and bot tokens, cached in-process in seconds. Secrets are
+    #  never written to redis: a process reads them from PostgreSQL once per
+    #  row and update of the row, then they live only in its memory.
+    SECRETS_TTL: PositiveInt = 3600
+    #: str: Prefix of cache keys in redis.
+    REDIS_PREFIX: str = "notification:cache"
+    #: str: Redis pub/sub channel of cache invalidation messages.
+    INVALIDATION_CHANNEL: str = "notification:cache:invalidation"
+
+
+class Webhook(_Settings):
+    """Provider webhook settings."""
+
+    #: PositiveInt: Count of buffered deliveries after which provider events
+    #  are written to PostgreSQL with one statement.
+    BATCH_SIZE: PositiveInt = 1000
+    #: PositiveInt: Max time in milliseconds a provider event stays buffered.
+    FLUSH_MS: PositiveInt = 1000
+    #: PositiveInt: Max count of buffered deliveries. When it is reached, the
+    #  request waits for the buffer to be written, and is rejected with 503
+    #  when the write fails.
+    BUFFER_SIZE: PositiveInt = 50000
+
+
+class Pagination(_Settings):
+    """List endpoints pagination settings."""
+
+    #: PositiveInt: Page size of list endpoints when it is not requested.
+    DEFAULT_LIMIT: PositiveInt = 50
+    #: PositiveInt: Max page size of list endpoints.
+    MAX_LIMIT: PositiveInt = 500
+
+
+class Search(_Settings):
+    """Substring search settings of list endpoints."""
+
+    #: PositiveInt: Min length of searched substring. Trigram index can not
+    #  serve substrings shorter than 3 characters.
+    MIN_LENGTH: PositiveInt = 3
+
+
 class Clients(_Settings):
     pass
 
@@ -235,6 +432,36 @@ class Settings(_Settings):
     #: Redis
     REDIS: Redis
 
+    #: Worker
+    WORKER: Worker = Worker()
+
+    #: Retry
+    RETRY: Retry = Retry()
+
+    #: Idempotency
+    IDEMPOTENCY: Idempotency = Idempotency()
+
+    #: RateLimit
+    RATE_LIMIT: RateLimit = RateLimit()
+
+    #: SMTP
+    SMTP: SMTPTransport = SMTPTransport()
+
+    #: Telegram
+    TELEGRAM: TelegramTransport = TelegramTransport()
+
+    #: Cache
+    CACHE: Cache = Cache()
+
+    #: Webhook
+    WEBHOOK: Webhook = Webhook()
+
+    #: Pagination
+    PAGINATION: Pagination = Pagination()
+
+    #: Search
+    SEARCH: Search = Search()
+
     #: Clients
     CLIENTS: Clients | None = None
 
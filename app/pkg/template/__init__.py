@@ -0,0 +1,11 @@
+"""Compiler of ``{{var}}`` text templates."""
+
+# ruff: noqa
+
+from app.pkg.template.compiler import (
+    RenderPlan,
+    TemplateError,
+    TemplateSyntaxError,
+    TemplateVariableError,
+    compile_template,
+)
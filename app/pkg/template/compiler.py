@@ -0,0 +1,154 @@
+"""Compiler of ``{{var}}`` templates into render plans."""
+
+import re
+from typing import Any, Collection, Mapping
+
+__all__ = [
+    "RenderPlan",
+    "TemplateError",
+    "TemplateSyntaxError",
+    "TemplateVariableError",
+    "compile_template",
+]
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+#: re.Pattern: Placeholder of the former ``str.format`` syntax, ``{name}``.
+_LEGACY_PLACEHOLDER = re.compile(r"\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}")
+
+
+class TemplateError(ValueError):
+    """Base error of the template compiler."""
+
+
+class TemplateSyntaxError(TemplateError):
+    """Template contains a malformed placeholder."""
+
+
+class TemplateVariableError(TemplateError):
+    """Placeholder is not declared or not passed to render."""
+
+
+class RenderPlan:
+    """Parsed template ready to be rendered many times.
+
+    The plan is a list of chunks: literal text and empty slots for variables.
+    Rendering copies the list, fills the slots and joins the chunks, so the
+    content is never parsed again.
+
+    Examples:
+        ::
+
+            >>> plan = compile_template("Hello, {{username}}!")
+            >>> plan.render({"username": "world"})
+            'Hello, world!'
+    """
+
+    __slots__ = ("_chunks", "_slots", "variables")
+
+    def __init__(self, chunks: list[str], slots: tuple[tuple[int, str], ...]):
+        """Initialize render plan.
+
+        Args:
+            chunks: Literal chunks with empty strings in place of variables.
+            slots: Pairs of (index of chunk, name of variable).
+        """
+
+        self._chunks = chunks
+        self._slots = slots
+        #: frozenset[str]: Names of variables used in the template.
+        self.variables = frozenset(name for _, name in slots)
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """Render template with ``context``.
+
+        Args:
+            context: Values of variables. Extra keys are ignored.
+
+        Raises:
+            TemplateVariableError: Some variables are missing in ``context``.
+
+        Returns:
+            Rendered text.
+        """
+
+        if not self._slots:
+            return self._chunks[0] if self._chunks else ""
+
+        chunks = self._chunks.copy()
+        try:
+            for index, name in self._slots:
+                chunks[index] = str(context[name])
+        except KeyError:
+            missing = sorted(self.variables.difference(context))
+            raise TemplateVariableError(
+                f"Missing variables in context: {', '.join(missing)}",
+            ) from None
+        return "".join(chunks)
+
+
+def compile_template(
+    content: str,
+    variables: Collection[str] | None = None,
+) -> RenderPlan:
+    """Parse ``content`` into a :class:`.RenderPlan`.
+
+    Placeholders have the form ``{{ name }}``. Single braces are literal text,
+    so CSS and JSON in the content need no escaping. The only exception is
+    ``{name}`` of a declared variable: it is the placeholder of the former
+    ``str.format`` syntax and would be sent to users as is, so it is rejected.
+
+    Args:
+        content: Text of the template.
+        variables: Declared variables. If passed, every placeholder must be
+            declared.
+
+    Raises:
+        TemplateSyntaxError: Unclosed or malformed ``{{`` / ``}}``, or
+            ``{name}`` of a declared variable.
+        TemplateVariableError: Placeholder is not in ``variables``.
+
+    Returns:
+        Compiled render plan.
+    """
+
+    chunks: list[str] = []
+    slots: list[tuple[int, str]] = []
+    position = 0
+
+    for match in _PLACEHOLDER.finditer(content):
+        _append_literal(chunks, content[position:match.start()])
+        slots.append((len(chunks), match.group(1)))
+        chunks.append("")
+        position = match.end()
+    _append_literal(chunks, content[position:])
+
+    if variables is not None:
+        undeclared = sorted({name for _, name in slots}.difference(variables))
+        if undeclared:
+            raise TemplateVariableError(
+                f"Undeclared variables in template: {', '.join(undeclared)}",
+            )
+
+        legacy = sorted(
+            {
+                match.group(1)
+                for chunk in chunks
+                for match in _LEGACY_PLACEHOLDER.finditer(chunk)
+            }.intersection(variables),
+        )
+        if legacy:
+            raise TemplateSyntaxError(
+                "Single-brace placeholders are literal text, use "
+                + ", ".join(f"{{{{{name}}}}}" for name in legacy),
+            )
+
+    return RenderPlan(chunks=chunks, slots=tuple(slots))
+
+
+def _append_literal(chunks: list[str], literal: str) -> None:
+    """Append literal chunk, rejecting leftovers of malformed placeholders."""
+
+    if "{{" in literal or "}}" in literal:
+        raise TemplateSyntaxError(f"Malformed placeholder near: {literal[:50]!r}")
+    if literal:
+        chunks.append(literal)
@@ -0,0 +1,14 @@
+"""Tests of the service.
+
+Settings are read when ``app`` is imported, so variables missing in the
+environment are taken from ``.env.example`` before any test or benchmark
+imports ``app``.
+"""
+
+import os
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+for _name, _value in dotenv_values(Path(__file__).parents[1] / ".env.example").items():
+    os.environ.setdefault(_name, _value or "")
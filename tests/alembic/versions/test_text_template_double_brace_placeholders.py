@@ -0,0 +1,84 @@
+"""Tests of the data migration ``c7e3a9d4b512`` of template placeholders.
+
+Rewritten content must compile into render plans and render the text
+``str.format`` rendered before the migration, and downgrade must restore it.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from app.pkg.template import compile_template
+
+
+def load_migration() -> ModuleType:
+    path = next(
+        (Path(__file__).parents[3] / "alembic" / "versions").glob("c7e3a9d4b512_*.py"),
+    )
+    spec = importlib.util.spec_from_file_location("c7e3a9d4b512", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+migration = load_migration()
+
+#: dict[str, str]: Values of the declared variables.
+CONTEXT = {"code": "582341", "username": "world"}
+VARIABLES = {"code": "string", "username": "string"}
+
+
+@pytest.mark.parametrize(
+    ("content", "variables", "expected", "rendered"),
+    [
+        ("Code: {code}", VARIABLES, "Code: {{code}}", "Code: 582341"),
+        ("Code: { code }", None, "Code: {{code}}", "Code: 582341"),
+        ("Code: {{code}}", VARIABLES, "Code: {{code}}", "Code: 582341"),
+        ("Code: {other}", VARIABLES, "Code: {other}", "Code: {other}"),
+        ("Code: {{other}}", VARIABLES, "Code: {other}", "Code: {other}"),
+        (
+            "<style>p {{ color: red; }}</style><p>{code}</p>",
+            VARIABLES,
+            "<style>p { color: red; }</style><p>{{code}}</p>",
+            "<style>p { color: red; }</style><p>582341</p>",
+        ),
+        ('{{"code": "{code}"}}', VARIABLES, '{"code": "{{code}}"}', '{"code": "582341"}'),
+        ("{{{code}}}", VARIABLES, "{{{code}}}", "{582341}"),
+        ("Hello, {username}! }}{{", {}, "Hello, {{username}}! }{", "Hello, world! }{"),
+    ],
+    ids=[
+        "declared",
+        "undeclared_template",
+        "double_brace",
+        "unknown_name",
+        "unknown_double_brace",
+        "css",
+        "json",
+        "braced_placeholder",
+        "bare_escapes",
+    ],
+)
+def test_rewrite(content, variables, expected, rendered):
+    rewritten = migration._rewrite(content, variables)
+
+    assert rewritten == expected
+    assert compile_template(rewritten, variables or None).render(CONTEXT) == rendered
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Code: {code}",
+        "<style>p {{ color: red; }}</style><p>{code}</p>",
+        '{{"code": "{code}"}}',
+        "{{{code}}}",
+        "Hello, {username}! }}{{",
+    ],
+)
+def test_downgrade_restores_content(content):
+    rewritten = migration._rewrite(content, VARIABLES)
+
+    assert migration._restore(rewritten) == content
+    assert migration._rewrite(migration._restore(rewritten), VARIABLES) == rewritten
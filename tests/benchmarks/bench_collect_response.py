@@ -0,0 +1,126 @@
+"""Microbenchmark of :func:`app.internal.repository.v1.postgresql.handlers.collect_response`.
+
+Compares mapping of ORM entities with an adapter built on every call, as
+``collect_response`` did before precompiling, with the precompiled adapter
+on ORM entities and on rows of a Core select, for a single row and for
+1000 rows. Rows are read from in-memory SQLite. Results of all paths are
+checked to be equal before timing.
+
+All calls of a case are awaited in one event loop, so the time is spent by
+the mapping and not by starting a loop on every call.
+
+Run with ``python -m tests.benchmarks.bench_collect_response``.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.internal.repository.v1.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import Delivery, Recipient
+
+#: dict[int, int]: Count of calls timed by count of rows of the response.
+_SIZES = {1: 20_000, 1000: 20}
+_REPEAT = 3
+
+
+@collect_response
+async def collect_one(response) -> models.Delivery:
+    return response
+
+
+@collect_response
+async def collect_many(response) -> list[models.Delivery]:
+    return response
+
+
+async def validate_per_call(annotation, response) -> Any:
+    return TypeAdapter(annotation).validate_python(response)
+
+
+def seed(session: Session, rows: int) -> None:
+    recipient_id = uuid4()
+    session.execute(
+        insert(Recipient).values(recipient_id=recipient_id, recipient_address="user@example.com"),
+    )
+    statuses = list(models.DeliveryStatusEnum)
+    session.execute(
+        insert(Delivery),
+        [
+            {
+                "recipient_id": recipient_id,
+                "delivery_provider": "smtp",
+                "delivery_status": statuses[i % len(statuses)],
+                "delivery_provider_message_id": f"<{i}@yourapp.io>" if i % 2 else None,
+                "delivery_sent_at": datetime.now(timezone.utc) if i % 2 else None,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+async def run(case: Callable[[], Awaitable[Any]], number: int) -> float:
+    """Await ``case`` ``number`` times and return the elapsed seconds."""
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await case()
+    return time.perf_counter() - start
+
+
+def measure(case: Callable[[], Awaitable[Any]], number: int) -> float:
+    """Best of the repeats in seconds per call."""
+
+    return min(asyncio.run(run(case, number)) for _ in range(_REPEAT)) / number
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Delivery.metadata.create_all(engine, tables=[Recipient.__table__, Delivery.__table__])
+
+    with Session(engine) as session:
+        seed(session, max(_SIZES))
+
+        for size, number in _SIZES.items():
+            annotation = models.Delivery if size == 1 else list[models.Delivery]
+            collect = collect_one if size == 1 else collect_many
+
+            def response(result, size=size):
+                return result[0] if size == 1 else result
+
+            def fetch_entities(size=size):
+                session.expunge_all()
+                return response(session.execute(select(Delivery).limit(size)).scalars().all())
+
+            def fetch_rows(size=size):
+                return response(session.execute(select(Delivery.__table__).limit(size)).all())
+
+            entities, rows = fetch_entities(), fetch_rows()
+            expected = asyncio.run(validate_per_call(annotation, entities))
+            assert asyncio.run(collect(entities)) == expected
+            assert asyncio.run(collect(rows)) == expected
+
+            cases = {
+                "per-call adapter, ORM entities": lambda: validate_per_call(annotation, entities),
+                "compiled adapter, ORM entities": lambda: collect(entities),
+                "compiled adapter, Core rows": lambda: collect(rows),
+                "fetch + map, ORM entities": lambda: validate_per_call(annotation, fetch_entities()),
+                "fetch + map, Core rows": lambda: collect(fetch_rows()),
+            }
+            for name, case in cases.items():
+                seconds = measure(case, number)
+                print(f"{name:<32} {seconds * 1_000_000:10.1f} us / {size} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Microbenchmark of :class:`app.internal.workers.payload.PayloadDecoder`.
+
+Run with ``python -m tests.benchmarks.bench_payload_decoder``.
+"""
+
+import json
+import timeit
+from uuid import uuid4
+
+from app.internal.workers.payload import SCHEMA_HEADER, PayloadDecoder
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+_SCHEMA = "message_notification.v1"
+_NUMBER = 50_000
+
+BODY = json.dumps(
+    {
+        "event": "user.verification.requested",
+        "event_id": str(uuid4()),
+        "occurred_at": "2026-10-18T12:34:56Z",
+        "verification_id": str(uuid4()),
+        "user_id": str(uuid4()),
+        "verification_code": "582341",
+        "channel": "EMAIL",
+        "email": "user@example.com",
+    },
+).encode()
+
+
+def main() -> None:
+    settings.WORKER.TRUST_SCHEMA_HEADER = True
+    decoder = PayloadDecoder(models.MessageNotification, schemas={_SCHEMA})
+    trusted_headers = {SCHEMA_HEADER: _SCHEMA}
+
+    cases = {
+        "json.loads + Model(**d)": lambda: models.MessageNotification(
+            **json.loads(BODY.decode()),
+        ),
+        "default path": lambda: decoder.decode(BODY),
+        "trusted path": lambda: decoder.decode(BODY, headers=trusted_headers),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=_NUMBER, repeat=3))
+        print(f"{name:<28} {_NUMBER / seconds / 1000:8.1f}k msg/s")
+
+
+if __name__ == "__main__":
+    main()
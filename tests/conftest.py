@@ -0,0 +1,89 @@
+"""Common fixtures of the tests."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+from dependency_injector import providers
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.internal.repository.v1.postgresql import connection as postgresql_connection
+from app.pkg.connectors import Connectors
+from app.pkg.models.sqlalchemy_models import Base
+from app.pkg.settings import settings
+
+#: Callable: Scenario of a PostgreSQL test.
+Scenario = Callable[[AsyncConnection], Awaitable[None]]
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "postgres: test runs queries against the database of "
+        "settings.POSTGRES.TEST_DSN, it is skipped when the database is not "
+        "reachable.",
+    )
+
+
+@pytest.fixture
+def postgresql() -> Callable[[Scenario], None]:
+    """Run scenario against the test database.
+
+    Schema is created from the models, with the same indexes as the
+    migrations. Scenario runs in one transaction, which is rolled back at the
+    end, so tests never see rows of each other. Repositories of the scenario
+    use the connection of the transaction: ``session.commit()`` only releases
+    a savepoint.
+
+    Examples:
+        ::
+
+            >>> @pytest.mark.postgres
+            ... def test_read(postgresql):
+            ...     async def scenario(connection: AsyncConnection) -> None:
+            ...         assert await TextTemplateRepository().read(query) == []
+            ...     postgresql(scenario)
+    """
+
+    def run(scenario: Scenario) -> None:
+        asyncio.run(_run_in_transaction(scenario))
+
+    return run
+
+
+async def _run_in_transaction(scenario: Scenario) -> None:
+    engine = create_async_engine(settings.POSTGRES.TEST_DSN, poolclass=NullPool)
+    try:
+        connection = await engine.connect()
+    except (OSError, SQLAlchemyError) as exc:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL is not reachable: {exc}")
+
+    container = Connectors()
+    try:
+        transaction = await connection.begin()
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(Base.metadata.create_all)
+
+        container.postgresql.engine.override(providers.Object(engine))
+        container.postgresql.session_factory.override(
+            providers.Object(
+                async_sessionmaker(
+                    bind=connection,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                ),
+            ),
+        )
+        container.wire(modules=[postgresql_connection])
+        try:
+            await scenario(connection)
+        finally:
+            container.unwire()
+            await transaction.rollback()
+    finally:
+        await connection.close()
+        await engine.dispose()
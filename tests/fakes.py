@@ -0,0 +1,88 @@
+"""In-memory fakes of the repositories used by unit tests."""
+
+import json
+from typing import Any
+
+import httpx
+from redis import RedisError
+
+
+class FakeRedisRepository:
+    """In-memory :class:`app.internal.repository.v1.redis.BaseRedisRepository`.
+
+    TTLs are recorded, but keys never expire. Set ``down`` to make every call
+    raise :class:`redis.RedisError`.
+    """
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.expire_times: dict[str, int | None] = {}
+        self.published: list[tuple[str, str]] = []
+        self.down = False
+
+    async def create(self, redis_key: str, redis_value: str, expire_time: int | None = None):
+        self.__check()
+        self.values[redis_key] = redis_value
+        self.expire_times[redis_key] = expire_time
+
+    async def create_if_not_exists(
+        self,
+        redis_key: str,
+        redis_value: str,
+        expire_time: int | None = None,
+    ) -> bool:
+        self.__check()
+        if redis_key in self.values:
+            return False
+        await self.create(redis_key, redis_value, expire_time)
+        return True
+
+    async def read_value(self, redis_key: str) -> str | None:
+        self.__check()
+        return self.values.get(redis_key)
+
+    async def delete(self, redis_key: str) -> None:
+        self.__check()
+        self.values.pop(redis_key, None)
+
+    async def increment(self, redis_key: str, amount: int = 1) -> int:
+        self.__check()
+        value = int(self.values.get(redis_key, 0)) + amount
+        self.values[redis_key] = str(value)
+        return value
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.__check()
+        self.published.append((channel, message))
+        return 0
+
+    async def run_script(self, script: str, keys: list[str], args: list[Any]) -> Any:
+        raise NotImplementedError("Scripts are faked by subclasses.")
+
+    def __check(self) -> None:
+        if self.down:
+            raise RedisError("Connection refused.")
+
+
+class FakeBotAPI:
+    """Telegram Bot API served by :class:`httpx.MockTransport`.
+
+    Replies are returned in order of ``replies``, the last one is repeated.
+    Every request is recorded by ``requests``.
+    """
+
+    def __init__(self, *replies: tuple[int, dict[str, Any]]):
+        self.replies = list(replies) or [(200, {"ok": True, "result": {"message_id": 1}})]
+        self.requests: list[httpx.Request] = []
+        self.transport = httpx.MockTransport(self.__handle)
+
+    def __handle(self, request: httpx.Request) -> httpx.Response:
+        reply = self.replies[min(len(self.requests), len(self.replies) - 1)]
+        self.requests.append(request)
+        status_code, body = reply
+        return httpx.Response(status_code, json=body)
+
+    def sent(self) -> list[dict[str, Any]]:
+        """Bodies of the sent requests."""
+
+        return [json.loads(request.content) for request in self.requests]
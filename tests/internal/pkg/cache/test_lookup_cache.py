@@ -0,0 +1,200 @@
+"""Tests of :class:`app.internal.pkg.cache.LookupCache`."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.internal.pkg.cache import LookupCache
+from app.pkg.models.base import BaseModel
+from tests.fakes import FakeRedisRepository
+
+
+class Row(BaseModel):
+    row_id: UUID
+    row_name: str
+
+
+class SecretRow(Row):
+    row_token: str
+    row_update_at: datetime | None = None
+
+
+class RowSecrets(BaseModel):
+    row_id: UUID
+    row_token: str
+
+
+@pytest.fixture
+def redis() -> FakeRedisRepository:
+    return FakeRedisRepository()
+
+
+@pytest.fixture
+def cache(redis) -> LookupCache[str, Row]:
+    cache = LookupCache(namespace=f"test_{uuid4().hex}", model=Row, identity=lambda row: row.row_id)
+    cache._redis = redis
+    return cache
+
+
+def test_value_is_loaded_once(cache, redis):
+    row = Row(row_id=uuid4(), row_name="old")
+    loads = []
+
+    async def loader() -> Row:
+        loads.append(row)
+        return row
+
+    async def scenario():
+        assert await cache.get_or_load("name", loader) == row
+        assert await cache.get_or_load("name", loader) == row
+
+    asyncio.run(scenario())
+
+    assert len(loads) == 1
+    assert any(key.endswith(":name") for key in redis.values)
+
+
+def test_value_loaded_during_invalidation_is_not_cached(cache, redis):
+    row_id = uuid4()
+    rows = iter([Row(row_id=row_id, row_name="old"), Row(row_id=row_id, row_name="new")])
+    loading, committed = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader() -> Row:
+        # Row is read before the change is committed.
+        row = next(rows)
+        loading.set()
+        await committed.wait()
+        return row
+
+    async def loader() -> Row:
+        return next(rows)
+
+    async def scenario():
+        lookup = asyncio.create_task(cache.get_or_load("name", slow_loader))
+        await loading.wait()
+        await cache.invalidate(row_id)
+        committed.set()
+        assert (await lookup).row_name == "old"
+
+        # Neither L1 nor L2 keeps the stale row.
+        assert (await cache.get_or_load("name", loader)).row_name == "new"
+
+    asyncio.run(scenario())
+
+    assert all('"old"' not in value for value in redis.values.values())
+
+
+def test_invalidation_drops_local_entries(cache):
+    row = Row(row_id=uuid4(), row_name="old")
+    loads = []
+
+    async def loader() -> Row:
+        loads.append(row)
+        return row
+
+    async def scenario():
+        await cache.get_or_load("name", loader)
+        cache.apply_invalidation(row.row_id, version=100)
+        await cache.get_or_load("name", loader)
+
+    asyncio.run(scenario())
+
+    assert len(loads) == 2
+
+
+def test_redis_errors_fall_back_to_loader(cache, redis):
+    redis.down = True
+    row = Row(row_id=uuid4(), row_name="old")
+
+    async def loader() -> Row:
+        return row
+
+    assert asyncio.run(cache.get_or_load("name", loader)) == row
+
+
+def new_secret_cache(redis: FakeRedisRepository) -> LookupCache[str, SecretRow]:
+    cache = LookupCache(
+        namespace=f"test_{uuid4().hex}",
+        model=SecretRow,
+        identity=lambda row: row.row_id,
+        secret_fields=("row_token",),
+    )
+    cache._redis = redis
+    return cache
+
+
+def test_secrets_are_not_written_to_redis(redis):
+    cache = new_secret_cache(redis)
+    row = SecretRow(row_id=uuid4(), row_name="bot", row_token="123456:secret")
+
+    async def loader() -> SecretRow:
+        return row
+
+    async def secrets_loader(payload: dict[str, Any]) -> RowSecrets:
+        raise AssertionError("Secrets of the loaded row are kept in-process.")
+
+    asyncio.run(cache.get_or_load("bot", loader, secrets_loader))
+
+    assert redis.values
+    assert all("123456:secret" not in value for value in redis.values.values())
+
+
+def test_redis_hit_reads_secrets_once_per_row_update(redis):
+    row = SecretRow(row_id=uuid4(), row_name="bot", row_token="123456:secret")
+    secret_reads = []
+
+    async def loader() -> SecretRow:
+        return row
+
+    async def secrets_loader(payload: dict[str, Any]) -> RowSecrets:
+        secret_reads.append(payload["row_id"])
+        return RowSecrets(row_id=row.row_id, row_token=row.row_token)
+
+    async def scenario(cache: LookupCache[str, SecretRow]) -> SecretRow:
+        cache._local.clear()
+        return await cache.get_or_load("bot", loader, secrets_loader)
+
+    # Another replica filled redis, this process has not seen the row.
+    replica, cache = new_secret_cache(redis), new_secret_cache(redis)
+    cache.namespace = replica.namespace
+    asyncio.run(scenario(replica))
+
+    assert asyncio.run(scenario(cache)) == row
+    assert asyncio.run(scenario(cache)) == row
+    assert len(secret_reads) == 1
+
+    # Update of the row changes its payload, kept secrets are not used.
+    row = row.model_copy(
+        update={"row_token": "123456:rotated", "row_update_at": datetime.now(timezone.utc)},
+    )
+    redis.values.clear()
+    asyncio.run(scenario(replica))
+
+    assert asyncio.run(scenario(cache)).row_token == "123456:rotated"
+    assert len(secret_reads) == 2
+
+
+def test_invalidation_drops_kept_secrets(redis):
+    cache = new_secret_cache(redis)
+    row = SecretRow(row_id=uuid4(), row_name="bot", row_token="123456:secret")
+    secret_reads = []
+
+    async def loader() -> SecretRow:
+        return row
+
+    async def secrets_loader(payload: dict[str, Any]) -> RowSecrets:
+        secret_reads.append(payload["row_id"])
+        return RowSecrets(row_id=row.row_id, row_token=row.row_token)
+
+    async def scenario():
+        await cache.get_or_load("bot", loader, secrets_loader)
+        cache.apply_invalidation(row.row_id)
+        # Version is not moved, so the entry of redis is read again.
+        await cache.get_or_load("bot", loader, secrets_loader)
+
+    asyncio.run(scenario())
+
+    assert len(secret_reads) == 1
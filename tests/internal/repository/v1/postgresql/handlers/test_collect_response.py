@@ -0,0 +1,158 @@
+"""Tests of :func:`app.internal.repository.v1.postgresql.handlers.collect_response`.
+
+Models mapped from rows of a Core select by the precompiled adapter must be
+equal to the models validated from ORM entities with an adapter built on
+every call, as ``collect_response`` did before. Rows are read from SQLite,
+which has the same result processing of enum and nullable columns.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.internal.repository.v1.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.repository import EmptyResult
+from app.pkg.models.sqlalchemy_models import Delivery, EmailCorrespondent, Recipient
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    tables = [Recipient.__table__, Delivery.__table__, EmailCorrespondent.__table__]
+    Delivery.metadata.create_all(engine, tables=tables)
+
+    with Session(engine) as session:
+        recipient_id = uuid4()
+        session.execute(
+            insert(Recipient).values(recipient_id=recipient_id, recipient_address="user@example.com"),
+        )
+        session.execute(
+            insert(Delivery),
+            [
+                # Nullable columns are not set.
+                {
+                    "recipient_id": recipient_id,
+                    "delivery_provider": "smtp",
+                    "delivery_status": models.DeliveryStatusEnum.QUEUED,
+                },
+                {
+                    "recipient_id": recipient_id,
+                    "delivery_attempt_no": 2,
+                    "delivery_provider": "smtp",
+                    "delivery_status": models.DeliveryStatusEnum.BOUNCED,
+                    "delivery_provider_message_id": "<175837215463.1234.5678@yourapp.io>",
+                    "delivery_error_code": "550",
+                    "delivery_error_message": "Mailbox unavailable",
+                    "delivery_queued_at": datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc),
+                    "delivery_sent_at": datetime(2026, 10, 18, 12, 1, tzinfo=timezone.utc),
+                    "delivery_finalized_at": datetime(2026, 10, 18, 12, 2, tzinfo=timezone.utc),
+                },
+            ],
+        )
+        session.execute(
+            insert(EmailCorrespondent),
+            [
+                {
+                    "email_correspondent_name": "default",
+                    "email_host": "smtp.example.com",
+                    "email_port": 587,
+                    "email_username": "noreply@example.com",
+                    "email_password": "secret",
+                },
+                {
+                    "email_correspondent_name": "limited",
+                    "email_correspondent_is_active": False,
+                    "email_host": "smtp.example.com",
+                    "email_port": 465,
+                    "email_username": "noreply@example.com",
+                    "email_password": "secret",
+                    "email_rate_limit": 2.5,
+                    "email_rate_burst": 5,
+                    "email_correspondent_update_at": datetime(2026, 10, 18, 12, 0),
+                },
+            ],
+        )
+        yield session
+
+
+@collect_response
+async def collect_delivery(response) -> models.Delivery:
+    return response
+
+
+@collect_response
+async def collect_deliveries(response) -> list[models.Delivery]:
+    return response
+
+
+@collect_response
+async def collect_optional_delivery(response) -> models.Delivery | None:
+    return response
+
+
+@collect_response
+async def collect_email_correspondents(response) -> list[models.EmailCorrespondentResponse]:
+    return response
+
+
+def validate_entities(annotation, response):
+    """Map ORM entities the way ``collect_response`` did before precompiling."""
+
+    return TypeAdapter(annotation).validate_python(response)
+
+
+@pytest.mark.parametrize(
+    ("table", "annotation", "collect"),
+    [
+        (Delivery, list[models.Delivery], collect_deliveries),
+        (EmailCorrespondent, list[models.EmailCorrespondentResponse], collect_email_correspondents),
+    ],
+)
+def test_rows_are_mapped_as_entities(session, table, annotation, collect):
+    entities = session.execute(select(table)).scalars().all()
+    rows = session.execute(select(table.__table__)).all()
+
+    collected = asyncio.run(collect(rows))
+
+    assert collected == validate_entities(annotation, entities)
+    assert len(collected) == 2
+
+
+def test_enum_and_nullable_columns(session):
+    rows = session.execute(
+        select(Delivery.__table__).order_by(Delivery.delivery_attempt_no),
+    ).all()
+
+    queued, bounced = asyncio.run(collect_deliveries(rows))
+
+    assert queued.delivery_status == models.DeliveryStatusEnum.QUEUED.value
+    assert queued.delivery_provider_message_id is None
+    assert queued.delivery_finalized_at is None
+    assert bounced.delivery_status == models.DeliveryStatusEnum.BOUNCED.value
+    assert bounced.delivery_error_code == "550"
+
+
+def test_single_row(session):
+    entity = session.execute(select(Delivery).limit(1)).scalar_one()
+    row = session.execute(
+        select(Delivery.__table__).where(Delivery.delivery_id == entity.delivery_id),
+    ).one()
+
+    assert asyncio.run(collect_delivery(row)) == validate_entities(models.Delivery, entity)
+    assert asyncio.run(collect_optional_delivery(row)) == validate_entities(models.Delivery, entity)
+
+
+def test_empty_response():
+    assert asyncio.run(collect_deliveries([])) == []
+    assert asyncio.run(collect_optional_delivery(None)) is None
+    with pytest.raises(EmptyResult):
+        asyncio.run(collect_delivery(None))
@@ -0,0 +1,89 @@
+"""Tests of :func:`app.internal.repository.v1.postgresql.connection.after_commit`."""
+
+import asyncio
+
+import pytest
+
+from app.internal.repository.v1.postgresql import connection
+from app.internal.repository.v1.postgresql.connection import (
+    UnitOfWork,
+    after_commit,
+    unit_of_work,
+)
+
+
+@pytest.fixture(autouse=True)
+def new_unit(monkeypatch):
+    # Unit without repository calls never touches the engine.
+    monkeypatch.setattr(
+        connection,
+        "_new_unit",
+        lambda: UnitOfWork(engine=None, session_factory=None),
+    )
+
+
+def test_callback_runs_after_commit():
+    calls = []
+
+    async def invalidate():
+        calls.append("invalidate")
+
+    async def scenario():
+        async with unit_of_work():
+            await after_commit(invalidate)
+            # Nested block joins the unit, its callbacks wait for the outer one.
+            async with unit_of_work():
+                await after_commit(invalidate)
+            calls.append("block")
+        calls.append("exit")
+
+    asyncio.run(scenario())
+
+    assert calls == ["block", "invalidate", "invalidate", "exit"]
+
+
+def test_callback_is_dropped_on_rollback():
+    calls = []
+
+    async def invalidate():
+        calls.append("invalidate")
+
+    async def scenario():
+        async with unit_of_work():
+            await after_commit(invalidate)
+            raise ValueError
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+    assert calls == []
+
+
+def test_callback_runs_at_once_outside_unit():
+    calls = []
+
+    async def invalidate():
+        calls.append("invalidate")
+
+    asyncio.run(after_commit(invalidate))
+
+    assert calls == ["invalidate"]
+
+
+def test_failed_callback_does_not_fail_unit():
+    calls = []
+
+    async def fail():
+        raise ConnectionError
+
+    async def invalidate():
+        calls.append("invalidate")
+
+    async def scenario():
+        async with unit_of_work():
+            await after_commit(fail)
+            await after_commit(invalidate)
+
+    asyncio.run(scenario())
+
+    assert calls == ["invalidate"]
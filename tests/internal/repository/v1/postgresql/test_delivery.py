@@ -0,0 +1,84 @@
+"""Tests of :class:`app.internal.repository.v1.postgresql.DeliveryRepository`."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.internal.repository.v1.postgresql import DeliveryRepository
+from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import Delivery, Recipient
+
+pytestmark = pytest.mark.postgres
+
+
+async def seed_deliveries(
+    connection: AsyncConnection,
+    statuses: dict[str, models.DeliveryStatusEnum],
+) -> None:
+    recipient_id = uuid4()
+    await connection.execute(
+        insert(Recipient).values(recipient_id=recipient_id, recipient_address="user@example.com"),
+    )
+    await connection.execute(
+        insert(Delivery),
+        [
+            {
+                "recipient_id": recipient_id,
+                "delivery_provider": "smtp",
+                "delivery_status": status,
+                "delivery_provider_message_id": provider_message_id,
+            }
+            for provider_message_id, status in statuses.items()
+        ],
+    )
+
+
+async def read_statuses(connection: AsyncConnection) -> dict[str, models.DeliveryStatusEnum]:
+    rows = await connection.execute(
+        select(Delivery.delivery_provider_message_id, Delivery.delivery_status),
+    )
+    return dict(rows.all())
+
+
+def test_update_statuses_by_provider_message_id(postgresql):
+    async def scenario(connection: AsyncConnection) -> None:
+        await seed_deliveries(
+            connection,
+            {
+                "<sent@yourapp.io>": models.DeliveryStatusEnum.SENT,
+                "<opened@yourapp.io>": models.DeliveryStatusEnum.OPENED,
+                "<bounced@yourapp.io>": models.DeliveryStatusEnum.SENT,
+            },
+        )
+
+        await DeliveryRepository().update_statuses_by_provider_message_id(
+            [
+                models.DeliveryEvent(
+                    delivery_provider_message_id="<sent@yourapp.io>",
+                    delivery_status=models.DeliveryEventStatusEnum.DELIVERED,
+                ),
+                # Late event never moves the status back.
+                models.DeliveryEvent(
+                    delivery_provider_message_id="<opened@yourapp.io>",
+                    delivery_status=models.DeliveryEventStatusEnum.DELIVERED,
+                ),
+                models.DeliveryEvent(
+                    delivery_provider_message_id="<bounced@yourapp.io>",
+                    delivery_status=models.DeliveryEventStatusEnum.BOUNCED,
+                ),
+                models.DeliveryEvent(
+                    delivery_provider_message_id="<unknown@yourapp.io>",
+                    delivery_status=models.DeliveryEventStatusEnum.OPENED,
+                ),
+            ],
+        )
+
+        assert await read_statuses(connection) == {
+            "<sent@yourapp.io>": models.DeliveryStatusEnum.DELIVERED,
+            "<opened@yourapp.io>": models.DeliveryStatusEnum.OPENED,
+            "<bounced@yourapp.io>": models.DeliveryStatusEnum.BOUNCED,
+        }
+
+    postgresql(scenario)
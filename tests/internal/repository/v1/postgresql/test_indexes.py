@@ -0,0 +1,259 @@
+"""Plans of the send-path and status queries use the hot path indexes.
+
+Indexes are created by the migration ``a1c4ab142953`` and declared by
+``__table_args__`` of the models. Statements are captured from the calls of
+the repositories and explained on a seeded dataset. Sequential scans are
+disabled, so a plan falls back to them only when no index matches the query.
+"""
+
+import json
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.internal.repository.v1.postgresql import (
+    DeliveryRepository,
+    EmailCorrespondentRepository,
+    MessageRepository,
+    TelegramCorrespondentRepository,
+    TextTemplateRepository,
+)
+from app.pkg.models import v1 as models
+from app.pkg.models.sqlalchemy_models import (
+    Delivery,
+    EmailCorrespondent,
+    Message,
+    Recipient,
+    TelegramCorrespondent,
+    TextTemplate,
+)
+
+pytestmark = pytest.mark.postgres
+
+#: int: Rows of each seeded table.
+ROWS = 2000
+
+#: tuple[str, ...]: Plan nodes reading a table through an index.
+INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+
+async def seed(connection: AsyncConnection) -> dict[str, Any]:
+    """Seed tables with active and inactive rows and analyze them.
+
+    Returns:
+        Keys of the rows looked up by the queries.
+    """
+
+    recipient_id = uuid4()
+    await connection.execute(
+        insert(Recipient).values(recipient_id=recipient_id, recipient_address="user@example.com"),
+    )
+    await connection.execute(
+        insert(TextTemplate),
+        [
+            {
+                "text_template_code": f"code_{i // 4}",
+                "text_template_channel": (
+                    models.ChannelEnum.EMAIL if i % 2 else models.ChannelEnum.TELEGRAM
+                ),
+                "text_template_is_active": i % 4 < 2,
+                "text_template_content": "Code: {{code}}",
+                "text_template_variables": {"code": "string"},
+            }
+            for i in range(ROWS)
+        ],
+    )
+    await connection.execute(
+        insert(EmailCorrespondent),
+        [
+            {
+                "email_correspondent_name": f"email_{i // 2}",
+                "email_correspondent_is_active": i % 2 == 0,
+                "email_host": "smtp.example.com",
+                "email_port": 587,
+                "email_username": "noreply@example.com",
+                "email_password": "secret",
+            }
+            for i in range(ROWS)
+        ],
+    )
+    await connection.execute(
+        insert(TelegramCorrespondent),
+        [
+            {
+                "telegram_correspondent_name": f"telegram_{i // 2}",
+                "telegram_correspondent_is_active": i % 2 == 0,
+                "telegram_bot_token": "123456:secret",
+            }
+            for i in range(ROWS)
+        ],
+    )
+    message_ids = [uuid4() for _ in range(ROWS)]
+    await connection.execute(
+        insert(Message),
+        [
+            {
+                "message_id": message_id,
+                "recipient_id": recipient_id,
+                "message_body": "Code: 582341",
+                "message_status": list(models.MessageStatusEnum)[i % len(models.MessageStatusEnum)],
+                "message_channel": models.ChannelEnum.EMAIL,
+            }
+            for i, message_id in enumerate(message_ids)
+        ],
+    )
+    await connection.execute(
+        insert(Delivery),
+        [
+            {
+                "recipient_id": recipient_id,
+                "delivery_provider": "smtp",
+                "delivery_status": models.DeliveryStatusEnum.SENT,
+                # Deliveries of failed sends have no provider message ID.
+                "delivery_provider_message_id": f"<{i}@yourapp.io>" if i % 2 else None,
+            }
+            for i in range(ROWS)
+        ],
+    )
+    await connection.execute(text("ANALYZE"))
+    await connection.execute(text("SET LOCAL enable_seqscan = off"))
+
+    return {"message_ids": message_ids}
+
+
+@contextmanager
+def capture_statements(connection: AsyncConnection) -> Iterator[list[tuple[str, Any]]]:
+    """Collect SELECT and UPDATE statements executed on the connection."""
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE")):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", before_cursor_execute)
+
+
+async def index_scans(connection: AsyncConnection, statement: str, parameters: Any) -> set[str]:
+    """Explain the statement and return names of the indexes it scans."""
+
+    res = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = res.scalar_one()
+    # asyncpg has no codec of the json type, the plan is returned as text.
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    indexes = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] in INDEX_SCANS:
+            indexes.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return indexes
+
+
+async def assert_uses_index(
+    connection: AsyncConnection,
+    call: Callable[[], Awaitable[Any]],
+    index: str,
+) -> None:
+    """Run the repository call and check plans of all of its statements."""
+
+    with capture_statements(connection) as statements:
+        await call()
+
+    assert statements
+    for statement, parameters in statements:
+        assert index in await index_scans(connection, statement, parameters), statement
+
+
+@pytest.mark.parametrize(
+    ("call", "index"),
+    [
+        (
+            lambda keys: TextTemplateRepository().read_by_code(
+                models.TextTemplateReadByCodeQuery(
+                    text_template_code="code_7",
+                    text_template_channel=models.ChannelEnum.EMAIL,
+                ),
+            ),
+            "ix_text_template_code_channel_active",
+        ),
+        (
+            lambda keys: EmailCorrespondentRepository().read_by_name(
+                models.EmailCorrespondentReadByNameQuery(email_correspondent_name="email_7"),
+            ),
+            "ix_email_correspondent_name_active",
+        ),
+        (
+            lambda keys: TelegramCorrespondentRepository().read_by_name(
+                models.TelegramCorrespondentReadByNameQuery(telegram_correspondent_name="telegram_7"),
+            ),
+            "ix_telegram_correspondent_name_active",
+        ),
+        (
+            lambda keys: DeliveryRepository().update_statuses_by_provider_message_id(
+                [
+                    models.DeliveryEvent(
+                        delivery_provider_message_id=f"<{i}@yourapp.io>",
+                        delivery_status=models.DeliveryEventStatusEnum.DELIVERED,
+                    )
+                    for i in range(1, 20, 2)
+                ],
+            ),
+            "ix_delivery_provider_message_id",
+        ),
+        (
+            lambda keys: MessageRepository().message_update_statuses(
+                [
+                    models.MessageUpdateStatusCommand(
+                        message_id=message_id,
+                        message_status=models.MessageStatusEnum.SENT,
+                    )
+                    for message_id in keys["message_ids"][:10]
+                ],
+            ),
+            "message_pkey",
+        ),
+    ],
+    ids=[
+        "text_template_read_by_code",
+        "email_correspondent_read_by_name",
+        "telegram_correspondent_read_by_name",
+        "delivery_update_statuses_by_provider_message_id",
+        "message_update_statuses",
+    ],
+)
+def test_repository_query_uses_index(postgresql, call, index):
+    async def scenario(connection: AsyncConnection) -> None:
+        keys = await seed(connection)
+        await assert_uses_index(connection, lambda: call(keys), index)
+
+    postgresql(scenario)
+
+
+def test_message_status_scan_uses_index(postgresql):
+    async def scenario(connection: AsyncConnection) -> None:
+        await seed(connection)
+        stmt = (
+            select(Message.message_id)
+            .where(Message.message_status == models.MessageStatusEnum.PENDING)
+            .order_by(Message.created_at)
+            .limit(100)
+        )
+        await assert_uses_index(
+            connection,
+            lambda: connection.execute(stmt),
+            "ix_message_status_created_at",
+        )
+
+    postgresql(scenario)
@@ -0,0 +1,137 @@
+"""Tests of :class:`app.internal.services.v1.DeliveryEventBuffer`."""
+
+import asyncio
+
+import pytest
+
+from app.internal.services.v1.delivery_event_buffer import DeliveryEventBuffer
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.delivery import DeliveryEventsOverloaded
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+
+class FakeDeliveryRepository:
+    def __init__(self):
+        self.down = False
+        self.written: list[models.DeliveryEvent] = []
+
+    async def update_statuses_by_provider_message_id(self, cmds):
+        if self.down:
+            raise DriverError("connection refused")
+        self.written.extend(cmds)
+
+
+@pytest.fixture(autouse=True)
+def webhook_settings(monkeypatch):
+    monkeypatch.setattr(settings.WEBHOOK, "BUFFER_SIZE", 3)
+    monkeypatch.setattr(settings.WEBHOOK, "BATCH_SIZE", 100)
+    monkeypatch.setattr(settings.WEBHOOK, "FLUSH_MS", 60_000)
+
+
+@pytest.fixture
+def repository() -> FakeDeliveryRepository:
+    return FakeDeliveryRepository()
+
+
+def event(message_id: int, status: str = "delivered") -> models.DeliveryEvent:
+    return models.DeliveryEvent(
+        delivery_provider_message_id=f"<{message_id}@yourapp.io>",
+        delivery_status=status,
+    )
+
+
+def written(repository: FakeDeliveryRepository) -> dict[str, str]:
+    return {e.delivery_provider_message_id: e.delivery_status for e in repository.written}
+
+
+def test_furthest_event_is_written(repository):
+    async def scenario():
+        buffer = DeliveryEventBuffer(repository)
+        await buffer.add([event(1, "opened"), event(2)])
+        await buffer.add([event(1, "delivered"), event(2, "clicked")])
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+    assert written(repository) == {"<1@yourapp.io>": "opened", "<2@yourapp.io>": "clicked"}
+
+
+def test_failed_flush_keeps_events(repository):
+    async def scenario():
+        buffer = DeliveryEventBuffer(repository)
+        await buffer.add([event(1), event(2)])
+        repository.down = True
+        await buffer.flush()
+        assert repository.written == []
+
+        repository.down = False
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+    assert written(repository) == {"<1@yourapp.io>": "delivered", "<2@yourapp.io>": "delivered"}
+
+
+def test_full_buffer_is_written_by_add(repository):
+    async def scenario():
+        buffer = DeliveryEventBuffer(repository)
+        await buffer.add([event(1), event(2), event(3)])
+        await buffer.add([event(4)])
+        assert len(repository.written) == 3
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+    assert len(repository.written) == 4
+
+
+def test_full_buffer_rejects_events_when_write_fails(repository):
+    async def scenario():
+        buffer = DeliveryEventBuffer(repository)
+        await buffer.add([event(1), event(2)])
+        repository.down = True
+
+        with pytest.raises(DeliveryEventsOverloaded):
+            await buffer.add([event(3), event(4)])
+        # Events of known deliveries and events which fit are still accepted.
+        await buffer.add([event(1, "opened"), event(3)])
+        with pytest.raises(DeliveryEventsOverloaded):
+            await buffer.add([event(4)])
+
+        repository.down = False
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+    assert written(repository) == {
+        "<1@yourapp.io>": "opened",
+        "<2@yourapp.io>": "delivered",
+        "<3@yourapp.io>": "delivered",
+    }
+
+
+def test_events_added_during_failed_flush_fit_the_buffer(repository):
+    async def scenario():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_failing_write(cmds):
+            started.set()
+            await release.wait()
+            raise DriverError("connection refused")
+
+        buffer = DeliveryEventBuffer(repository)
+        await buffer.add([event(1), event(2)])
+        repository.update_statuses_by_provider_message_id = slow_failing_write
+        flush = asyncio.create_task(buffer.flush())
+        await started.wait()
+
+        # Deliveries being written are counted, only one more fits.
+        await buffer.add([event(3)])
+        add = asyncio.create_task(buffer.add([event(4)]))
+        release.set()
+        await flush
+        with pytest.raises(DeliveryEventsOverloaded):
+            await add
+
+    asyncio.run(scenario())
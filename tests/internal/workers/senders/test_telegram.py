@@ -0,0 +1,237 @@
+"""Deliveries of :class:`app.internal.workers.senders.TelegramSender` settled by
+:class:`app.internal.workers.dispatcher.ChannelDispatcherWorker` by replies of a
+fake Bot API."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq.base_repository import ATTEMPT_HEADER, BaseRepository
+from app.internal.services.v1 import TextTemplateService
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.internal.workers.senders import TelegramSender
+from app.pkg.clients.v1.bot_api_pool import BotAPIClientPool
+from app.pkg.clients.v1.telegram import TelegramClient
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+from tests.fakes import FakeBotAPI
+
+TOKEN = "123456789:AAH7f5Lr2q8x"
+
+
+class FakeIncomingMessage:
+    def __init__(self, body: bytes, attempt: int = 1):
+        self.body = body
+        self.headers = {ATTEMPT_HEADER: attempt}
+        self.settled = asyncio.Event()
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False):
+        try:
+            yield
+        finally:
+            self.settled.set()
+
+
+class FakeRabbitMQRepository(BaseRepository):
+    """Delivers one message to the Telegram lane and records its settlement."""
+
+    def __init__(self, message: FakeIncomingMessage):
+        self.message = message
+        self.retried: list[float] = []
+        self.dead: list[str] = []
+
+    async def declare_retry_queues(self, routing_key, delays, postpone_delay):
+        pass
+
+    async def consume_queue(self, routing_key, prefetch_count):
+        if routing_key != settings.RABBITMQ.TELEGRAM_KEY:
+            # Other lanes are idle until the worker is stopped.
+            await asyncio.Event().wait()
+        yield self.message
+        await self.message.settled.wait()
+
+    async def publish_retry(self, message, routing_key, attempt, delay):
+        self.retried.append(delay)
+
+    async def publish_dead(self, message, routing_key, reason):
+        self.dead.append(reason)
+
+
+class FakeTextTemplateService:
+    render_template_content = TextTemplateService.render_template_content
+
+    async def get_text_template_by_code(self, query):
+        return models.TextTemplate(
+            text_template_id=uuid4(),
+            text_template_code=query.text_template_code,
+            text_template_is_active=True,
+            text_template_content="Code: {{verification_code}}",
+            text_template_variables={"verification_code": "string"},
+            text_template_channel=query.text_template_channel,
+            text_template_create_at=datetime.now(timezone.utc),
+        )
+
+
+class FakeTelegramCorrespondentService:
+    async def get_telegram_correspondent_by_name(self, query):
+        return models.TelegramCorrespondentResponse(
+            telegram_correspondent_id=uuid4(),
+            telegram_correspondent_name=query.telegram_correspondent_name,
+            telegram_correspondent_is_active=True,
+            telegram_bot_token=TOKEN,
+            telegram_correspondent_create_at=datetime.now(timezone.utc),
+        )
+
+
+class FakeRateLimiter:
+    async def acquire(self, key, rate, burst):
+        pass
+
+
+class FakeIdempotencyGuard:
+    def __init__(self):
+        self.completed: list[str] = []
+        self.released: list[str] = []
+
+    async def claim(self, key):
+        return True
+
+    async def complete(self, key):
+        self.completed.append(key)
+
+    async def release(self, key):
+        self.released.append(key)
+
+
+class FakeStatusWriter:
+    def __init__(self):
+        self.statuses: list[models.MessageStatusEnum] = []
+
+    def record(self, message_id, status):
+        self.statuses.append(status)
+
+
+class FakeHistoryWriter:
+    def __init__(self):
+        self.deliveries: list[models.DeliveryCreateCommand] = []
+
+    async def write(self, recipient, delivery):
+        self.deliveries.append(delivery)
+
+
+def payload() -> bytes:
+    return json.dumps(
+        {
+            "event": "user.verification.requested",
+            "event_id": str(uuid4()),
+            "occurred_at": "2026-10-18T12:34:56Z",
+            "verification_id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "verification_code": "582341",
+            "channel": "TELEGRAM",
+            "telegram_chat_id": 42,
+            "message_id": str(uuid4()),
+        },
+    ).encode()
+
+
+def dispatch(api: FakeBotAPI) -> ChannelDispatcherWorker:
+    """Consume one delivery of the Telegram lane until it is settled."""
+
+    sender = TelegramSender(concurrency=1)
+    sender.telegram_correspondent_service = FakeTelegramCorrespondentService()
+    sender.rate_limiter = FakeRateLimiter()
+    sender.telegram_client = TelegramClient()
+    sender.telegram_client.bot_pool = BotAPIClientPool(
+        base_url="https://api.telegram.org",
+        timeout=10,
+        max_connections=1,
+        keepalive_expiry=60,
+        transport=api.transport,
+    )
+
+    worker = ChannelDispatcherWorker()
+    worker.rabbitmq_repository = FakeRabbitMQRepository(FakeIncomingMessage(payload()))
+    worker.text_template_service = FakeTextTemplateService()
+    worker.idempotency_guard = FakeIdempotencyGuard()
+    worker.status_writer = FakeStatusWriter()
+    worker.history_writer = FakeHistoryWriter()
+    worker.senders = [sender]
+
+    async def scenario():
+        await worker.listen_sending_message()
+        await sender.close()
+
+    asyncio.run(scenario())
+    return worker
+
+
+@pytest.fixture(autouse=True)
+def concurrent_mode(monkeypatch):
+    monkeypatch.setattr(settings.WORKER, "CONSUMER_MODE", "concurrent")
+
+
+def test_sent():
+    api = FakeBotAPI((200, {"ok": True, "result": {"message_id": 7}}))
+
+    worker = dispatch(api)
+
+    assert api.sent() == [{"chat_id": 42, "text": "Code: 582341"}]
+    assert worker.status_writer.statuses == [models.MessageStatusEnum.SENT]
+    (delivery,) = worker.history_writer.deliveries
+    assert delivery.delivery_provider_message_id == "7"
+    assert worker.idempotency_guard.completed
+    assert not worker.rabbitmq_repository.retried
+    assert not worker.rabbitmq_repository.dead
+
+
+def test_retry_after_delays_retry():
+    api = FakeBotAPI(
+        (
+            429,
+            {
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests: retry after 4",
+                "parameters": {"retry_after": 4},
+            },
+        ),
+    )
+
+    worker = dispatch(api)
+
+    # Delay of the first retry is at most RETRY__BASE_DELAY of 5 seconds.
+    (delay,) = worker.rabbitmq_repository.retried
+    assert 4 <= delay <= settings.RETRY.BASE_DELAY
+    assert not worker.rabbitmq_repository.dead
+    assert worker.idempotency_guard.released
+    assert worker.status_writer.statuses == []
+
+
+@pytest.mark.parametrize(
+    ("status_code", "description"),
+    [
+        (400, "Bad Request: chat not found"),
+        (403, "Forbidden: bot was blocked by the user"),
+    ],
+)
+def test_chat_unavailable_is_dead(status_code, description):
+    api = FakeBotAPI(
+        (status_code, {"ok": False, "error_code": status_code, "description": description}),
+    )
+
+    worker = dispatch(api)
+
+    # Permanent error is not retried, though attempts are left.
+    assert len(api.requests) == 1
+    assert not worker.rabbitmq_repository.retried
+    (reason,) = worker.rabbitmq_repository.dead
+    assert "TelegramChatUnavailable" in reason
+    assert worker.status_writer.statuses == [models.MessageStatusEnum.FAILED]
+    (delivery,) = worker.history_writer.deliveries
+    assert delivery.delivery_status == models.DeliveryStatusEnum.FAILED.value
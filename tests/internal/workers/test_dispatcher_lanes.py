@@ -0,0 +1,100 @@
+"""High-priority publishes of every channel reach a lane consumed by
+:class:`app.internal.workers.dispatcher.ChannelDispatcherWorker`."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq import base_repository
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.pkg.settings import settings
+
+
+class FakeRabbitMQRepository(BaseRepository):
+    def __init__(self):
+        self.declared: list[str] = []
+        self.consumed: list[str] = []
+
+    async def declare_retry_queues(self, routing_key, delays, postpone_delay):
+        self.declared.append(routing_key)
+
+    async def consume_queue(self, routing_key, prefetch_count):
+        self.consumed.append(routing_key)
+        # Wait until every lane is started, then stop the worker.
+        await asyncio.sleep(0)
+        return
+        yield
+
+
+class FakeExchange:
+    def __init__(self):
+        self.routing_keys: list[str] = []
+
+    async def publish(self, message, routing_key):
+        self.routing_keys.append(routing_key)
+
+
+class FakeChannel:
+    def __init__(self):
+        self.default_exchange = FakeExchange()
+
+
+class Notification:
+    def to_dict(self):
+        return {"event": "user.verification.requested"}
+
+
+@pytest.fixture
+def channel(monkeypatch) -> FakeChannel:
+    channel = FakeChannel()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield channel
+
+    monkeypatch.setattr(base_repository, "get_connection", get_connection)
+    return channel
+
+
+@pytest.fixture
+def consumed_lanes(monkeypatch) -> list[str]:
+    monkeypatch.setattr(settings.WORKER, "CONSUMER_MODE", "concurrent")
+    repository = FakeRabbitMQRepository()
+    worker = ChannelDispatcherWorker()
+    worker.rabbitmq_repository = repository
+    worker.senders = []
+
+    asyncio.run(worker.listen_sending_message())
+
+    assert sorted(repository.declared) == sorted(repository.consumed)
+    return repository.consumed
+
+
+@pytest.mark.parametrize(
+    "routing_key",
+    [settings.RABBITMQ.NOTIFICATION_KEY, settings.RABBITMQ.TELEGRAM_KEY],
+    ids=["email", "telegram"],
+)
+def test_high_priority_publish_is_consumed(channel, consumed_lanes, routing_key):
+    asyncio.run(
+        BaseRepository.create(
+            Notification(),
+            routing_key=routing_key,
+            priority=settings.RABBITMQ.HIGH_PRIORITY,
+        ),
+    )
+    asyncio.run(BaseRepository.create(Notification(), routing_key=routing_key))
+
+    priority_lane, bulk_lane = channel.default_exchange.routing_keys
+    assert priority_lane == BaseRepository.priority_queue_name(routing_key)
+    assert bulk_lane == routing_key
+    assert {priority_lane, bulk_lane} <= set(consumed_lanes)
+
+
+def test_key_without_lane_is_not_rewritten():
+    assert BaseRepository.lane_routing_key(
+        "audit_log",
+        priority=settings.RABBITMQ.MAX_PRIORITY,
+    ) == "audit_log"
@@ -0,0 +1,152 @@
+"""Tests of :class:`app.internal.workers.history_writer.DeliveryHistoryWriter`."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.internal.workers.history_writer import DeliveryHistoryWriter
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+
+class FakeCopyRepository:
+    """Records batches written with ``create_many`` to the shared ``log``."""
+
+    def __init__(self, table: str, log: list[tuple[str, int]]):
+        self.table = table
+        self.log = log
+        #: int: Count of next calls failing.
+        self.failures = 0
+        #: asyncio.Event | None: Set to hold writes until the event is set.
+        self.gate: asyncio.Event | None = None
+
+    async def create_many(self, cmds):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise DriverError("connection refused")
+        self.log.append((self.table, len(cmds)))
+
+
+@pytest.fixture(autouse=True)
+def history_settings(monkeypatch):
+    monkeypatch.setattr(settings.WORKER, "HISTORY_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings.WORKER, "HISTORY_FLUSH_MS", 20)
+    monkeypatch.setattr(settings.WORKER, "HISTORY_BUFFER_SIZE", 4)
+    monkeypatch.setattr(settings.WORKER, "HISTORY_FLUSH_ATTEMPTS", 2)
+
+
+@pytest.fixture
+def log() -> list[tuple[str, int]]:
+    return []
+
+
+@pytest.fixture
+def recipients(log) -> FakeCopyRepository:
+    return FakeCopyRepository("recipient", log)
+
+
+@pytest.fixture
+def deliveries(log) -> FakeCopyRepository:
+    return FakeCopyRepository("delivery", log)
+
+
+def attempt() -> tuple[models.RecipientCreateCommand, models.DeliveryCreateCommand]:
+    recipient_id = uuid4()
+    return (
+        models.RecipientCreateCommand(
+            recipient_id=recipient_id,
+            recipient_user_id=uuid4(),
+            recipient_address="user@example.com",
+        ),
+        models.DeliveryCreateCommand(
+            recipient_id=recipient_id,
+            delivery_attempt_no=1,
+            delivery_provider="smtp",
+            delivery_status=models.DeliveryStatusEnum.SENT,
+        ),
+    )
+
+
+def test_batches_by_size(log, recipients, deliveries):
+    async def scenario():
+        writer = DeliveryHistoryWriter(recipients, deliveries)
+        for _ in range(3):
+            await writer.write(*attempt())
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    # Recipients of each batch are written before their deliveries.
+    assert log == [("recipient", 2), ("delivery", 2), ("recipient", 1), ("delivery", 1)]
+
+
+def test_batch_by_wait(log, recipients, deliveries):
+    async def scenario():
+        writer = DeliveryHistoryWriter(recipients, deliveries)
+        await writer.write(*attempt())
+        await asyncio.sleep(0.1)
+        assert log == [("recipient", 1), ("delivery", 1)]
+        await writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_failed_batch_is_retried(log, recipients, deliveries):
+    deliveries.failures = 1
+
+    async def scenario():
+        writer = DeliveryHistoryWriter(recipients, deliveries)
+        await writer.write(*attempt())
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    # Recipients are skipped if they exist, so the whole batch is written again.
+    assert log == [("recipient", 1), ("recipient", 1), ("delivery", 1)]
+
+
+def test_batch_is_dropped_after_attempts(log, recipients, deliveries):
+    recipients.failures = settings.WORKER.HISTORY_FLUSH_ATTEMPTS
+
+    async def scenario():
+        writer = DeliveryHistoryWriter(recipients, deliveries)
+        await writer.write(*attempt())
+        await writer.close()
+        await writer.write(*attempt())
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    # The next batch is written by a new background task.
+    assert log == [("recipient", 1), ("delivery", 1)]
+
+
+def test_full_buffer_blocks_write(log, recipients, deliveries):
+    recipients.gate = asyncio.Event()
+
+    async def scenario():
+        writer = DeliveryHistoryWriter(recipients, deliveries)
+        # One batch is being written, the buffer holds the rest.
+        for _ in range(settings.WORKER.HISTORY_BATCH_SIZE + settings.WORKER.HISTORY_BUFFER_SIZE):
+            await asyncio.wait_for(writer.write(*attempt()), 1)
+        await asyncio.sleep(0.05)
+
+        blocked = asyncio.create_task(writer.write(*attempt()))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        recipients.gate.set()
+        await asyncio.wait_for(blocked, 1)
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    assert sum(count for table, count in log if table == "delivery") == 7
+
+
+def test_close_without_writes(recipients, deliveries):
+    asyncio.run(DeliveryHistoryWriter(recipients, deliveries).close())
@@ -0,0 +1,97 @@
+"""Tests of :class:`app.internal.workers.idempotency.IdempotencyGuard`."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.internal.workers.idempotency import DONE, IN_PROGRESS, EventInProgress, IdempotencyGuard
+from app.pkg.settings import settings
+from tests.fakes import FakeRedisRepository
+
+
+class ExpiringRedisRepository(FakeRedisRepository):
+    """Claim of another consumer expires between ``SET NX`` and ``GET``."""
+
+    def __init__(self):
+        super().__init__()
+        self.expired = False
+
+    async def read_value(self, redis_key):
+        if not self.expired:
+            self.expired = True
+            await self.delete(redis_key)
+        return await super().read_value(redis_key)
+
+
+@pytest.fixture
+def redis() -> FakeRedisRepository:
+    return FakeRedisRepository()
+
+
+def key(event_id) -> str:
+    return f"{settings.IDEMPOTENCY.REDIS_PREFIX}:{event_id}"
+
+
+def test_claim_sets_in_progress(redis):
+    event_id = uuid4()
+
+    assert asyncio.run(IdempotencyGuard(redis).claim(event_id)) is True
+
+    assert redis.values[key(event_id)] == IN_PROGRESS
+    assert redis.expire_times[key(event_id)] == settings.IDEMPOTENCY.IN_PROGRESS_TTL
+
+
+def test_claim_of_claimed_event_raises(redis):
+    event_id = uuid4()
+    asyncio.run(IdempotencyGuard(redis).claim(event_id))
+
+    with pytest.raises(EventInProgress):
+        asyncio.run(IdempotencyGuard(redis).claim(event_id))
+
+
+def test_completed_event_is_skipped(redis):
+    guard, event_id = IdempotencyGuard(redis), uuid4()
+
+    async def scenario():
+        await guard.claim(event_id)
+        await guard.complete(event_id)
+        return await guard.claim(event_id)
+
+    assert asyncio.run(scenario()) is False
+    assert redis.values[key(event_id)] == DONE
+    assert redis.expire_times[key(event_id)] == settings.IDEMPOTENCY.DONE_TTL
+
+
+def test_released_event_is_claimed_again(redis):
+    guard, event_id = IdempotencyGuard(redis), uuid4()
+
+    async def scenario():
+        await guard.claim(event_id)
+        # Processing failed, the retry must not be skipped.
+        await guard.release(event_id)
+        return await guard.claim(event_id)
+
+    assert asyncio.run(scenario()) is True
+    assert redis.values[key(event_id)] == IN_PROGRESS
+
+
+def test_expired_claim_is_claimed_again():
+    redis, event_id = ExpiringRedisRepository(), uuid4()
+    redis.values[key(event_id)] = IN_PROGRESS
+
+    assert asyncio.run(IdempotencyGuard(redis).claim(event_id)) is True
+    assert redis.values[key(event_id)] == IN_PROGRESS
+
+
+def test_redis_errors_process_event(redis):
+    guard, event_id = IdempotencyGuard(redis), uuid4()
+    redis.down = True
+
+    async def scenario():
+        claimed = await guard.claim(event_id)
+        await guard.complete(event_id)
+        await guard.release(event_id)
+        return claimed
+
+    assert asyncio.run(scenario()) is True
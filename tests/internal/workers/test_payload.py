@@ -0,0 +1,74 @@
+"""Tests of :class:`app.internal.workers.payload.PayloadDecoder`."""
+
+import json
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.internal.workers.payload import SCHEMA_HEADER, PayloadDecoder
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+_SCHEMA = "message_notification.v1"
+
+
+@pytest.fixture
+def decoder(monkeypatch) -> PayloadDecoder[models.MessageNotification]:
+    monkeypatch.setattr(settings.WORKER, "TRUST_SCHEMA_HEADER", True)
+    return PayloadDecoder(models.MessageNotification, schemas={_SCHEMA})
+
+
+def payload(**fields) -> bytes:
+    return json.dumps(
+        {
+            "event": "user.verification.requested",
+            "event_id": str(uuid4()),
+            "occurred_at": "2026-10-18T12:34:56Z",
+            "verification_id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "verification_code": "582341",
+            "channel": "EMAIL",
+            "email": "user@example.com",
+            **fields,
+        },
+    ).encode()
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {},
+        {"channel": "TELEGRAM", "email": None, "telegram_chat_id": 42},
+        {"channel": None, "message_id": str(uuid4())},
+        {"event": "  user.verification.requested  "},
+    ],
+)
+def test_trusted_and_validated_paths_are_equal(decoder, fields):
+    body = payload(**fields)
+
+    trusted = decoder.decode(body, headers={SCHEMA_HEADER: _SCHEMA})
+    validated = decoder.decode(body)
+
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert type(trusted.channel) is type(validated.channel)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"verification_code": "58"},
+        {"channel": "SMS"},
+        {"event_id": "not-a-uuid"},
+        {"occurred_at": None},
+    ],
+)
+def test_trusted_path_rejects_invalid_payload(decoder, fields):
+    with pytest.raises(ValidationError):
+        decoder.decode(payload(**fields), headers={SCHEMA_HEADER: _SCHEMA})
+
+
+def test_untrusted_schema_is_validated(decoder):
+    with pytest.raises(ValidationError):
+        decoder.decode(payload(email="not-an-email"), headers={SCHEMA_HEADER: "other.v1"})
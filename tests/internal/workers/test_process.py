@@ -0,0 +1,108 @@
+"""Shutdown of a worker process run by :func:`app.internal.workers.process.serve`."""
+
+import asyncio
+import signal
+
+import pytest
+
+from app.internal.pkg.cache import LookupCache
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.workers import process
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+
+class FakeRabbitMQRepository(BaseRepository):
+    """Delivers ``messages`` to the bulk lane of notifications, then the lane
+    is idle, or stops if ``stop`` is set."""
+
+    def __init__(self, *messages: str, stop: bool = False):
+        self.messages = messages
+        self.stop = stop
+
+    async def declare_retry_queues(self, routing_key, delays, postpone_delay):
+        pass
+
+    async def consume_queue(self, routing_key, prefetch_count):
+        if routing_key == settings.RABBITMQ.NOTIFICATION_KEY:
+            for message in self.messages:
+                yield message
+            if self.stop:
+                return
+        await asyncio.Event().wait()
+
+
+class FakeClosable:
+    def __init__(self, events: list[str], name: str):
+        self.events = events
+        self.name = name
+
+    async def close(self):
+        self.events.append(f"{self.name} closed")
+
+
+class FakeSender(FakeClosable):
+    channel = models.ChannelEnum.EMAIL
+    concurrency = 1
+
+
+@pytest.fixture
+def events(monkeypatch) -> list[str]:
+    events = []
+
+    async def close_pools():
+        events.append("pools closed")
+
+    async def listen_invalidations():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(settings.WORKER, "CONSUMER_MODE", "concurrent")
+    monkeypatch.setattr(settings.WORKER, "DRAIN_TIMEOUT", 1)
+    monkeypatch.setattr(process, "close_pools", close_pools)
+    monkeypatch.setattr(LookupCache, "listen_invalidations", listen_invalidations)
+    return events
+
+
+def worker(events: list[str], repository: FakeRabbitMQRepository) -> ChannelDispatcherWorker:
+    async def handle_delivery(message, routing_key=None):
+        await asyncio.sleep(0.05)
+        events.append(f"{message} sent")
+
+    worker = ChannelDispatcherWorker()
+    worker.rabbitmq_repository = repository
+    worker.status_writer = FakeClosable(events, "status writer")
+    worker.history_writer = FakeClosable(events, "history writer")
+    worker.senders = [FakeSender(events, "sender")]
+    worker.handle_delivery = handle_delivery
+    return worker
+
+
+def test_sigterm_drains_in_flight_messages(events):
+    dispatcher = worker(events, FakeRabbitMQRepository("a"))
+
+    async def scenario():
+        asyncio.get_running_loop().call_later(0.01, signal.raise_signal, signal.SIGTERM)
+        await process.serve(dispatcher_worker=dispatcher)
+
+    asyncio.run(scenario())
+
+    # Message taken before the signal is sent before anything is closed.
+    assert events == [
+        "a sent",
+        "status writer closed",
+        "history writer closed",
+        "sender closed",
+        "pools closed",
+    ]
+
+
+def test_stopped_consumer_exits_process(events):
+    dispatcher = worker(events, FakeRabbitMQRepository("a", stop=True))
+
+    with pytest.raises(SystemExit) as exc_info:
+        asyncio.run(process.serve(dispatcher_worker=dispatcher))
+
+    assert exc_info.value.code == 1
+    assert events[0] == "a sent"
+    assert events[-1] == "pools closed"
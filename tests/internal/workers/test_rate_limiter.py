@@ -0,0 +1,103 @@
+"""Tests of :class:`app.internal.workers.rate_limiter.RateLimiter`.
+
+Lua is not run by the fake Redis: ``_RESERVE_SCRIPT`` is mirrored by
+:class:`GCRARedisRepository` on a clock moved by the waits of the limiter.
+"""
+
+import asyncio
+import math
+
+import pytest
+from redis import RedisError
+
+from app.internal.workers import rate_limiter
+from app.internal.workers.rate_limiter import RateLimiter
+from app.pkg.settings import settings
+from tests.fakes import FakeRedisRepository
+
+
+class GCRARedisRepository(FakeRedisRepository):
+    """Runs the reserve script of the limiter on a fake clock in ms."""
+
+    def __init__(self):
+        super().__init__()
+        self.now = 1_000_000.0
+        self.calls: list[tuple[list[str], list]] = []
+
+    async def run_script(self, script, keys, args):
+        assert script == rate_limiter._RESERVE_SCRIPT
+        self.calls.append((keys, args))
+        if self.down:
+            raise RedisError("Connection refused.")
+
+        interval, burst = float(args[0]), int(args[1])
+        tolerance = interval * (burst - 1)
+        tat = max(float(self.values.get(keys[0], self.now)), self.now)
+        wait = max(tat - tolerance - self.now, 0)
+        next_tat = tat + interval
+        self.values[keys[0]] = str(next_tat)
+        self.expire_times[keys[0]] = math.ceil(next_tat - self.now + interval)
+        return str(wait)
+
+
+@pytest.fixture
+def redis(monkeypatch) -> GCRARedisRepository:
+    redis = GCRARedisRepository()
+
+    async def sleep(seconds: float):
+        redis.now += seconds * 1000
+
+    # Waits of the limiter move the clock instead of sleeping.
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return redis
+
+
+def acquire_many(limiter: RateLimiter, count: int, **kwargs) -> list[float]:
+    async def scenario():
+        return [await limiter.acquire(**kwargs) for _ in range(count)]
+
+    return asyncio.run(scenario())
+
+
+def test_burst_then_rate(redis):
+    limiter = RateLimiter(redis)
+
+    waits = acquire_many(limiter, 6, key="smtp:support", rate=10, burst=3)
+
+    # Burst is sent at once, then one send per 100 ms.
+    assert waits == [0, 0, 0, 0.1, 0.1, 0.1]
+    keys, args = redis.calls[0]
+    assert keys == [f"{settings.RATE_LIMIT.REDIS_PREFIX}:smtp:support"]
+    assert args == [100, 3]
+
+
+def test_bucket_is_refilled(redis):
+    limiter = RateLimiter(redis)
+    acquire_many(limiter, 4, key="smtp:support", rate=10, burst=3)
+
+    redis.now += 1000
+
+    assert acquire_many(limiter, 3, key="smtp:support", rate=10, burst=3) == [0, 0, 0]
+
+
+def test_buckets_are_separate(redis):
+    limiter = RateLimiter(redis)
+    acquire_many(limiter, 3, key="smtp:support", rate=10, burst=3)
+
+    assert acquire_many(limiter, 3, key="smtp:billing", rate=10, burst=3) == [0, 0, 0]
+
+
+def test_defaults_of_settings(redis):
+    asyncio.run(RateLimiter(redis).acquire("smtp:support"))
+
+    _, args = redis.calls[0]
+    assert args == [
+        1000 / settings.RATE_LIMIT.DEFAULT_RATE,
+        settings.RATE_LIMIT.DEFAULT_BURST,
+    ]
+
+
+def test_redis_errors_do_not_limit(redis):
+    redis.down = True
+
+    assert acquire_many(RateLimiter(redis), 5, key="smtp:support", rate=1, burst=1) == [0] * 5
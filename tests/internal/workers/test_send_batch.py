@@ -0,0 +1,171 @@
+"""Tests of :class:`app.internal.workers.send_batch.SendBatch` and batches of
+the ``batch`` consumer mode of
+:class:`app.internal.workers.dispatcher.ChannelDispatcherWorker`."""
+
+import asyncio
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.workers.dispatcher import ChannelDispatcherWorker
+from app.internal.workers.send_batch import SendBatch, current_batch
+from app.pkg.settings import settings
+
+
+class SendError(Exception):
+    pass
+
+
+class FakeSender:
+    """Sends groups of items, failing the items listed in ``failed``."""
+
+    def __init__(self, failed=()):
+        self.failed = set(failed)
+        self.groups: list[list[str]] = []
+
+    async def send_group(self, items: list[str]) -> list[Exception | None]:
+        self.groups.append(items)
+        return [SendError(item) if item in self.failed else None for item in items]
+
+
+async def deliver(batch: SendBatch, group: str, item: str | None, sender: FakeSender) -> str:
+    """Submit the item, or leave the batch without a send if it is None."""
+
+    try:
+        if item is None:
+            return "left"
+        await batch.submit(group=group, item=item, send_group=sender.send_group)
+        return "sent"
+    except SendError:
+        return "failed"
+    finally:
+        batch.leave()
+
+
+def test_groups_are_flushed_after_the_last_task():
+    support, billing = FakeSender(), FakeSender()
+    batch = SendBatch(size=4)
+
+    async def scenario():
+        return await asyncio.gather(
+            deliver(batch, "support", "a", support),
+            deliver(batch, "billing", "b", billing),
+            deliver(batch, "support", "c", support),
+            deliver(batch, "support", None, support),
+        )
+
+    assert asyncio.run(scenario()) == ["sent", "sent", "sent", "left"]
+    assert support.groups == [["a", "c"]]
+    assert billing.groups == [["b"]]
+
+
+def test_errors_are_raised_by_their_tasks():
+    sender = FakeSender(failed={"b"})
+    batch = SendBatch(size=3)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(deliver(batch, "support", item, sender) for item in ("a", "b", "c")),
+        )
+
+    assert asyncio.run(scenario()) == ["sent", "failed", "sent"]
+
+
+def test_failed_group_fails_its_tasks_only():
+    support, billing = FakeSender(), FakeSender()
+    batch = SendBatch(size=2)
+
+    async def broken_send_group(items):
+        raise SendError("Connection lost.")
+
+    async def scenario():
+        async def deliver_broken():
+            try:
+                await batch.submit(group="support", item="a", send_group=broken_send_group)
+            except SendError:
+                return "failed"
+            return "sent"
+
+        return await asyncio.gather(deliver_broken(), deliver(batch, "billing", "b", billing))
+
+    assert asyncio.run(scenario()) == ["failed", "sent"]
+    assert billing.groups == [["b"]]
+
+
+class FakeRabbitMQRepository(BaseRepository):
+    """Delivers messages to the bulk lane of notifications, sleeping for the
+    seconds passed between them."""
+
+    def __init__(self, *deliveries: str | float):
+        self.deliveries = deliveries
+
+    async def declare_retry_queues(self, routing_key, delays, postpone_delay):
+        pass
+
+    async def consume_queue(self, routing_key, prefetch_count):
+        if routing_key != settings.RABBITMQ.NOTIFICATION_KEY:
+            # Other lanes are idle until the worker is stopped.
+            await asyncio.Event().wait()
+        for delivery in self.deliveries:
+            if isinstance(delivery, float):
+                await asyncio.sleep(delivery)
+            else:
+                yield delivery
+
+
+def consume_batches(monkeypatch, *deliveries: str | float) -> list[list[str]]:
+    """Consume deliveries in ``batch`` mode and return them by batch."""
+
+    monkeypatch.setattr(settings.WORKER, "CONSUMER_MODE", "batch")
+    monkeypatch.setattr(settings.WORKER, "BATCH_SIZE", 2)
+    monkeypatch.setattr(settings.WORKER, "BATCH_WAIT_MS", 20)
+
+    batches: dict[SendBatch, list[str]] = {}
+
+    async def handle_delivery(message, routing_key=None):
+        batches.setdefault(current_batch.get(), []).append(message)
+
+    worker = ChannelDispatcherWorker()
+    worker.rabbitmq_repository = FakeRabbitMQRepository(*deliveries)
+    worker.senders = []
+    worker.handle_delivery = handle_delivery
+
+    async def scenario():
+        await worker.listen_sending_message()
+        # Deliveries of the last batch are started after the lane is stopped.
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    return list(batches.values())
+
+
+def test_batch_is_closed_by_size(monkeypatch):
+    assert consume_batches(monkeypatch, "a", "b", "c", "d", "e") == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_batch_is_closed_by_wait(monkeypatch):
+    batches = consume_batches(monkeypatch, "a", 0.1, "b", "c")
+
+    assert batches == [["a"], ["b", "c"]]
+
+
+@pytest.mark.parametrize("mode", ["concurrent", "sequential"])
+def test_other_modes_do_not_batch(monkeypatch, mode):
+    monkeypatch.setattr(settings.WORKER, "CONSUMER_MODE", mode)
+    seen = []
+
+    async def handle_delivery(message, routing_key=None):
+        seen.append((message, current_batch.get()))
+
+    worker = ChannelDispatcherWorker()
+    worker.rabbitmq_repository = FakeRabbitMQRepository("a", "b")
+    worker.senders = []
+    worker.handle_delivery = handle_delivery
+
+    async def scenario():
+        await worker.listen_sending_message()
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert seen == [("a", None), ("b", None)]
@@ -0,0 +1,140 @@
+"""Tests of :class:`app.internal.workers.status_writer.MessageStatusWriter`."""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.internal.workers.status_writer import MessageStatusWriter
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.repository import DriverError
+from app.pkg.settings import settings
+
+SENT = models.MessageStatusEnum.SENT
+FAILED = models.MessageStatusEnum.FAILED
+
+
+class FakeMessageRepository:
+    def __init__(self):
+        self.down = False
+        #: asyncio.Event | None: Set to hold statements until the event is set.
+        self.gate: asyncio.Event | None = None
+        self.statements: list[dict[UUID, str]] = []
+
+    async def message_update_statuses(self, cmds):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.down:
+            raise DriverError("connection refused")
+        self.statements.append({cmd.message_id: cmd.message_status for cmd in cmds})
+
+
+@pytest.fixture(autouse=True)
+def status_settings(monkeypatch):
+    monkeypatch.setattr(settings.WORKER, "STATUS_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings.WORKER, "STATUS_FLUSH_MS", 20)
+
+
+@pytest.fixture
+def repository() -> FakeMessageRepository:
+    return FakeMessageRepository()
+
+
+def test_flush_by_size(repository):
+    ids = [uuid4() for _ in range(3)]
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        for message_id in ids:
+            writer.record(message_id, SENT)
+        # Full buffer is written at once, before the timer.
+        await asyncio.sleep(0)
+        return list(repository.statements)
+
+    assert asyncio.run(scenario()) == [dict.fromkeys(ids, SENT.value)]
+
+
+def test_flush_by_timer(repository):
+    message_id = uuid4()
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        writer.record(message_id, SENT)
+        await asyncio.sleep(0)
+        assert not repository.statements
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+
+    assert repository.statements == [{message_id: SENT.value}]
+
+
+def test_last_transition_is_written(repository):
+    message_id = uuid4()
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        writer.record(message_id, SENT)
+        writer.record(message_id, FAILED)
+        await writer.flush()
+
+    asyncio.run(scenario())
+
+    assert repository.statements == [{message_id: FAILED.value}]
+
+
+def test_failed_flush_is_restored(repository):
+    first, second = uuid4(), uuid4()
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        writer.record(first, SENT)
+        writer.record(second, SENT)
+
+        repository.down, repository.gate = True, asyncio.Event()
+        flush = asyncio.create_task(writer.flush())
+        await asyncio.sleep(0)
+        # Transition buffered while the failing flush runs is newer.
+        writer.record(second, FAILED)
+        repository.gate.set()
+        await flush
+        assert not repository.statements
+
+        repository.down = False
+        await writer.flush()
+
+    asyncio.run(scenario())
+
+    assert repository.statements == [{first: SENT.value, second: FAILED.value}]
+
+
+def test_close_writes_buffer(repository):
+    ids = [uuid4() for _ in range(4)]
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        for message_id in ids:
+            writer.record(message_id, SENT)
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    assert {
+        message_id: status
+        for statement in repository.statements
+        for message_id, status in statement.items()
+    } == dict.fromkeys(ids, SENT.value)
+
+
+def test_close_with_database_down(repository):
+    repository.down = True
+
+    async def scenario():
+        writer = MessageStatusWriter(repository)
+        writer.record(uuid4(), SENT)
+        # Statuses are lost, but the shutdown is not blocked.
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    assert not repository.statements
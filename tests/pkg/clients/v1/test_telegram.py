@@ -0,0 +1,96 @@
+"""Tests of :class:`app.pkg.clients.v1.telegram.TelegramClient` against a fake
+Bot API."""
+
+import asyncio
+
+import pytest
+
+from app.pkg.clients.v1.bot_api_pool import BotAPIClientPool
+from app.pkg.clients.v1.telegram import TelegramClient
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.telegram import (
+    TelegramChatUnavailable,
+    TelegramRetryAfter,
+    TelegramSendError,
+)
+from tests.fakes import FakeBotAPI
+
+TOKEN = "123456789:AAH7f5Lr2q8x"
+
+
+def send(api: FakeBotAPI, chat_id: int = 42) -> str:
+    client = TelegramClient()
+    client.bot_pool = BotAPIClientPool(
+        base_url="https://api.telegram.org",
+        timeout=10,
+        max_connections=1,
+        keepalive_expiry=60,
+        transport=api.transport,
+    )
+
+    async def scenario() -> str:
+        try:
+            return await client.message_send_telegram(
+                models.TelegramSendCommand(
+                    telegram_bot_token=TOKEN,
+                    telegram_chat_id=chat_id,
+                    text_template_content="Code: 582341",
+                ),
+            )
+        finally:
+            await client.bot_pool.close()
+
+    return asyncio.run(scenario())
+
+
+def test_success():
+    api = FakeBotAPI((200, {"ok": True, "result": {"message_id": 7}}))
+
+    assert send(api) == "7"
+    (request,) = api.requests
+    assert request.url == f"https://api.telegram.org/bot{TOKEN}/sendMessage"
+    assert api.sent() == [{"chat_id": 42, "text": "Code: 582341"}]
+
+
+def test_retry_after():
+    api = FakeBotAPI(
+        (
+            429,
+            {
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests: retry after 4",
+                "parameters": {"retry_after": 4},
+            },
+        ),
+    )
+
+    with pytest.raises(TelegramRetryAfter) as exc_info:
+        send(api)
+
+    assert exc_info.value.retry_after == 4.0
+
+
+@pytest.mark.parametrize(
+    ("status_code", "description"),
+    [
+        (400, "Bad Request: chat not found"),
+        (403, "Forbidden: bot was blocked by the user"),
+    ],
+)
+def test_chat_unavailable(status_code, description):
+    api = FakeBotAPI(
+        (status_code, {"ok": False, "error_code": status_code, "description": description}),
+    )
+
+    with pytest.raises(TelegramChatUnavailable, match=description):
+        send(api)
+
+
+def test_server_error():
+    api = FakeBotAPI((502, {"ok": False, "error_code": 502, "description": "Bad Gateway"}))
+
+    with pytest.raises(TelegramSendError) as exc_info:
+        send(api)
+
+    assert not isinstance(exc_info.value, (TelegramRetryAfter, TelegramChatUnavailable))